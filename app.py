@@ -1,20 +1,38 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, Response, stream_with_context
 from flask_cors import CORS
 import speech_recognition as sr
 import os
 from datetime import datetime
 import requests
+import hashlib
 import json
+import queue
+import threading
+import time
 import base64
-import PyPDF2
-from process_video import analyze_video_confidence
+from process_video import VideoAnalysisExecutor, gemini_limiter, question_sort_key, video_cache
 import re
 from typing import List, Dict
 import pandas as pd
-from scrap_website import scrape_skkk_data
+from scrap_website import scrape_skkk_cached, skkk_cache_stats
+from course_parser import parse_courses
+from candidate_index import CandidateIndex
+from candidate_query import CandidateQuery, to_list_item
+from candidate_stream import CandidateBroadcaster, format_sse
+from dashboard_cache import DashboardCache
+from http_compression import ResponseCompressor
+from job_queue import JobQueue
+from session_store import NS_ANALYSIS, NS_CANDIDATE, NS_JOBS, NS_TRANSCRIPTS, NS_VIDEOS, create_session_store
+from pdf_backends import PDF_BACKEND, extract_pdf_pages
+from pdf_cache import (cached_pdf_text, get_cached_transcript, set_cached_transcript,
+                       pdf_text_cache, transcript_cache)
+from result_cache import sha256_file
 
 app = Flask(__name__)
-CORS(app)
+# ETag dan info cache perlu bisa dibaca review.html walau dibuka dari origin lain
+CORS(app, expose_headers=["ETag", "X-Cache", "X-Cache-Age"])
+# gzip/brotli untuk response JSON (list kandidat, detail kandidat, status)
+response_compressor = ResponseCompressor(app)
 
 OUTPUT_DIR = "recordings"
 VIDEO_OUTPUT_DIR = "video_recordings"
@@ -28,27 +46,118 @@ os.makedirs(TRANSKRIP_DIR, exist_ok=True)
 WEBHOOK_URL = "https://n8n-1.saturn.petra.ac.id/webhook-test/939b69b4-4d28-4531-b451-804809c2399c"
 DASHBOARD_DATA_URL = "https://n8n-1.saturn.petra.ac.id/webhook/d14704c6-0264-43d4-a978-e17cccf06e45"
 
-# Menyimpan semua hasil transkripsi dan data kandidat
-all_transcripts = {}
-candidate_info = {}
-session_videos = {}
+# Jumlah worker untuk job finalisasi interview (analisis video + webhook)
+FINALIZE_WORKERS = int(os.getenv("FINALIZE_WORKERS", "2"))
+
+# Worker scraping SKKK di latar belakang dan batas waktu tunggu saat finalisasi (detik)
+SKKK_WORKERS = int(os.getenv("SKKK_WORKERS", "4"))
+SKKK_FINALIZE_WAIT = float(os.getenv("SKKK_FINALIZE_WAIT", "30"))
+
+# Cache data dashboard dari n8n (detik): segar selama TTL, lalu data lama masih
+# dipakai selama MAX_STALE sambil di-refresh di latar belakang
+DASHBOARD_CACHE_TTL = float(os.getenv("DASHBOARD_CACHE_TTL", "15"))
+DASHBOARD_CACHE_MAX_STALE = float(os.getenv("DASHBOARD_CACHE_MAX_STALE", "300"))
+
+# Parameter yang membuat /api/candidates memakai paginasi/filter di server
+PAGINATION_ARGS = ('limit', 'cursor', 'sort', 'order', 'is_terima', 'posisi_dilamar',
+                   'skor_min', 'skor_max', 'ipk_min', 'ipk_max')
+
+# Interval refresher bersama untuk stream SSE dashboard dan interval keep-alive (detik)
+DASHBOARD_STREAM_INTERVAL = float(os.getenv("DASHBOARD_STREAM_INTERVAL", str(DASHBOARD_CACHE_TTL)))
+DASHBOARD_STREAM_KEEPALIVE = float(os.getenv("DASHBOARD_STREAM_KEEPALIVE", "15"))
+# Umur maksimum satu koneksi SSE; setelah itu stream ditutup dan browser reconnect (melepas worker)
+DASHBOARD_STREAM_MAX_SECONDS = float(os.getenv("DASHBOARD_STREAM_MAX_SECONDS", "300"))
+
+# Interval pembersihan session yang tidak aktif (detik), lihat SESSION_TTL_SECONDS/SESSION_MAX_SESSIONS
+SESSION_EVICT_INTERVAL = float(os.getenv("SESSION_EVICT_INTERVAL", "60"))
+
+# Naikkan versi ini jika logika parse transkrip berubah agar cache lama tidak dipakai
+TRANSCRIPT_PARSE_VARIANT = f"app-v1:{PDF_BACKEND}"
+
+# Data kandidat, transkrip jawaban dan path video per session (bersama antar worker, lihat SESSION_STORE)
+session_store = create_session_store()
+# Analisis video yang sudah dimulai per session di proses ini: {session_id: {"pertanyaan_N": AnalysisTask}}
+# (future lokal; status dan hasilnya juga dicatat di NS_ANALYSIS agar worker lain tidak submit ulang)
+session_video_analysis = {}
+
+
+def clear_session(session_id):
+    """Hapus semua data session (store bersama dan analisis video lokal)"""
+    session_store.delete(session_id)
+    session_video_analysis.pop(session_id, None)
+
+
+def evict_idle_sessions():
+    """Hapus session kadaluarsa/kelebihan dari store lalu analisis video lokal yang session-nya sudah hilang"""
+    for session_id in session_store.evict():
+        session_video_analysis.pop(session_id, None)
+    # Session bisa juga sudah dihapus oleh worker lain
+    local_ids = list(session_video_analysis)
+    remaining = session_store.get_many(NS_VIDEOS, local_ids)
+    for session_id in local_ids:
+        if session_id not in remaining:
+            session_video_analysis.pop(session_id, None)
+
+
+_evict_lock = threading.Lock()
+_last_evict = 0.0
+
+
+@app.before_request
+def schedule_session_eviction():
+    """Jalankan evict_idle_sessions di latar belakang paling sering sekali per SESSION_EVICT_INTERVAL"""
+    global _last_evict
+    now = time.monotonic()
+    with _evict_lock:
+        if now - _last_evict < SESSION_EVICT_INTERVAL:
+            return
+        _last_evict = now
+    threading.Thread(target=_run_eviction, daemon=True, name="session-eviction").start()
+
+
+def _run_eviction():
+    try:
+        evict_idle_sessions()
+    except Exception as e:
+        print(f"⚠️ Pembersihan session gagal: {str(e)}")
+
+
+def save_job_status(job):
+    """Simpan snapshot status job ke session store agar bisa dibaca dari worker mana pun"""
+    session_store.update(NS_JOBS, job["job_id"], job)
+
+
+def get_job_status(jobs, job_id):
+    """Status job dari antrian lokal, atau dari session store jika job berjalan di worker lain"""
+    return jobs.get(job_id) or session_store.get(NS_JOBS, job_id)
+
+# Executor analisis video (paralel, dibatasi gemini_limiter secara global)
+video_analyzer = VideoAnalysisExecutor()
+
+# Antrian job finalisasi interview (dijalankan setelah pertanyaan ke-4)
+finalize_jobs = JobQueue(
+    max_workers=FINALIZE_WORKERS,
+    stages=("video_analysis", "payload_build", "webhook_delivery"),
+    on_update=save_job_status
+)
+
+# Antrian scraping SKKK (dijalankan setelah NRP didapat dari transkrip)
+skkk_jobs = JobQueue(max_workers=SKKK_WORKERS, stages=("scrape",), on_update=save_job_status)
 
 
 def extract_text_from_pdf(pdf_path):
-    """Extract semua teks dari PDF"""
+    """Extract semua teks dari PDF (di-cache berdasarkan hash isi file)"""
     try:
-        text = ""
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
-        return text.strip()
+        return cached_pdf_text(pdf_path, f"app:{PDF_BACKEND}", _read_pdf_text)
     except Exception as e:
         print(f"Error extract PDF: {str(e)}")
         return None
 
 
+def _read_pdf_text(pdf_path):
+    return "\n".join(extract_pdf_pages(pdf_path)).strip()
+
+
 def parse_student_info(text: str) -> Dict[str, str]:
     """Ekstrak informasi mahasiswa dari transkrip"""
     info = {}
@@ -81,71 +190,6 @@ def parse_student_info(text: str) -> Dict[str, str]:
     return info
 
 
-def parse_courses(text: str) -> List[Dict[str, str]]:
-    """Ekstrak data mata kuliah dari transkrip"""
-    courses = []
-    seen_courses = set()
-
-    # Cari semua kemunculan kode mata kuliah dan posisinya
-    pattern_kode = r'([A-Z]{2}\d{4})(?=[A-Z\s])'
-    matches = list(re.finditer(pattern_kode, text))
-
-    for i, match in enumerate(matches):
-        kode = match.group(1)
-
-        # Ambil text mulai dari kode ini sampai kode berikutnya
-        start_pos = match.end()
-        if i < len(matches) - 1:
-            end_pos = matches[i + 1].start()
-        else:
-            end_pos = len(text)
-
-        fragment = text[start_pos:end_pos]
-        fragment_clean = re.sub(r'\s+', ' ', fragment).strip()
-
-        if len(fragment_clean) < 10:
-            continue
-
-        # Cari semester, SKS, dan nilai
-        pattern_data = r'(\d-\d{2}/\d{2})\s*(\d+)\s*([A-E]\+?)'
-        data_match = re.search(pattern_data, fragment_clean)
-
-        if not data_match:
-            continue
-
-        semester = data_match.group(1)
-        sks = int(data_match.group(2))
-        nilai = data_match.group(3)
-
-        # Nama mata kuliah adalah text sebelum semester
-        nama_end_pos = data_match.start()
-        mata_kuliah = fragment_clean[:nama_end_pos].strip()
-        mata_kuliah = re.sub(r'\s+', ' ', mata_kuliah)
-        mata_kuliah = re.sub(r'\s*/\s*$', '', mata_kuliah).strip()
-
-        # Filter noise
-        if (len(mata_kuliah) < 5 or
-            'Kode' in mata_kuliah or
-            'Mata Kuliah' in mata_kuliah or
-            'SMT' in mata_kuliah):
-            continue
-
-        course_id = f"{kode}-{semester}"
-        if course_id in seen_courses:
-            continue
-
-        courses.append({
-            'Kode': kode,
-            'Mata_Kuliah': mata_kuliah,
-            'Semester': semester,
-            'SKS': sks,
-            'Nilai': nilai
-        })
-        seen_courses.add(course_id)
-
-    return courses
-
-
 def calculate_grade_point(grade: str) -> float:
     """Konversi nilai huruf ke bobot nilai"""
     grade_mapping = {
@@ -179,16 +223,20 @@ def analyze_transcript(courses: List[Dict[str, str]]) -> Dict:
     return analysis
 
 
-def transform_n8n_data_to_candidate(user_data):
-    """Transform data dari n8n ke format kandidat untuk dashboard"""
+def transform_n8n_data_to_candidate(user_data, registered_at=None):
+    """
+    Transform data dari n8n ke format kandidat untuk dashboard
+
+    registered_at dipakai jika n8n tidak mengirim timestamp (diisi candidate_index
+    dengan waktu kandidat pertama kali terlihat agar stabil antar refresh)
+    """
     documents: Dict[str, List[Dict]] = {}
     for doc in user_data.get('documents', []):
         doc_type = doc.get('type')
         if not doc_type:
             continue
         documents.setdefault(doc_type, []).append(doc)
-    session_key = f"session_{user_data.get('user_id')}"
-    fallback_info = candidate_info.get(session_key, {})
+    fallback_info = _fallback_candidate_info(f"session_{user_data.get('user_id')}")
     nrp_value = (
         user_data.get('transkrip_nrp')
         or user_data.get('nrp')
@@ -231,7 +279,8 @@ def transform_n8n_data_to_candidate(user_data):
         'email': user_data.get('email', ''),
         'posisi_dilamar': user_data.get('posisi_dilamar'),  # Tidak ada di data n8n, bisa ditambahkan nanti
         'status': 'complete',
-        'registered_at': datetime.now().isoformat(),  # Atau ambil dari timestamp jika ada
+        'registered_at': (user_data.get('registered_at') or user_data.get('created_at')
+                          or registered_at or datetime.now().isoformat()),
         'is_terima': user_data.get('is_terima'),
         'skor_final': user_data.get('skor_final'),
         'CV': primary_docs.get('CV', {}).get('content', ''),
@@ -247,6 +296,67 @@ def transform_n8n_data_to_candidate(user_data):
     }
 
 
+def extract_n8n_users(data) -> List[Dict]:
+    """Ambil list user_data dari response n8n (single user_data, array, atau users array)"""
+    # Jika response berisi single user_data
+    if 'user_data' in data:
+        return [data['user_data']]
+    # Jika response berisi array of users
+    if isinstance(data, list):
+        return [item.get('user_data', item) for item in data]
+    # Jika response berisi users array
+    if 'users' in data:
+        return list(data['users'])
+    # Fallback: coba parse langsung
+    return [data]
+
+
+# Data kandidat di session store yang di-prefetch sekali per rebuild index (per thread)
+_dashboard_prefetch = threading.local()
+
+
+def _fallback_candidate_info(session_key):
+    """Data kandidat lokal (session store) untuk melengkapi data n8n"""
+    prefetched = getattr(_dashboard_prefetch, 'candidates', None)
+    if prefetched is not None:
+        return prefetched.get(session_key, {})
+    return session_store.get(NS_CANDIDATE, session_key) or {}
+
+
+def _candidate_fallback_fields(user_data):
+    """Data kandidat lokal yang ikut dipakai transform (bagian dari fingerprint index)"""
+    fallback_info = _fallback_candidate_info(f"session_{user_data.get('user_id')}")
+    return [fallback_info.get(key) for key in ('transkrip_nrp', 'nrp', 'transkrip_prodi', 'transkrip_ipk')]
+
+
+# Index session_id -> kandidat, di-update incremental setiap data dashboard di-load
+candidate_index = CandidateIndex(transform_n8n_data_to_candidate, fingerprint_extra=_candidate_fallback_fields,
+                                 store=session_store)
+
+
+def fetch_dashboard_snapshot():
+    """Ambil seluruh data dashboard dari n8n lalu perbarui index (dipanggil oleh dashboard_cache)"""
+    response = requests.get(DASHBOARD_DATA_URL, timeout=10)
+    if response.status_code != 200:
+        raise RuntimeError(f'Failed to fetch data from n8n: HTTP {response.status_code}')
+    users = extract_n8n_users(response.json())
+    # Satu query ke session store untuk semua user, bukan satu per user
+    _dashboard_prefetch.candidates = session_store.get_many(
+        NS_CANDIDATE, [f"session_{user_data.get('user_id')}" for user_data in users])
+    try:
+        return candidate_index.rebuild(users)
+    finally:
+        _dashboard_prefetch.candidates = None
+
+
+# Satu cache bersama untuk semua tab reviewer
+dashboard_cache = DashboardCache(fetch_dashboard_snapshot, ttl=DASHBOARD_CACHE_TTL,
+                                 max_stale=DASHBOARD_CACHE_MAX_STALE)
+
+# Satu refresher bersama yang mendorong perubahan kandidat ke semua tab reviewer lewat SSE
+candidate_broadcaster = CandidateBroadcaster(dashboard_cache, interval=DASHBOARD_STREAM_INTERVAL)
+
+
 @app.route('/')
 def index():
     return send_from_directory('.', 'index.html')
@@ -265,37 +375,73 @@ def serve_video(filename):
 
 @app.route('/api/candidates', methods=['GET'])
 def get_candidates():
-    """API untuk mendapatkan list kandidat dari n8n"""
+    """
+    API untuk mendapatkan list kandidat dari n8n (lewat dashboard_cache)
+
+    - If-None-Match dengan ETag versi terakhir -> 304 jika data tidak berubah
+    - ?since=<version dari response sebelumnya> -> hanya kandidat yang ditambah/berubah
+      (dan session_id yang dihapus); full=true jika cursor tidak berlaku lagi
+    - Paginasi/filter/urutan di server (lihat CandidateQuery.from_args): limit, cursor,
+      is_terima, posisi_dilamar, skor_min/skor_max, ipk_min/ipk_max, sort, order
+    - Default bentuk ringkas (LIST_FIELDS); ?view=full untuk kandidat lengkap
+      (CV, Q1-Q4, answers). Detail satu kandidat: /api/candidate/<session_id>
+    """
+    full_view = request.args.get('view') == 'full'
+    project = (lambda candidates: candidates) if full_view \
+        else (lambda candidates: [to_list_item(candidate) for candidate in candidates])
+
+    paginated = any(name in request.args for name in PAGINATION_ARGS)
+    if paginated and 'since' in request.args:
+        return jsonify({
+            'success': False,
+            'error': 'Parameter since tidak bisa digabung dengan paginasi/filter'
+        }), 400
+
     try:
-        # Fetch data dari n8n webhook
-        response = requests.get(DASHBOARD_DATA_URL, timeout=10)
-        
-        if response.status_code != 200:
-            return jsonify({
-                'success': False,
-                'error': f'Failed to fetch data from n8n: HTTP {response.status_code}'
-            }), 500
-        
-        data = response.json()
-        
-        # Transform data
-        # Jika response berisi single user_data
-        if 'user_data' in data:
-            candidates = [transform_n8n_data_to_candidate(data['user_data'])]
-        # Jika response berisi array of users
-        elif isinstance(data, list):
-            candidates = [transform_n8n_data_to_candidate(item.get('user_data', item)) for item in data]
-        # Jika response berisi users array
-        elif 'users' in data:
-            candidates = [transform_n8n_data_to_candidate(user) for user in data['users']]
+        query = CandidateQuery.from_args(request.args) if paginated else None
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    try:
+        snapshot, age, cache_status = dashboard_cache.get()
+
+        etag = snapshot.etag
+        if query is not None:
+            # Halaman bergantung pada parameter query, ETag ikut query string
+            etag += '-' + hashlib.sha1(request.query_string).hexdigest()[:12]
+        elif full_view:
+            etag += '-full'
+
+        # ETag bisa dikirim balik sebagai weak (response terkompresi), cocokkan keduanya
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+        elif query is not None:
+            page = snapshot.view.query(query)
+            response = jsonify({
+                'success': True,
+                **page,
+                'candidates': project(page['candidates']),
+                'limit': query.limit,
+                'version': snapshot.cursor
+            })
         else:
-            # Fallback: coba parse langsung
-            candidates = [transform_n8n_data_to_candidate(data)]
-        
-        return jsonify({
-            'success': True,
-            'candidates': candidates
-        })
+            since = snapshot.parse_cursor(request.args.get('since'))
+            if since is None:
+                candidates, removed = snapshot.candidates, []
+            else:
+                candidates, removed = snapshot.changed_since(since)
+            response = jsonify({
+                'success': True,
+                'candidates': project(candidates),
+                'removed': removed,
+                'full': since is None,
+                'version': snapshot.cursor
+            })
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Cache'] = cache_status
+        response.headers['X-Cache-Age'] = str(int(age))
+        return response
         
     except requests.Timeout:
         return jsonify({
@@ -315,32 +461,65 @@ def get_candidates():
             'error': str(e)
         }), 500
 
+@app.route('/api/candidates/stream', methods=['GET'])
+def stream_candidates():
+    """
+    Server-sent events untuk dashboard review (pengganti polling 30 detik)
+
+    Event: hello (versi saat ini), candidate-added, candidate-updated,
+    candidate-removed, lalu sync (version + etag baru) setelah setiap perubahan.
+    Jika koneksi putus, browser reconnect otomatis dan sync ulang lewat /api/candidates.
+
+    Catatan deploy: selama stream terbuka, satu worker/thread dipakai penuh oleh
+    reviewer itu. Jalankan dengan worker berbasis thread/greenlet (mis. gunicorn
+    --threads atau gevent), bukan worker sync saja. Stream ditutup setelah
+    DASHBOARD_STREAM_MAX_SECONDS supaya worker tidak tertahan selamanya; browser
+    langsung reconnect dan mengambil versi terbaru dari event hello.
+    """
+    subscriber = candidate_broadcaster.subscribe()
+
+    def generate():
+        deadline = time.monotonic() + DASHBOARD_STREAM_MAX_SECONDS
+        try:
+            yield "retry: 5000\n\n"
+            try:
+                snapshot, _, _ = dashboard_cache.get()
+                yield format_sse('hello', {'version': snapshot.cursor, 'etag': f'"{snapshot.etag}"'},
+                                 snapshot.cursor)
+            except Exception as e:
+                yield format_sse('hello', {'version': None, 'error': str(e)})
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    message = subscriber.get(timeout=min(DASHBOARD_STREAM_KEEPALIVE, remaining))
+                except queue.Empty:
+                    # Komentar keep-alive agar proxy tidak menutup koneksi yang diam
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is None:
+                    return
+                yield message
+        finally:
+            candidate_broadcaster.unsubscribe(subscriber)
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @app.route('/api/candidate/<session_id>', methods=['GET'])
 def get_candidate_detail(session_id):
-    """API untuk mendapatkan detail kandidat berdasarkan session_id"""
+    """
+    API untuk mendapatkan detail kandidat berdasarkan session_id (lookup index, tanpa fetch ulang)
+
+    Berisi field berat (CV, Q1-Q4, answers) yang tidak ikut di list /api/candidates
+    """
     try:
-        # Fetch semua kandidat
-        response = requests.get(DASHBOARD_DATA_URL, timeout=10)
-        
-        if response.status_code != 200:
-            return jsonify({
-                'success': False,
-                'error': f'Failed to fetch data from n8n: HTTP {response.status_code}'
-            }), 500
-        
-        data = response.json()
-        
-        # Transform dan cari kandidat yang sesuai
-        candidates = []
-        if 'user_data' in data:
-            candidates = [transform_n8n_data_to_candidate(data['user_data'])]
-        elif isinstance(data, list):
-            candidates = [transform_n8n_data_to_candidate(item.get('user_data', item)) for item in data]
-        elif 'users' in data:
-            candidates = [transform_n8n_data_to_candidate(user) for user in data['users']]
-        
-        # Cari kandidat dengan session_id yang sesuai
-        candidate = next((c for c in candidates if c['session_id'] == session_id), None)
+        snapshot, _, _ = dashboard_cache.get()
+        candidate = snapshot.get(session_id)
         
         if not candidate:
             return jsonify({
@@ -348,10 +527,18 @@ def get_candidate_detail(session_id):
                 'error': 'Candidate not found'
             }), 404
         
-        return jsonify({
-            'success': True,
-            'candidate': candidate
-        })
+        # ETag per kandidat: berubah hanya jika data kandidat ini berubah
+        etag = f"{snapshot.epoch}-{session_id}-{snapshot.updated_versions.get(session_id, 0)}"
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+        else:
+            response = jsonify({
+                'success': True,
+                'candidate': candidate
+            })
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
         
     except Exception as e:
         print(f"Error fetching candidate detail: {str(e)}")
@@ -443,10 +630,12 @@ def chat_transkrip():
             return jsonify({'success': False, 'error': 'session_id dan message required'}), 400
 
         # fallback nrp dari cache kandidat jika ada
-        if not nrp and session_id in candidate_info:
-            nrp = candidate_info[session_id].get('nrp') or candidate_info[session_id].get('nrp')
-        if not nrp and data.get('candidate_session') in candidate_info:
-            cand = candidate_info[data.get('candidate_session')]
+        cand = session_store.get(NS_CANDIDATE, session_id) if not nrp else None
+        if cand:
+            nrp = cand.get('nrp') or cand.get('nrp')
+        cand = session_store.get(NS_CANDIDATE, data.get('candidate_session')) \
+            if not nrp and data.get('candidate_session') else None
+        if cand:
             nrp = cand.get('nrp') or cand.get('nrp')
 
         print('Using NRP for transkrip chat:', nrp)
@@ -483,10 +672,12 @@ def chat_skkk():
             return jsonify({'success': False, 'error': 'session_id dan message required'}), 400
 
         # fallback nrp dari cache kandidat jika ada
-        if not nrp and session_id in candidate_info:
-            nrp = candidate_info[session_id].get('transkrip_nrp') or candidate_info[session_id].get('nrp')
-        if not nrp and data.get('candidate_session') in candidate_info:
-            cand = candidate_info[data.get('candidate_session')]
+        cand = session_store.get(NS_CANDIDATE, session_id) if not nrp else None
+        if cand:
+            nrp = cand.get('transkrip_nrp') or cand.get('nrp')
+        cand = session_store.get(NS_CANDIDATE, data.get('candidate_session')) \
+            if not nrp and data.get('candidate_session') else None
+        if cand:
             nrp = cand.get('transkrip_nrp') or cand.get('nrp')
 
         ai_message = forward_chat(
@@ -566,10 +757,7 @@ def upload_cv():
 
         # Simpan info kandidat dengan struktur yang match database
         # Gunakan update agar data transkrip/SKKK yang sudah di-upload sebelumnya tidak hilang
-        if session_id not in candidate_info:
-            candidate_info[session_id] = {}
-
-        candidate_info[session_id].update({
+        session_store.update(NS_CANDIDATE, session_id, {
             "nama": name,
             "email": email,
             "posisi_dilamar": position,
@@ -588,6 +776,58 @@ def upload_cv():
         return jsonify({'error': str(e)}), 500
 
 
+def scrape_skkk_for_session(job_id, session_id, nrp, force_refresh=False):
+    """Scrape SKKK (dijalankan sebagai job) lalu gabungkan hasilnya ke data kandidat di session store"""
+    skkk_jobs.set_stage(job_id, "scrape", "running", nrp)
+    skkk_result = scrape_skkk_cached(nrp, force_refresh=force_refresh)
+
+    cache_info = skkk_result.get('cache', {})
+    if cache_info.get('status') == 'stale':
+        print(f"⚠️ SKKK refresh gagal, memakai data cache ({cache_info.get('age_seconds')} detik): "
+              f"{cache_info.get('refresh_error')}")
+    if skkk_result["success"]:
+        print(f"✅ SKKK berhasil di-scrape: {skkk_result['total_activities']} kegiatan "
+              f"(cache: {cache_info.get('status')})")
+    else:
+        print(f"⚠️ SKKK scraping gagal: {skkk_result.get('error', 'Unknown error')}")
+
+    # Abaikan hasil jika session sudah di-reset atau transkrip sudah diganti
+    session_store.update_if(NS_CANDIDATE, session_id, {
+        "skkk_data": skkk_result.get('data', []),
+        "skkk_total_activities": skkk_result.get('total_activities', 0),
+        "skkk_success": skkk_result.get('success', False),
+        "skkk_status": "success" if skkk_result.get('success') else "failed"
+    }, expected={"skkk_job_id": job_id})
+
+    skkk_jobs.set_stage(job_id, "scrape", "done" if skkk_result.get('success') else "failed",
+                        skkk_result.get('error'))
+    return {
+        'success': skkk_result.get('success', False),
+        'total_activities': skkk_result.get('total_activities', 0),
+        'data': skkk_result.get('data', []),
+        'error': skkk_result.get('error', None),
+        'cache': skkk_result.get('cache')
+    }
+
+
+def wait_for_skkk(session_id, timeout=SKKK_FINALIZE_WAIT):
+    """Tunggu scraping SKKK session yang masih berjalan (dipakai sebelum payload webhook dibuat)"""
+    skkk_job_id = (session_store.get(NS_CANDIDATE, session_id) or {}).get("skkk_job_id")
+    if not skkk_job_id:
+        return None
+    job = skkk_jobs.wait(skkk_job_id, timeout)
+    if job is not None:
+        return job
+
+    # Job berjalan di worker lain: pantau statusnya lewat session store
+    deadline = time.monotonic() + timeout
+    while True:
+        job = session_store.get(NS_JOBS, skkk_job_id)
+        if job is None or job["status"] in ("success", "failed") or time.monotonic() >= deadline:
+            return job
+        time.sleep(0.5)
+
+
 @app.route('/upload-transkrip', methods=['POST'])
 def upload_transkrip():
     try:
@@ -607,37 +847,38 @@ def upload_transkrip():
         transkrip_path = os.path.join(TRANSKRIP_DIR, transkrip_filename)
         transkrip_file.save(transkrip_path)
 
-        # Extract dan parse transkrip
-        transkrip_text = extract_text_from_pdf(transkrip_path)
+        # Transkrip yang sama (hash isi file) tidak perlu di-parse ulang
+        transkrip_digest = sha256_file(transkrip_path)
+        parsed = get_cached_transcript(transkrip_digest, TRANSCRIPT_PARSE_VARIANT)
 
-        if not transkrip_text:
-            return jsonify({'error': 'Gagal membaca file transkrip'}), 400
+        if parsed:
+            student_info = parsed['student_info']
+            courses = parsed['courses']
+            analysis = parsed['analysis']
+        else:
+            # Extract dan parse transkrip
+            transkrip_text = extract_text_from_pdf(transkrip_path)
 
-        # Parse informasi mahasiswa
-        student_info = parse_student_info(transkrip_text)
+            if not transkrip_text:
+                return jsonify({'error': 'Gagal membaca file transkrip'}), 400
 
-        # Parse mata kuliah
-        courses = parse_courses(transkrip_text)
+            # Parse informasi mahasiswa
+            student_info = parse_student_info(transkrip_text)
 
-        # Analisis transkrip
-        analysis = analyze_transcript(courses)
+            # Parse mata kuliah
+            courses = parse_courses(transkrip_text)
 
-        # Scrape SKKK berdasarkan NRP dari transkrip
-        skkk_result = {"success": False, "data": [], "total_activities": 0}
-        nrp = student_info.get('NRP', '')
-        if nrp:
-            print(f"📡 Scraping SKKK untuk NRP: {nrp}")
-            skkk_result = scrape_skkk_data(nrp)
-            if skkk_result["success"]:
-                print(f"✅ SKKK berhasil di-scrape: {skkk_result['total_activities']} kegiatan")
-            else:
-                print(f"⚠️ SKKK scraping gagal: {skkk_result.get('error', 'Unknown error')}")
+            # Analisis transkrip
+            analysis = analyze_transcript(courses)
 
-        # Update candidate_info dengan data transkrip dan SKKK
-        if session_id not in candidate_info:
-            candidate_info[session_id] = {}
+            set_cached_transcript(transkrip_digest, TRANSCRIPT_PARSE_VARIANT, {
+                'student_info': student_info,
+                'courses': courses,
+                'analysis': analysis
+            })
 
-        candidate_info[session_id].update({
+        # Update data kandidat dengan data transkrip
+        session_store.update(NS_CANDIDATE, session_id, {
             "transkrip_filename": transkrip_filename,
             "transkrip_path": transkrip_path,
             "transkrip_nrp": student_info.get('NRP', ''),
@@ -647,11 +888,26 @@ def upload_transkrip():
             "transkrip_total_mk": analysis.get('total_courses', 0),
             "transkrip_courses": courses,  # Simpan list mata kuliah
             "transkrip_analysis": analysis,  # Simpan analisis lengkap
-            "skkk_data": skkk_result.get('data', []),  # Data SKKK
-            "skkk_total_activities": skkk_result.get('total_activities', 0),  # Total kegiatan SKKK
-            "skkk_success": skkk_result.get('success', False)  # Status scraping SKKK
+            "skkk_data": [],  # Data SKKK (diisi oleh job scraping)
+            "skkk_total_activities": 0,  # Total kegiatan SKKK
+            "skkk_success": False  # Status scraping SKKK
         })
 
+        # Scrape SKKK berdasarkan NRP dari transkrip di latar belakang
+        nrp = student_info.get('NRP', '')
+        skkk_response = {'status': 'unavailable', 'success': False, 'total_activities': 0, 'data': [],
+                         'error': 'NRP tidak ditemukan di transkrip'}
+        if nrp:
+            print(f"📡 Scraping SKKK untuk NRP: {nrp} (latar belakang)")
+            # Job id dicatat sebelum job berjalan: hasil job hanya digabung jika id-nya cocok
+            skkk_job_id = skkk_jobs.new_job_id()
+            session_store.update(NS_CANDIDATE, session_id, {"skkk_status": "pending", "skkk_job_id": skkk_job_id})
+            skkk_jobs.submit(scrape_skkk_for_session, session_id, nrp,
+                             request.form.get('refresh_skkk') == '1', job_id=skkk_job_id)
+            skkk_response = {'status': 'pending', 'job_id': skkk_job_id}
+        else:
+            session_store.update(NS_CANDIDATE, session_id, {"skkk_status": "unavailable", "skkk_job_id": None})
+
         # NOTE: Webhook hanya dikirim saat interview selesai (pertanyaan ke-4)
         # Tidak kirim saat upload transkrip untuk menjaga konsistensi dengan flow sebelumnya
 
@@ -665,12 +921,7 @@ def upload_transkrip():
                 'ipk': analysis.get('calculated_ipk', 0),
                 'grade_distribution': analysis.get('grade_distribution', {})
             },
-            'skkk': {
-                'success': skkk_result.get('success', False),
-                'total_activities': skkk_result.get('total_activities', 0),
-                'data': skkk_result.get('data', []),
-                'error': skkk_result.get('error', None)
-            }
+            'skkk': skkk_response
         })
 
     except Exception as e:
@@ -678,6 +929,50 @@ def upload_transkrip():
         return jsonify({'error': str(e)}), 500
 
 
+def start_video_analysis(session_id, key, video_path):
+    """
+    Submit analisis satu video dan catat statusnya di NS_ANALYSIS
+
+    Status "running" ditulis sebelum submit sehingga worker lain yang menjalankan
+    finalisasi menunggu hasil ini alih-alih memanggil Gemini lagi.
+    """
+    running = {'video_path': video_path, 'status': 'running', 'started_at': time.time()}
+    session_store.update(NS_ANALYSIS, session_id, {key: running})
+    task = video_analyzer.submit(video_path)
+    session_video_analysis.setdefault(session_id, {})[key] = task
+
+    def record_result(future):
+        try:
+            entry = {'video_path': video_path, 'status': 'done', 'result': future.result()}
+        except Exception as e:
+            entry = {'video_path': video_path, 'status': 'failed', 'error': str(e)}
+        try:
+            # Hanya jika entry masih milik submit ini (belum direkam ulang / session belum dihapus)
+            session_store.update_if(NS_ANALYSIS, session_id, {key: entry}, expected={key: running})
+        except Exception as e:
+            print(f"⚠️ Gagal mencatat hasil analisis video {session_id}/{key}: {str(e)}")
+
+    task.future.add_done_callback(record_result)
+    return task
+
+
+def wait_for_video_analysis(session_id, key, entry):
+    """Tunggu analisis video yang berjalan di worker lain lewat NS_ANALYSIS (batas waktu sama dengan executor)"""
+    deadline = entry['started_at'] + video_analyzer.queue_timeout + video_analyzer.timeout
+    while True:
+        if entry['status'] == 'done':
+            return entry['result']
+        if entry['status'] == 'failed':
+            return f"Error analisis video: {entry.get('error')}"
+        if time.time() >= deadline:
+            return f"Error analisis video: timeout setelah {video_analyzer.timeout:.0f} detik"
+        time.sleep(0.5)
+        current = (session_store.get(NS_ANALYSIS, session_id) or {}).get(key)
+        if current is None or current.get('video_path') != entry['video_path']:
+            return "Error analisis video: data analisis session sudah dihapus"
+        entry = current
+
+
 @app.route('/transcribe', methods=['POST'])
 def transcribe_audio():
     try:
@@ -702,10 +997,6 @@ def transcribe_audio():
             media_save_path = os.path.join(VIDEO_OUTPUT_DIR, media_filename)
             video_file.save(media_save_path)
 
-            if session_id not in session_videos:
-                session_videos[session_id] = {}
-            session_videos[session_id][f"pertanyaan_{question_number}"] = media_save_path
-
         if audio_file:
             audio_file.save(audio_save_path)
         elif video_file:
@@ -713,6 +1004,12 @@ def transcribe_audio():
         else:
             return jsonify({'error': 'File audio diperlukan untuk transkripsi.'}), 400
 
+        if video_file:
+            # Request valid: catat video lalu mulai analisis di background, tidak menunggu q4
+            key = f"pertanyaan_{question_number}"
+            session_store.update(NS_VIDEOS, session_id, {key: media_save_path})
+            start_video_analysis(session_id, key, media_save_path)
+
         # Transkripsi suara
         recognizer = sr.Recognizer()
         with sr.AudioFile(audio_save_path) as source:
@@ -725,102 +1022,21 @@ def transcribe_audio():
                 text = f"Error speech recognition: {e}"
 
         # Simpan hasil
-        if session_id not in all_transcripts:
-            all_transcripts[session_id] = {}
-
-        all_transcripts[session_id][f"pertanyaan_{question_number}"] = {
-            "transkrip": text,
-            "timestamp": timestamp,
-            "filename": media_filename
-        }
+        session_store.update(NS_TRANSCRIPTS, session_id, {
+            f"pertanyaan_{question_number}": {
+                "transkrip": text,
+                "timestamp": timestamp,
+                "filename": media_filename
+            }
+        })
 
         webhook_status = "pending"
-        webhook_result = None
-        video_analysis_payload = {}
+        job_id = None
 
-        # Kalau sudah pertanyaan terakhir (q4) → kirim semua ke n8n
+        # Kalau sudah pertanyaan terakhir (q4) → finalisasi di background job
         if question_number == "4":
-            try:
-                # Ambil data kandidat
-                candidate = candidate_info.get(session_id, {})
-
-                # Analisis seluruh video yang direkam
-                session_video_files = session_videos.get(session_id, {})
-                for key in sorted(session_video_files.keys()):
-                    video_path = session_video_files[key]
-                    try:
-                        analysis_text = analyze_video_confidence(video_path)
-                    except Exception as analysis_error:
-                        analysis_text = f"Error analisis video: {str(analysis_error)}"
-                    video_analysis_payload[f"analisis_{key}"] = analysis_text
-
-                # Struktur payload - JANGAN UBAH STRUKTUR YANG SUDAH ADA!
-                payload = {
-                    "session_id": session_id,
-                    "timestamp_completed": datetime.now().isoformat(),
-
-                    # Data Kandidat
-                    "nama": candidate.get("nama", ""),
-                    "email": candidate.get("email", ""),
-                    "posisi_dilamar": candidate.get("posisi_dilamar", ""),
-
-                    # CV Text
-                    "cv_text": candidate.get("CV", ""),
-
-                    # Transkrip Pertanyaan 1-4
-                    "transkrip_pertanyaan_1": all_transcripts[session_id].get("pertanyaan_1", {}).get("transkrip", ""),
-                    "transkrip_pertanyaan_2": all_transcripts[session_id].get("pertanyaan_2", {}).get("transkrip", ""),
-                    "transkrip_pertanyaan_3": all_transcripts[session_id].get("pertanyaan_3", {}).get("transkrip", ""),
-                    "transkrip_pertanyaan_4": all_transcripts[session_id].get("pertanyaan_4", {}).get("transkrip", ""),
-
-                    # Data Transkrip Akademik (TAMBAHAN BARU)
-                    "transkrip_nrp": candidate.get("transkrip_nrp", ""),
-                    "transkrip_prodi": candidate.get("transkrip_prodi", ""),
-                    "transkrip_ipk": candidate.get("transkrip_ipk", 0),
-                    "transkrip_total_sks": candidate.get("transkrip_total_sks", 0),
-                    "transkrip_total_mk": candidate.get("transkrip_total_mk", 0),
-                    "transkrip_courses": candidate.get("transkrip_courses", []),
-                    "transkrip_grade_distribution": candidate.get("transkrip_analysis", {}).get("grade_distribution", {}),
-
-                    # Data SKKK - Satuan Kredit Kegiatan Kemahasiswaan (TAMBAHAN BARU)
-                    "skkk_data": candidate.get("skkk_data", []),
-                    "skkk_total_activities": candidate.get("skkk_total_activities", 0),
-                    "skkk_success": candidate.get("skkk_success", False)
-                }
-
-                if video_analysis_payload:
-                    payload["analisis_video"] = video_analysis_payload
-
-                # Kirim ke webhook sebagai JSON (SEMUA DATA DALAM 1 REQUEST!)
-                resp = requests.post(
-                    WEBHOOK_URL,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=100
-                )
-
-                if resp.status_code == 200:
-                    webhook_status = "success"
-                    try:
-                        webhook_result = resp.json()
-                    except ValueError:
-                        webhook_result = None
-                    print(f"✅ Semua data berhasil dikirim untuk session: {session_id}")
-
-                    # Bersihkan data session
-                    if session_id in all_transcripts:
-                        del all_transcripts[session_id]
-                    if session_id in candidate_info:
-                        del candidate_info[session_id]
-                    if session_id in session_videos:
-                        del session_videos[session_id]
-                else:
-                    webhook_status = f"failed (HTTP {resp.status_code})"
-                    print(f"❌ Webhook gagal: {resp.status_code} - {resp.text}")
-
-            except Exception as e:
-                webhook_status = f"error: {str(e)}"
-                print(f"❌ Error kirim webhook: {str(e)}")
+            job_id = finalize_jobs.submit(finalize_interview, session_id)
+            webhook_status = "queued"
 
         return jsonify({
             'success': True,
@@ -828,7 +1044,7 @@ def transcribe_audio():
             'filename': media_filename,
             'question_number': question_number,
             'webhook_status': webhook_status,
-            'webhook_result': webhook_result,
+            'job_id': job_id,
             'is_last_question': question_number == "4"
         })
 
@@ -836,16 +1052,208 @@ def transcribe_audio():
         return jsonify({'error': str(e)}), 500
 
 
+def finalize_interview(job_id, session_id):
+    """
+    Analisis seluruh video lalu kirim semua data session ke n8n (dijalankan sebagai job)
+
+    Jika salah satu tahap gagal, tahap itu ditandai failed dan error dilempar ulang
+    supaya status job (yang di-polling frontend) juga failed.
+    """
+    webhook_status = "pending"
+    webhook_result = None
+    video_analysis_payload = {}
+    stage = "video_analysis"
+
+    try:
+        # Ambil data kandidat
+        transcripts = session_store.get(NS_TRANSCRIPTS, session_id) or {}
+
+        # Analisis seluruh video yang direkam
+        finalize_jobs.set_stage(job_id, "video_analysis", "running")
+        # Analisis sudah dimulai saat upload (mungkin di worker lain, lihat NS_ANALYSIS);
+        # hanya video yang belum pernah disubmit di worker mana pun yang disubmit di sini
+        session_video_files = session_store.get(NS_VIDEOS, session_id) or {}
+        started_tasks = session_video_analysis.get(session_id, {})
+        shared_analysis = session_store.get(NS_ANALYSIS, session_id) or {}
+        tasks = {}
+        remote = {}
+        for key, video_path in session_video_files.items():
+            task = started_tasks.get(key)
+            entry = shared_analysis.get(key)
+            if task is not None and task.video_path == video_path:
+                tasks[key] = task
+            elif entry is not None and entry.get('video_path') == video_path and entry['status'] != 'failed':
+                remote[key] = entry
+            else:
+                tasks[key] = start_video_analysis(session_id, key, video_path)
+        pending = sum(1 for task in tasks.values() if not task.future.done()) + \
+            sum(1 for entry in remote.values() if entry['status'] == 'running')
+        finalize_jobs.set_stage(job_id, "video_analysis", "running",
+                                f"{len(tasks) + len(remote)} video, {pending} masih berjalan")
+        results = video_analyzer.collect(tasks)
+        for key, entry in remote.items():
+            results[f"analisis_{key}"] = wait_for_video_analysis(session_id, key, entry)
+        video_analysis_payload = {
+            name: results[name]
+            for name in sorted(results, key=lambda name: question_sort_key(name[len("analisis_"):]))
+        }
+        finalize_jobs.set_stage(job_id, "video_analysis", "done", f"{len(video_analysis_payload)} video")
+
+        # Pastikan hasil scraping SKKK sudah masuk ke data kandidat
+        stage = "payload_build"
+        finalize_jobs.set_stage(job_id, "payload_build", "running", "menunggu scraping SKKK")
+        skkk_job = wait_for_skkk(session_id)
+        if skkk_job is not None and skkk_job["status"] not in ("success", "failed"):
+            print(f"⚠️ Scraping SKKK session {session_id} belum selesai, payload dikirim tanpa data SKKK")
+        candidate = session_store.get(NS_CANDIDATE, session_id) or {}
+
+        # Struktur payload - JANGAN UBAH STRUKTUR YANG SUDAH ADA!
+        finalize_jobs.set_stage(job_id, "payload_build", "running")
+        payload = {
+            "session_id": session_id,
+            "timestamp_completed": datetime.now().isoformat(),
+
+            # Data Kandidat
+            "nama": candidate.get("nama", ""),
+            "email": candidate.get("email", ""),
+            "posisi_dilamar": candidate.get("posisi_dilamar", ""),
+
+            # CV Text
+            "cv_text": candidate.get("CV", ""),
+
+            # Transkrip Pertanyaan 1-4
+            "transkrip_pertanyaan_1": transcripts.get("pertanyaan_1", {}).get("transkrip", ""),
+            "transkrip_pertanyaan_2": transcripts.get("pertanyaan_2", {}).get("transkrip", ""),
+            "transkrip_pertanyaan_3": transcripts.get("pertanyaan_3", {}).get("transkrip", ""),
+            "transkrip_pertanyaan_4": transcripts.get("pertanyaan_4", {}).get("transkrip", ""),
+
+            # Data Transkrip Akademik (TAMBAHAN BARU)
+            "transkrip_nrp": candidate.get("transkrip_nrp", ""),
+            "transkrip_prodi": candidate.get("transkrip_prodi", ""),
+            "transkrip_ipk": candidate.get("transkrip_ipk", 0),
+            "transkrip_total_sks": candidate.get("transkrip_total_sks", 0),
+            "transkrip_total_mk": candidate.get("transkrip_total_mk", 0),
+            "transkrip_courses": candidate.get("transkrip_courses", []),
+            "transkrip_grade_distribution": candidate.get("transkrip_analysis", {}).get("grade_distribution", {}),
+
+            # Data SKKK - Satuan Kredit Kegiatan Kemahasiswaan (TAMBAHAN BARU)
+            "skkk_data": candidate.get("skkk_data", []),
+            "skkk_total_activities": candidate.get("skkk_total_activities", 0),
+            "skkk_success": candidate.get("skkk_success", False)
+        }
+
+        if video_analysis_payload:
+            payload["analisis_video"] = video_analysis_payload
+        finalize_jobs.set_stage(job_id, "payload_build", "done")
+
+        # Kirim ke webhook sebagai JSON (SEMUA DATA DALAM 1 REQUEST!)
+        stage = "webhook_delivery"
+        finalize_jobs.set_stage(job_id, "webhook_delivery", "running")
+        resp = requests.post(
+            WEBHOOK_URL,
+            json=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=100
+        )
+
+        if resp.status_code == 200:
+            webhook_status = "success"
+            try:
+                webhook_result = resp.json()
+            except ValueError:
+                webhook_result = None
+            finalize_jobs.set_stage(job_id, "webhook_delivery", "done")
+            print(f"✅ Semua data berhasil dikirim untuk session: {session_id}")
+
+            # Ada kandidat baru di n8n, data dashboard berikutnya harus di-refresh
+            dashboard_cache.invalidate()
+            candidate_broadcaster.notify()
+
+            # Bersihkan data session
+            clear_session(session_id)
+        else:
+            webhook_status = f"failed (HTTP {resp.status_code})"
+            print(f"❌ Webhook gagal: {resp.status_code} - {resp.text}")
+            raise RuntimeError(f"Webhook {webhook_status}")
+
+    except Exception as e:
+        finalize_jobs.set_stage(job_id, stage, "failed", str(e))
+        print(f"❌ Finalisasi session {session_id} gagal di tahap {stage}: {str(e)}")
+        raise
+
+    return {
+        'webhook_status': webhook_status,
+        'webhook_result': webhook_result
+    }
+
+
+@app.route('/finalize-status/<job_id>', methods=['GET'])
+def finalize_status(job_id):
+    """Status job finalisasi interview per tahap (video_analysis, payload_build, webhook_delivery)"""
+    job = get_job_status(finalize_jobs, job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job})
+
+
+@app.route('/skkk-status/<session_id>', methods=['GET'])
+def skkk_status(session_id):
+    """Status dan hasil scraping SKKK untuk session (pending/success/failed/unavailable)"""
+    candidate = session_store.get(NS_CANDIDATE, session_id)
+    if candidate is None or "skkk_status" not in candidate:
+        return jsonify({'success': False, 'error': 'Session not found'}), 404
+
+    skkk = {'status': candidate["skkk_status"], 'job_id': candidate.get("skkk_job_id")}
+    job = get_job_status(skkk_jobs, candidate["skkk_job_id"]) if candidate.get("skkk_job_id") else None
+    if job is not None and job["status"] == "failed":
+        skkk.update({'status': 'failed', 'error': job["error"]})
+    elif job is not None and job["result"] is not None:
+        skkk.update(job["result"])
+        skkk['status'] = candidate["skkk_status"]
+    else:
+        skkk.update({
+            'success': candidate.get("skkk_success", False),
+            'total_activities': candidate.get("skkk_total_activities", 0),
+            'data': candidate.get("skkk_data", [])
+        })
+    return jsonify({'success': True, 'skkk': skkk})
+
+
+@app.route('/api/admin/stats', methods=['GET'])
+def admin_stats():
+    """Statistik cache dan antrian untuk monitoring operator"""
+    return jsonify({
+        'success': True,
+        'video_analysis_cache': video_cache.stats(),
+        'gemini_limiter': gemini_limiter.stats(),
+        'pdf_text_cache': pdf_text_cache.stats(),
+        'transcript_parse_cache': transcript_cache.stats(),
+        'skkk_cache': skkk_cache_stats(),
+        'dashboard_cache': dashboard_cache.stats(),
+        'candidate_stream': candidate_broadcaster.stats(),
+        'response_compression': response_compressor.stats(),
+        'candidate_index': candidate_index.stats(),
+        'session_store': session_store.stats()
+    })
+
+
+@app.route('/api/admin/sessions', methods=['GET'])
+def admin_sessions():
+    """Jumlah session interview, perkiraan ukuran per namespace store, dan statistik eviksi"""
+    return jsonify({
+        'success': True,
+        'session_store': session_store.report(),
+        'local_video_analysis_sessions': len(session_video_analysis)
+    })
+
+
 @app.route('/reset-session', methods=['POST'])
 def reset_session():
-    """Reset session jika user ingin mulai ulang"""
+    """Reset session jika user ingin mulai ulang (semua data session, termasuk video, dihapus)"""
     try:
         data = request.get_json()
         session_id = data.get('session_id', 'default')
-        if session_id in all_transcripts:
-            del all_transcripts[session_id]
-        if session_id in candidate_info:
-            del candidate_info[session_id]
+        clear_session(session_id)
         return jsonify({'success': True})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -0,0 +1,151 @@
+"""
+Benchmark payload list kandidat dashboard: bentuk lengkap vs ringkas, tanpa/dengan kompresi
+
+Memakai fixture n8n sintetis (default 1.000 kandidat dengan CV, jawaban Q1-Q4 dan
+analisisnya) yang dilayani lewat Flask test client, tanpa request ke n8n.
+
+Time-to-first-render adalah estimasi:
+    server (jsonify + kompresi) + transfer (RTT + byte / bandwidth)
+    + decode di client (dekompresi + json.loads) + render baris tabel
+dengan render meniru renderCandidates() di review.html.
+
+Contoh:
+    python benchmark_candidate_payload.py
+    python benchmark_candidate_payload.py --candidates 5000 --bandwidth-mbps 5 --rtt-ms 80
+"""
+import argparse
+import gzip
+import json
+import random
+import statistics
+import time
+from unittest import mock
+
+import app
+from http_compression import brotli
+
+WORDS = ("saya memiliki pengalaman mengelola tim proyek aplikasi web mobile data analisis komunikasi "
+         "kepemimpinan organisasi mahasiswa kepanitiaan acara kampus solusi masalah pelanggan").split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def build_n8n_fixture(candidates: int, seed: int = 7) -> dict:
+    """Response n8n ({'users': [...]}) dengan dokumen CV dan Q1-Q4 per kandidat"""
+    rng = random.Random(seed)
+    users = []
+    for i in range(candidates):
+        documents = [{'id': i * 10, 'type': 'CV', 'content': _text(rng, 450)}]
+        for q in range(1, 5):
+            documents.append({
+                'id': i * 10 + q,
+                'type': f'Q{q}',
+                'content': _text(rng, 120),
+                'analisis_jawaban': _text(rng, 90),
+                'analisis_video': _text(rng, 70),
+                'skor_pertanyaan': rng.randint(40, 100),
+                'skor_video': rng.randint(40, 100),
+                'human_rating': None,
+            })
+        users.append({
+            'user_id': 1000 + i,
+            'name': f'Kandidat {i}',
+            'email': f'kandidat{i}@john.petra.ac.id',
+            'posisi_dilamar': rng.choice(['Backend Developer', 'Frontend Developer', 'Data Analyst']),
+            'is_terima': rng.choice([True, False, None]),
+            'skor_final': round(rng.uniform(40, 100), 2),
+            'registered_at': f'2025-0{1 + i % 9}-{1 + i % 28:02d}T09:{i % 60:02d}:00',
+            'transkrip_nrp': f'C1422{i:04d}',
+            'transkrip_ipk': f'{rng.uniform(2.5, 4.0):.2f}',
+            'documents': documents,
+        })
+    return {'users': users}
+
+
+def render_rows(candidates) -> str:
+    """Perkiraan kerja renderCandidates(): satu baris HTML per kandidat"""
+    return "".join(
+        f"<tr><td><strong>{c['nama']}</strong></td><td>{c['email']}</td><td>{c['posisi_dilamar']}</td>"
+        f"<td><span class='status-badge'>{c['is_terima']}</span></td><td>{c['skor_final']}</td>"
+        f"<td><button onclick=\"showCV('{c['session_id']}')\">CV</button></td></tr>"
+        for c in candidates
+    )
+
+
+def measure(client, path: str, encoding: str, repeats: int):
+    server, decode, render = [], [], []
+    size = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        response = client.get(path, headers={'Accept-Encoding': encoding})
+        body = response.get_data()
+        server.append(time.perf_counter() - start)
+        size = len(body)
+
+        start = time.perf_counter()
+        content_encoding = response.headers.get('Content-Encoding')
+        if content_encoding == 'gzip':
+            body = gzip.decompress(body)
+        elif content_encoding == 'br':
+            body = brotli.decompress(body)
+        candidates = json.loads(body)['candidates']
+        decode.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        render_rows(candidates)
+        render.append(time.perf_counter() - start)
+    return size, statistics.median(server), statistics.median(decode), statistics.median(render)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark payload list kandidat dashboard")
+    parser.add_argument("--candidates", type=int, default=1000, help="Jumlah kandidat di fixture")
+    parser.add_argument("--repeats", type=int, default=5, help="Pengulangan per mode (median)")
+    parser.add_argument("--bandwidth-mbps", type=float, default=10.0, help="Bandwidth reviewer (Mbit/s)")
+    parser.add_argument("--rtt-ms", type=float, default=40.0, help="Round-trip time reviewer (ms)")
+    args = parser.parse_args()
+
+    fixture = build_n8n_fixture(args.candidates)
+    upstream = mock.Mock(status_code=200)
+    upstream.json.return_value = fixture
+
+    modes = [
+        ("Lengkap (lama)", "/api/candidates?view=full", "identity"),
+        ("Lengkap + gzip", "/api/candidates?view=full", "gzip"),
+        ("Ringkas", "/api/candidates", "identity"),
+        ("Ringkas + gzip", "/api/candidates", "gzip"),
+    ]
+    if brotli is not None:
+        modes.append(("Ringkas + br", "/api/candidates", "br"))
+
+    print("=" * 98)
+    print(f"BENCHMARK PAYLOAD LIST KANDIDAT ({args.candidates} kandidat, "
+          f"{args.bandwidth_mbps:g} Mbit/s, RTT {args.rtt_ms:g} ms)")
+    print("=" * 98)
+    print(f"{'Mode':<18} {'Payload (KB)':>13} {'Server (ms)':>12} {'Transfer (ms)':>14} "
+          f"{'Decode (ms)':>12} {'Render (ms)':>12} {'TTFR (ms)':>11}")
+    print("-" * 98)
+
+    results = {}
+    with mock.patch.object(app.requests, "get", return_value=upstream):
+        client = app.app.test_client()
+        client.get("/api/candidates")  # isi dashboard_cache dan index
+        for name, path, encoding in modes:
+            size, server, decode, render = measure(client, path, encoding, args.repeats)
+            transfer = args.rtt_ms / 1000 + size * 8 / (args.bandwidth_mbps * 1_000_000)
+            ttfr = server + transfer + decode + render
+            results[name] = (size, ttfr)
+            print(f"{name:<18} {size / 1024:>13.1f} {server * 1000:>12.1f} {transfer * 1000:>14.1f} "
+                  f"{decode * 1000:>12.1f} {render * 1000:>12.1f} {ttfr * 1000:>11.1f}")
+
+    baseline_size, baseline_ttfr = results["Lengkap (lama)"]
+    best = min(results, key=lambda name: results[name][1])
+    print("-" * 98)
+    print(f"Terbaik: {best} | payload {results[best][0] / baseline_size * 100:.1f}% dari lama | "
+          f"TTFR {baseline_ttfr / results[best][1]:.1f}x lebih cepat")
+
+
+if __name__ == "__main__":
+    main()
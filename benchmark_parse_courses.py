@@ -0,0 +1,160 @@
+"""
+Microbenchmark parse_courses: regex precompiled dengan pos/endpos vs implementasi regex lama
+
+Contoh:
+    python benchmark_parse_courses.py
+    python benchmark_parse_courses.py --courses 100 500 2000 --repeat 20
+"""
+import argparse
+import random
+import re
+import time
+from typing import Dict, List
+
+from course_parser import parse_courses
+
+COURSE_NAMES = [
+    "AGAMA DAN HIDUP BERMAKNA / A MEANINGFUL LIFE", "BAHASA INDONESIA / INDONESIAN",
+    "KALKULUS I / CALCULUS I", "ALGORITMA DAN PEMROGRAMAN / ALGORITHMS AND PROGRAMMING",
+    "STRUKTUR DATA / DATA STRUCTURES", "BASIS DATA / DATABASES", "STATISTIKA / STATISTICS",
+    "PEMROGRAMAN BERORIENTASI OBYEK / OBJECT- ORIENTED PROGRAMMING",
+    "PEMBELAJARAN MESIN / MACHINE LEARNING", "KERJA PRAKTEK /",
+]
+GRADES = ['A', 'B+', 'B', 'C+', 'C', 'D', 'E']
+SEPARATORS = ['', ' ', '  ', '\n', ' \n', '\t', '\r\n']
+
+
+def build_synthetic_transcript_text(n_courses: int, seed: int = 0) -> str:
+    """
+    Buat teks mirip hasil ekstraksi PDF transkrip: whitespace acak, nama terpotong
+    baris, header tabel berulang, duplikat, dan kode tanpa data nilai
+    """
+    rng = random.Random(seed)
+    parts = ["Nama :BUDI SANTOSOFakultas :TEKNOLOGI INDUSTRINRP :C14220001\n"]
+    previous = []
+    for i in range(n_courses):
+        if i % 40 == 0:
+            parts.append("Kode Mata Kuliah SMT SKS Nilai\n")
+        if previous and rng.random() < 0.05:
+            # Duplikat kode + semester
+            parts.append(rng.choice(previous))
+            continue
+        kode = f"{rng.choice(['IF', 'DU', 'FD', 'TF'])}{rng.randint(1000, 9999)}"
+        name = rng.choice(COURSE_NAMES)
+        if rng.random() < 0.3:
+            cut = rng.randint(1, len(name) - 1)
+            name = name[:cut] + rng.choice(['\n', ' \n', '']) + name[cut:]
+        semester = f"{rng.randint(1, 2)}-{rng.randint(20, 24)}/{rng.randint(21, 25)}"
+        if rng.random() < 0.03:
+            # Kode tanpa data semester/SKS/nilai
+            entry = f"{kode} {name}\n"
+        else:
+            entry = (f"{kode}{rng.choice(SEPARATORS[1:])}{name}{rng.choice(SEPARATORS)}{semester}"
+                     f"{rng.choice(SEPARATORS)}{rng.randint(1, 6)}{rng.choice(SEPARATORS)}{rng.choice(GRADES)}\n")
+        previous.append(entry)
+        parts.append(entry)
+    parts.append("Indeks Prestasi Kumulatif : 3.50\nJumlah SKS : 144 SKS\n")
+    return "".join(parts)
+
+
+def parse_courses_reference(text: str) -> List[Dict[str, str]]:
+    """
+    Implementasi parse_courses versi lama (re.sub/re.search per fragment)
+    Dipakai sebagai acuan golden output (test_course_parser) dan pembanding benchmark.
+    """
+    courses = []
+    seen_courses = set()
+
+    # Cari semua kemunculan kode mata kuliah dan posisinya
+    pattern_kode = r'([A-Z]{2}\d{4})(?=[A-Z\s])'
+    matches = list(re.finditer(pattern_kode, text))
+
+    for i, match in enumerate(matches):
+        kode = match.group(1)
+
+        # Ambil text mulai dari kode ini sampai kode berikutnya
+        start_pos = match.end()
+        if i < len(matches) - 1:
+            end_pos = matches[i + 1].start()
+        else:
+            end_pos = len(text)
+
+        fragment = text[start_pos:end_pos]
+        fragment_clean = re.sub(r'\s+', ' ', fragment).strip()
+
+        if len(fragment_clean) < 10:
+            continue
+
+        # Cari semester, SKS, dan nilai
+        pattern_data = r'(\d-\d{2}/\d{2})\s*(\d+)\s*([A-E]\+?)'
+        data_match = re.search(pattern_data, fragment_clean)
+
+        if not data_match:
+            continue
+
+        semester = data_match.group(1)
+        sks = int(data_match.group(2))
+        nilai = data_match.group(3)
+
+        # Nama mata kuliah adalah text sebelum semester
+        nama_end_pos = data_match.start()
+        mata_kuliah = fragment_clean[:nama_end_pos].strip()
+        mata_kuliah = re.sub(r'\s+', ' ', mata_kuliah)
+        mata_kuliah = re.sub(r'\s*/\s*$', '', mata_kuliah).strip()
+
+        # Filter noise
+        if (len(mata_kuliah) < 5 or
+            'Kode' in mata_kuliah or
+            'Mata Kuliah' in mata_kuliah or
+            'SMT' in mata_kuliah):
+            continue
+
+        course_id = f"{kode}-{semester}"
+        if course_id in seen_courses:
+            continue
+
+        courses.append({
+            'Kode': kode,
+            'Mata_Kuliah': mata_kuliah,
+            'Semester': semester,
+            'SKS': sks,
+            'Nilai': nilai
+        })
+        seen_courses.add(course_id)
+
+    return courses
+
+
+def _time(fn, text: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parse_courses")
+    parser.add_argument("--courses", type=int, nargs="+", default=[50, 300, 1000, 5000],
+                        help="Jumlah mata kuliah per transkrip sintetis")
+    parser.add_argument("--repeat", type=int, default=20, help="Jumlah pengulangan per ukuran")
+    args = parser.parse_args()
+
+    print("=" * 90)
+    print("BENCHMARK parse_courses (regex precompiled vs regex lama)")
+    print("=" * 90)
+    print(f"{'Jumlah MK':>10} {'Hasil':>8} {'Lama (ms)':>12} {'Baru (ms)':>12} {'Speedup':>10} {'Output sama':>13}")
+    print("-" * 90)
+
+    for n_courses in args.courses:
+        text = build_synthetic_transcript_text(n_courses, seed=n_courses)
+        expected = parse_courses_reference(text)
+        actual = parse_courses(text)
+        old_time = _time(parse_courses_reference, text, args.repeat)
+        new_time = _time(parse_courses, text, args.repeat)
+        same = "ya" if actual == expected else "TIDAK"
+        print(f"{n_courses:>10} {len(actual):>8} {old_time * 1000:>12.3f} {new_time * 1000:>12.3f} "
+              f"{old_time / new_time:>9.2f}x {same:>13}")
+
+
+if __name__ == "__main__":
+    main()
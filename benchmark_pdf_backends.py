@@ -0,0 +1,149 @@
+"""
+Benchmark backend ekstraksi teks PDF (pypdf2 / pypdfium2 / pdfminer)
+
+Menjalankan tiap backend pada transkrip contoh dan PDF sintetis multi-halaman,
+lalu membandingkan output parse_courses antar backend (acuan: backend pertama, pypdf2).
+Backend yang tidak lolos verify_backend ditolak saat dipilih lewat PDF_BACKEND.
+
+Contoh:
+    python benchmark_pdf_backends.py
+    python benchmark_pdf_backends.py --pages 5 20 50 --repeat 3
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from course_parser import parse_courses
+from pdf_backends import PDF_BACKENDS, extract_pdf_pages, verify_backend
+
+SAMPLE_PDF = '[SIA PETRA] Transkrip.pdf'
+
+COURSE_NAMES = [
+    "ALGORITMA DAN PEMROGRAMAN", "STRUKTUR DATA", "BASIS DATA", "KALKULUS I",
+    "MATEMATIKA DISKRIT", "JARINGAN KOMPUTER", "SISTEM OPERASI", "KECERDASAN BUATAN",
+    "PEMBELAJARAN MESIN", "REKAYASA PERANGKAT LUNAK", "STATISTIKA", "DATA MINING",
+]
+GRADES = ['A', 'B+', 'B', 'C+', 'C', 'D', 'E']
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def build_synthetic_transcript_pdf(path: str, pages: int, courses_per_page: int = 45, seed: int = 0):
+    """Tulis PDF teks sederhana berisi baris mata kuliah berformat transkrip"""
+    rng = random.Random(seed)
+    page_streams = []
+    for page in range(pages):
+        lines = ["Kode Mata Kuliah SMT SKS Nilai"]
+        for i in range(courses_per_page):
+            kode = f"{rng.choice(['IF', 'DU', 'FD', 'TI'])}{rng.randint(1000, 9999)}"
+            semester = f"{rng.randint(1, 2)}-{rng.randint(20, 24)}/{rng.randint(21, 25)}"
+            lines.append(f"{kode} {rng.choice(COURSE_NAMES)} / COURSE {page}-{i} "
+                         f"{semester} {rng.randint(1, 4)} {rng.choice(GRADES)}")
+        body = ["BT", "/F1 8 Tf", "10 TL", "30 810 Td"]
+        body += [f"({_pdf_escape(line)}) Tj T*" for line in lines]
+        body.append("ET")
+        page_streams.append("\n".join(body).encode('latin-1'))
+
+    # Objek: 1 catalog, 2 pages, 3 font, lalu (page, content) per halaman
+    objects = [None, None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for stream in page_streams:
+        page_id = len(objects) + 1
+        content_id = page_id + 1
+        page_ids.append(page_id)
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>".encode())
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + obj + b"\nendobj\n"
+    xref_pos = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode()
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_pos}\n%%EOF\n".encode()
+
+    with open(path, 'wb') as f:
+        f.write(output)
+
+
+def _course_fields(courses):
+    """Field non-teks yang harus sama persis antar backend"""
+    return [(c['Kode'], c['Semester'], c['SKS'], c['Nilai']) for c in courses]
+
+
+def available_backends():
+    """Backend yang library-nya terpasang"""
+    names = []
+    for name in PDF_BACKENDS:
+        try:
+            extract_pdf_pages(SAMPLE_PDF if os.path.exists(SAMPLE_PDF) else __file__, name)
+            names.append(name)
+        except ImportError:
+            print(f"   [!] Backend {name} dilewati: library belum terpasang")
+        except Exception:
+            names.append(name)
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark backend ekstraksi teks PDF")
+    parser.add_argument("--pages", type=int, nargs="+", default=[5, 20, 50],
+                        help="Jumlah halaman PDF sintetis (default: 5 20 50)")
+    parser.add_argument("--repeat", type=int, default=3, help="Jumlah pengulangan per file")
+    args = parser.parse_args()
+
+    backends = available_backends()
+
+    print("Verifikasi backend (dipakai untuk PDF_BACKEND):")
+    for backend in backends:
+        reason = verify_backend(backend)
+        print(f"   {backend:<12} {'lolos' if reason is None else 'DITOLAK: ' + reason}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_files = []
+        if os.path.exists(SAMPLE_PDF):
+            pdf_files.append(SAMPLE_PDF)
+        for pages in args.pages:
+            path = os.path.join(tmp_dir, f"synthetic_{pages}p.pdf")
+            build_synthetic_transcript_pdf(path, pages, seed=pages)
+            pdf_files.append(path)
+
+        print("=" * 100)
+        print("BENCHMARK BACKEND EKSTRAKSI PDF")
+        print("=" * 100)
+        print(f"{'File':<32} {'Backend':<12} {'Waktu (ms)':>12} {'MK':>6} {'Identik':>9} "
+              f"{'Kode/SMT/SKS/Nilai':>20} {'Nama beda':>10}")
+        print("-" * 100)
+
+        for pdf_path in pdf_files:
+            reference = None
+            for backend in backends:
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    text = "\n".join(extract_pdf_pages(pdf_path, backend))
+                elapsed = (time.perf_counter() - start) / args.repeat
+
+                courses = parse_courses(text)
+                if reference is None:
+                    reference = courses
+                identical = "ya" if courses == reference else "TIDAK"
+                same_fields = "ya" if _course_fields(courses) == _course_fields(reference) else "TIDAK"
+                name_diffs = sum(1 for a, b in zip(courses, reference) if a['Mata_Kuliah'] != b['Mata_Kuliah'])
+                print(f"{os.path.basename(pdf_path)[-32:]:<32} {backend:<12} {elapsed * 1000:>12.1f} "
+                      f"{len(courses):>6} {identical:>9} {same_fields:>20} {name_diffs:>10}")
+            print("-" * 100)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark parser tabel SKKK pada halaman fixture (fixtures/skkk/*.html)
+
+Membandingkan parsing lama (BeautifulSoup html.parser seluruh halaman)
+dengan backend di skkk_parsers (bs4, lxml, selectolax).
+
+Contoh:
+    python benchmark_skkk_parsers.py
+    python benchmark_skkk_parsers.py --repeat 200 fixtures/skkk/skkk_large.html
+"""
+import argparse
+import glob
+import os
+import time
+
+from bs4 import BeautifulSoup
+
+from skkk_parsers import SKKK_PARSERS, parse_skkk_table
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "skkk")
+
+
+def legacy_parse(html: str):
+    """Implementasi lama di scrape_skkk_data: header mentah, semua nilai string"""
+    table = BeautifulSoup(html, "html.parser").find("table", id="example")
+    if not table:
+        return None
+    headers = [th.get_text(strip=True) for th in table.find("thead").find_all("th")]
+    rows = []
+    for tr in table.find("tbody").find_all("tr"):
+        cols = [td.get_text(strip=True) for td in tr.find_all("td")]
+        if cols:
+            rows.append(cols)
+    return headers, [dict(zip(headers, row)) for row in rows if len(row) == len(headers)]
+
+
+def _time(fn, html: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(html)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parser tabel SKKK")
+    parser.add_argument("files", nargs="*", help="File HTML (default: semua fixture)")
+    parser.add_argument("--repeat", type=int, default=50, help="Jumlah pengulangan per file")
+    args = parser.parse_args()
+    files = args.files or sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html")))
+
+    print("=" * 100)
+    print("BENCHMARK PARSER TABEL SKKK")
+    print("=" * 100)
+    print(f"{'File':<24} {'KB':>6} {'Baris':>6} {'Parser':<12} {'ms/halaman':>11} {'Speedup':>9} {'Sama dgn bs4':>13}")
+    print("-" * 100)
+
+    for path in files:
+        with open(path, encoding="utf-8", newline="") as f:
+            html = f.read()
+        reference = parse_skkk_table(html, "bs4")
+        legacy = legacy_parse(html)
+        rows = len(reference[1]) if reference else 0
+        legacy_time = _time(legacy_parse, html, args.repeat)
+        name = os.path.basename(path)
+        print(f"{name:<24} {len(html) / 1024:>6.1f} {rows:>6} {'lama':<12} {legacy_time * 1000:>11.3f} {'1.00x':>9} "
+              f"{'-':>13}")
+        for backend in SKKK_PARSERS:
+            try:
+                result = parse_skkk_table(html, backend)
+            except ImportError as e:
+                print(f"{'':<24} {'':>6} {'':>6} {backend:<12} {'tidak terpasang: ' + str(e)[:40]}")
+                continue
+            elapsed = _time(lambda page: parse_skkk_table(page, backend), html, args.repeat)
+            print(f"{'':<24} {'':>6} {'':>6} {backend:<12} {elapsed * 1000:>11.3f} {legacy_time / elapsed:>8.2f}x "
+                  f"{'ya' if result == reference else 'TIDAK':>13}")
+
+        if legacy and reference:
+            print(f"{'':<24} header lama: {legacy[0]}")
+            print(f"{'':<24} header baru: {reference[0]}")
+
+
+if __name__ == "__main__":
+    main()
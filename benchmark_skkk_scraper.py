@@ -0,0 +1,139 @@
+"""
+Benchmark scraper SKKK terhadap server HTTP lokal pengganti sportfolio
+
+Membandingkan alur lama (Session baru + GET awal + POST per scrape) dengan
+scrape_skkk_data (session bersama keep-alive, GET awal hanya jika perlu).
+Latensi jaringan disimulasikan per request (--latency) dan per koneksi
+baru (--connect-latency, mewakili TCP handshake ke server yang jauh).
+
+Contoh:
+    python benchmark_skkk_scraper.py
+    python benchmark_skkk_scraper.py --scrapes 50 --latency 0.03 --connect-latency 0.03
+"""
+import argparse
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from bs4 import BeautifulSoup
+
+import scrap_website
+
+ROWS = 40
+
+
+def build_skkk_html(rows: int) -> str:
+    """Halaman mirip sportfolio dengan tabel SKKK Non Wajib (id='example')"""
+    body = "".join(
+        f"<tr><td>{i}</td><td>KEGIATAN MAHASISWA {i}</td><td>Panitia</td>"
+        f"<td>{2021 + i % 4}/{2022 + i % 4}</td><td>{i % 3 + 1}</td></tr>"
+        for i in range(1, rows + 1)
+    )
+    return (
+        "<html><body><form method='post'><input name='nrp'></form>"
+        "<table id='example'><thead><tr><th>No</th><th>Nama Kegiatan</th><th>Jabatan</th>"
+        f"<th>Periode</th><th>SKKK</th></tr></thead><tbody>{body}</tbody></table></body></html>"
+    )
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Header dan body ditulis terpisah; tanpa ini Nagle + delayed ACK menambah ~40 ms per request
+    disable_nagle_algorithm = True
+    latency = 0.0
+    connect_latency = 0.0
+    connections = 0
+    counter_lock = threading.Lock()
+    page = build_skkk_html(ROWS).encode("utf-8")
+    form = b"<html><body><form method='post'><input name='nrp'></form></body></html>"
+
+    def setup(self):
+        super().setup()
+        with StandInHandler.counter_lock:
+            StandInHandler.connections += 1
+        time.sleep(self.connect_latency)
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        self._send(self.form, cookie=True)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.latency)
+        self._send(self.page)
+
+    def _send(self, body: bytes, cookie: bool = False):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        if cookie:
+            self.send_header("Set-Cookie", "PHPSESSID=benchmark; path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def legacy_scrape(url: str, nrp: str) -> int:
+    """Alur lama: Session baru, GET awal tanpa timeout, lalu POST"""
+    headers = dict(scrap_website.SKKK_HEADERS, Referer=url)
+    s = requests.Session()
+    s.get(url, headers=headers)
+    r = s.post(url, data={"nrp": nrp, "Submit": "Submit"}, headers=headers, allow_redirects=True, timeout=10)
+    table = BeautifulSoup(r.text, "html.parser").find("table", id="example")
+    return len(table.find("tbody").find_all("tr"))
+
+
+def pooled_scrape(url: str, nrp: str) -> int:
+    result = scrap_website.scrape_skkk_data(nrp)
+    assert result["success"], result.get("error")
+    return result["total_activities"]
+
+
+def run(name: str, fn, url: str, scrapes: int):
+    StandInHandler.connections = 0
+    timings = []
+    for i in range(scrapes):
+        start = time.perf_counter()
+        activities = fn(url, f"C1422{i:04d}")
+        timings.append(time.perf_counter() - start)
+        assert activities == ROWS
+    timings.sort()
+    print(f"{name:<28} {statistics.mean(timings) * 1000:>10.2f} {timings[len(timings) // 2] * 1000:>10.2f} "
+          f"{timings[int(len(timings) * 0.95) - 1] * 1000:>10.2f} {StandInHandler.connections:>11}")
+    return statistics.mean(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scraper SKKK (server lokal)")
+    parser.add_argument("--scrapes", type=int, default=30, help="Jumlah scrape per mode")
+    parser.add_argument("--latency", type=float, default=0.02, help="Latensi per request (detik)")
+    parser.add_argument("--connect-latency", type=float, default=0.02, help="Latensi per koneksi baru (detik)")
+    args = parser.parse_args()
+
+    StandInHandler.latency = args.latency
+    StandInHandler.connect_latency = args.connect_latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/skkk.php"
+    scrap_website.SKKK_URL = url
+
+    print("=" * 74)
+    print(f"BENCHMARK SCRAPER SKKK (latensi {args.latency * 1000:.0f} ms/request, "
+          f"{args.connect_latency * 1000:.0f} ms/koneksi)")
+    print("=" * 74)
+    print(f"{'Mode':<28} {'Rata2 (ms)':>10} {'p50 (ms)':>10} {'p95 (ms)':>10} {'Koneksi':>11}")
+    print("-" * 74)
+    try:
+        legacy = run("Session baru + GET + POST", legacy_scrape, url, args.scrapes)
+        pooled = run("Session bersama (pool)", pooled_scrape, url, args.scrapes)
+    finally:
+        server.shutdown()
+    print(f"\nSpeedup per scrape: {legacy / pooled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
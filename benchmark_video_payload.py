@@ -0,0 +1,76 @@
+"""
+Benchmark ukuran payload dan latency analisis video: mode full vs compact
+
+Jika ffmpeg tidak tersedia, mode compact jatuh ke file asli; baris itu ditandai
+"fallback" dan benchmark keluar dengan status gagal karena angka compact tidak valid.
+
+Contoh:
+    python benchmark_video_payload.py
+    python benchmark_video_payload.py "video_recordings/*.webm" --call-gemini
+"""
+import argparse
+import glob
+import time
+
+from process_video import prepare_video_payload, request_gemini_analysis
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bandingkan payload video full vs compact")
+    parser.add_argument("pattern", nargs="?", default="videos/*.mp4",
+                        help="Glob file video (default: videos/*.mp4)")
+    parser.add_argument("--call-gemini", action="store_true",
+                        help="Ukur juga latency end-to-end panggilan Gemini (memakai kuota API)")
+    args = parser.parse_args()
+
+    video_paths = sorted(glob.glob(args.pattern))
+    if not video_paths:
+        print(f"Tidak ada video yang cocok dengan pola: {args.pattern}")
+        return
+
+    print("=" * 100)
+    print("BENCHMARK PAYLOAD VIDEO: FULL vs COMPACT")
+    print("=" * 100)
+    print(f"{'Video':<40} {'Mode':<8} {'Payload (KB)':>14} {'Preprocess (s)':>15} {'Gemini (s)':>12}")
+    print("-" * 100)
+
+    totals = {"full": [0, 0.0, 0.0], "compact": [0, 0.0, 0.0]}
+    fallbacks = 0
+    for video_path in video_paths:
+        for mode in ("full", "compact"):
+            start = time.perf_counter()
+            video_bytes, mime_type, used_mode = prepare_video_payload(video_path, mode)
+            prepare_time = time.perf_counter() - start
+            label = mode
+            if used_mode != mode:
+                label = "fallback"
+                fallbacks += 1
+
+            gemini_time = 0.0
+            if args.call_gemini:
+                start = time.perf_counter()
+                request_gemini_analysis(video_bytes, mime_type)
+                gemini_time = time.perf_counter() - start
+
+            totals[mode][0] += len(video_bytes)
+            totals[mode][1] += prepare_time
+            totals[mode][2] += gemini_time
+            gemini_label = f"{gemini_time:.2f}" if args.call_gemini else "-"
+            print(f"{video_path[-40:]:<40} {label:<8} {len(video_bytes) / 1024:>14.1f} "
+                  f"{prepare_time:>15.2f} {gemini_label:>12}")
+
+    print("-" * 100)
+    for mode, (total_bytes, prepare_time, gemini_time) in totals.items():
+        end_to_end = prepare_time + gemini_time
+        print(f"TOTAL {mode:<8}: {total_bytes / 1024:.1f} KB | preprocess {prepare_time:.2f}s"
+              + (f" | end-to-end {end_to_end:.2f}s" if args.call_gemini else ""))
+    if fallbacks:
+        raise SystemExit(f"❌ {fallbacks} video tidak berhasil di-compact (ffmpeg tidak ada/gagal); "
+                         f"angka compact di atas adalah file asli")
+    if totals["full"][0]:
+        ratio = totals["compact"][0] / totals["full"][0]
+        print(f"Ukuran payload compact = {ratio * 100:.1f}% dari full")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+import hashlib
+import json
+import threading
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from candidate_query import CandidateView
+from session_store import NS_INDEX, MemorySessionStore, SessionStore
+
+# Key entry state index di namespace NS_INDEX
+INDEX_STATE_KEY = "dashboard"
+# Batas percobaan compare-and-set state bersama sebelum menyerah
+INDEX_STATE_MAX_ATTEMPTS = 10
+
+
+class CandidateSnapshot:
+    """
+    Hasil satu kali load data dashboard (read-only setelah dibuat)
+
+    candidates: list kandidat sesuai urutan dari n8n
+    by_session: index session_id -> kandidat untuk lookup O(1)
+    version: versi dataset, hanya naik jika ada kandidat yang berubah/ditambah/dihapus
+    epoch: id state index bersama; sama di semua worker yang memakai session store yang sama
+    """
+
+    def __init__(self, candidates: List[Dict], stats: Dict, epoch: str = '', version: int = 0,
+                 updated_versions: Optional[Dict[str, int]] = None, removed: Optional[Dict[str, int]] = None):
+        self.candidates = candidates
+        self.by_session: Dict[str, Dict] = {}
+        for candidate in candidates:
+            # Jika ada duplikat session_id, yang pertama dipakai (sama seperti scan linear lama)
+            self.by_session.setdefault(candidate['session_id'], candidate)
+        self.stats = stats
+        self.epoch = epoch
+        self.version = version
+        self.updated_versions = updated_versions or {}
+        self.removed = removed or {}
+        self._view: Optional[CandidateView] = None
+        self._view_lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        return self.by_session.get(session_id)
+
+    @property
+    def view(self) -> CandidateView:
+        """Index filter/urutan/paginasi, dibangun sekali saat pertama dipakai"""
+        with self._view_lock:
+            if self._view is None:
+                self._view = CandidateView(self.candidates)
+            return self._view
+
+    @property
+    def cursor(self) -> str:
+        """Cursor untuk parameter since (berlaku di semua worker selama epoch sama)"""
+        return f"{self.epoch}:{self.version}"
+
+    @property
+    def etag(self) -> str:
+        return f"cand-{self.epoch}-{self.version}"
+
+    def parse_cursor(self, cursor: Optional[str]) -> Optional[int]:
+        """
+        Versi dari cursor since, None jika kosong/tidak valid/dari epoch lain, atau lebih baru
+        dari snapshot ini (worker ini belum refresh) -> harus sync penuh
+        """
+        if not cursor or ':' not in cursor:
+            return None
+        epoch, _, version = cursor.rpartition(':')
+        if epoch != self.epoch or not version.isdigit() or int(version) > self.version:
+            return None
+        return int(version)
+
+    def changed_since(self, version: int) -> Tuple[List[Dict], List[str]]:
+        """(kandidat yang ditambah/berubah setelah version, session_id yang dihapus setelah version)"""
+        changed = [candidate for candidate in self.candidates
+                   if self.updated_versions.get(candidate['session_id'], 0) > version]
+        removed = [session_id for session_id, removed_at in self.removed.items() if removed_at > version]
+        return changed, removed
+
+
+class CandidateIndex:
+    """
+    Index kandidat yang di-update secara incremental setiap data dashboard di-load
+
+    Tiap user disimpan bersama fingerprint data mentahnya; transform hanya
+    dijalankan ulang untuk user yang datanya berubah.
+
+    Versi dataset, versi per kandidat, dan registered_at (waktu user pertama kali
+    terlihat) disimpan di session store bersama (namespace NS_INDEX) dan di-update
+    dengan compare-and-set. Worker gunicorn yang membaca data n8n yang sama
+    menghasilkan version, cursor since, dan ETag yang sama, jadi request berikutnya
+    boleh jatuh ke worker mana pun.
+    """
+
+    def __init__(self, transform: Callable[[Dict, str], Dict],
+                 fingerprint_extra: Optional[Callable[[Dict], object]] = None,
+                 store: Optional[SessionStore] = None):
+        """
+        Args:
+            transform: fungsi (user_data, registered_at) -> kandidat
+            fingerprint_extra: data lokal tambahan yang ikut menentukan hasil transform
+                               (mis. fallback candidate_info), ikut dimasukkan ke fingerprint
+            store: session store bersama untuk state versi; default in-process (satu worker)
+        """
+        self._transform = transform
+        self._fingerprint_extra = fingerprint_extra
+        self._store = store if store is not None else MemorySessionStore()
+        self._lock = threading.Lock()
+        # Cache transform lokal: key -> (fingerprint, registered_at, kandidat)
+        self._candidates: Dict[str, Tuple[str, str, Dict]] = {}
+        self._last_stats: Dict = {}
+
+    def _fingerprint(self, user_data: Dict) -> str:
+        raw = json.dumps(user_data, sort_keys=True, ensure_ascii=False, default=str)
+        if self._fingerprint_extra is not None:
+            raw += json.dumps(self._fingerprint_extra(user_data), sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _load_state(self) -> Dict:
+        """State bersama; dibuat dengan epoch baru jika belum ada (mis. store baru/kadaluarsa)"""
+        state = self._store.get(NS_INDEX, INDEX_STATE_KEY)
+        if state is None or 'epoch' not in state:
+            self._store.update(NS_INDEX, INDEX_STATE_KEY, {
+                'epoch': uuid.uuid4().hex[:8], 'version': 0, 'entries': {}, 'removed': {},
+            })
+            state = self._store.get(NS_INDEX, INDEX_STATE_KEY)
+        return state
+
+    def _sync_versions(self, fingerprints: Dict[str, Tuple[str, str]], now: str) -> Dict:
+        """
+        Gabungkan fingerprint hasil load ini ke state bersama (compare-and-set pada epoch+version)
+
+        Args:
+            fingerprints: key user -> (fingerprint, session_id)
+
+        Returns:
+            state bersama setelah di-update: epoch, version, entries (key -> [fingerprint,
+            versi, registered_at, session_id]) dan removed (session_id -> versi)
+        """
+        for _ in range(INDEX_STATE_MAX_ATTEMPTS):
+            state = self._load_state()
+            previous = state['entries']
+            next_version = state['version'] + 1
+            entries = {}
+            changed = False
+            for key, (fingerprint, session_id) in fingerprints.items():
+                entry = previous.get(key)
+                if entry is not None and entry[0] == fingerprint:
+                    entries[key] = entry
+                else:
+                    registered_at = entry[2] if entry is not None else now
+                    entries[key] = [fingerprint, next_version, registered_at, session_id]
+                    changed = True
+
+            removed_keys = previous.keys() - entries.keys()
+            if not changed and not removed_keys:
+                return state
+
+            current_sessions = {entry[3] for entry in entries.values()}
+            removed = {session_id: version for session_id, version in state['removed'].items()
+                       if session_id not in current_sessions}
+            for key in removed_keys:
+                if previous[key][3] not in current_sessions:
+                    removed[previous[key][3]] = next_version
+
+            new_state = {'version': next_version, 'entries': entries, 'removed': removed}
+            if self._store.update_if(NS_INDEX, INDEX_STATE_KEY, new_state,
+                                     expected={'epoch': state['epoch'], 'version': state['version']}):
+                return {**new_state, 'epoch': state['epoch']}
+        raise RuntimeError("State index kandidat terus berubah oleh worker lain, coba lagi")
+
+    def rebuild(self, users: List[Dict]) -> CandidateSnapshot:
+        """Bangun snapshot baru dari list user_data n8n, memakai ulang kandidat yang tidak berubah"""
+        with self._lock:
+            now = datetime.now().isoformat()
+            keyed = []
+            occurrences: Dict[str, int] = {}
+            for user_data in users:
+                user_id = str(user_data.get('user_id'))
+                occurrence = occurrences.get(user_id, 0)
+                occurrences[user_id] = occurrence + 1
+                keyed.append((f"{user_id}#{occurrence}", self._fingerprint(user_data), user_data))
+
+            # Transform hanya untuk user baru/berubah; registered_at sementara dikoreksi setelah sync
+            drafts: Dict[str, Tuple[str, str, Dict]] = {}
+            fingerprints = {}
+            changed = reused = 0
+            for key, fingerprint, user_data in keyed:
+                cached = self._candidates.get(key)
+                if cached is not None and cached[0] == fingerprint:
+                    drafts[key] = cached
+                    reused += 1
+                else:
+                    registered_at = cached[1] if cached is not None else now
+                    drafts[key] = (fingerprint, registered_at, self._transform(user_data, registered_at))
+                    changed += 1
+                fingerprints[key] = (fingerprint, drafts[key][2]['session_id'])
+            state = self._sync_versions(fingerprints, now)
+
+            candidates = []
+            local = {}
+            updated_versions: Dict[str, int] = {}
+            for key, fingerprint, user_data in keyed:
+                _, updated_version, registered_at, session_id = state['entries'][key]
+                candidate = drafts[key][2]
+                if drafts[key][1] != registered_at:
+                    # Worker lain melihat user ini lebih dulu: pakai registered_at bersama
+                    candidate = self._transform(user_data, registered_at)
+                local[key] = (fingerprint, registered_at, candidate)
+                candidates.append(candidate)
+                updated_versions[session_id] = max(updated_versions.get(session_id, 0), updated_version)
+            removed_count = len(self._candidates.keys() - local.keys())
+            self._candidates = local
+
+            self._last_stats = {
+                'candidates': len(candidates),
+                'changed': changed,
+                'reused': reused,
+                'removed': removed_count,
+                'version': state['version'],
+                'epoch': state['epoch'],
+                'built_at': now,
+            }
+            return CandidateSnapshot(candidates, dict(self._last_stats), epoch=state['epoch'],
+                                     version=state['version'], updated_versions=updated_versions,
+                                     removed=dict(state['removed']))
+
+    def stats(self) -> Dict:
+        """Statistik rebuild terakhir (jumlah kandidat, yang di-transform ulang, dipakai ulang, dihapus)"""
+        with self._lock:
+            return dict(self._last_stats)
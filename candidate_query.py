@@ -0,0 +1,248 @@
+import base64
+import binascii
+import json
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+SORT_FIELDS = ('registered_at', 'skor_final')
+SORT_ORDERS = ('asc', 'desc')
+
+# Field yang dikirim di list kandidat; CV, Q1-Q4 dan answers hanya lewat endpoint detail
+LIST_FIELDS = ('id', 'session_id', 'nama', 'email', 'posisi_dilamar', 'status', 'registered_at',
+               'is_terima', 'skor_final', 'transkrip_ipk', 'transkrip_nrp')
+
+# is_terima -> status yang dipakai dashboard
+STATUS_VALUES = {True: 'diterima', False: 'ditolak', None: 'pending'}
+_STATUS_ALIASES = {
+    'diterima': 'diterima', 'true': 'diterima', '1': 'diterima',
+    'ditolak': 'ditolak', 'false': 'ditolak', '0': 'ditolak',
+    'pending': 'pending', 'null': 'pending', 'none': 'pending',
+}
+
+
+def to_float(value) -> Optional[float]:
+    """Angka dari skor/IPK n8n (bisa int, float, atau string "3,45"), None jika kosong/tidak valid"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().replace(',', '.')
+    try:
+        return float(text) if text else None
+    except ValueError:
+        return None
+
+
+def to_timestamp(value) -> Optional[float]:
+    """Timestamp dari registered_at (ISO 8601, boleh diakhiri Z), None jika tidak bisa dibaca"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.astimezone()
+    return parsed.timestamp()
+
+
+def to_list_item(candidate: Dict) -> Dict:
+    """Bentuk ringkas kandidat untuk tabel dashboard"""
+    return {field: candidate.get(field) for field in LIST_FIELDS}
+
+
+def status_of(is_terima) -> str:
+    return STATUS_VALUES.get(is_terima, 'pending')
+
+
+def parse_status(value: str) -> str:
+    status = _STATUS_ALIASES.get(value.strip().lower())
+    if status is None:
+        raise ValueError(f"is_terima tidak valid: {value} (pilihan: true, false, pending)")
+    return status
+
+
+def encode_cursor(sort: str, order: str, key: Tuple) -> str:
+    raw = json.dumps([sort, order, list(key)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, sort: str, order: str) -> Tuple:
+    """Key item terakhir halaman sebelumnya; ValueError jika cursor rusak atau untuk urutan lain"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        cursor_sort, cursor_order, key = json.loads(raw)
+        missing, value, session_id = key
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError("cursor tidak valid")
+    if (cursor_sort, cursor_order) != (sort, order):
+        raise ValueError("cursor dibuat untuk urutan lain, mulai lagi tanpa cursor")
+    return int(missing), float(value), str(session_id)
+
+
+class CandidateQuery:
+    """Parameter list kandidat: filter, urutan dan paginasi"""
+
+    def __init__(self, statuses: Sequence[str] = (), positions: Sequence[str] = (),
+                 skor_min: Optional[float] = None, skor_max: Optional[float] = None,
+                 ipk_min: Optional[float] = None, ipk_max: Optional[float] = None,
+                 sort: str = 'registered_at', order: str = 'desc',
+                 limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None):
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"sort tidak valid: {sort} (pilihan: {', '.join(SORT_FIELDS)})")
+        if order not in SORT_ORDERS:
+            raise ValueError(f"order tidak valid: {order} (pilihan: asc, desc)")
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit harus antara 1 dan {MAX_PAGE_SIZE}")
+        self.statuses = set(statuses)
+        self.positions = {position.strip().lower() for position in positions}
+        self.skor_range = (skor_min, skor_max)
+        self.ipk_range = (ipk_min, ipk_max)
+        self.sort = sort
+        self.order = order
+        self.limit = limit
+        self.after = decode_cursor(cursor, sort, order) if cursor else None
+
+    @classmethod
+    def from_args(cls, args) -> 'CandidateQuery':
+        """
+        Bangun query dari request.args
+
+        is_terima (true|false|pending, boleh diulang/koma), posisi_dilamar (boleh diulang),
+        skor_min/skor_max, ipk_min/ipk_max, sort (registered_at|skor_final),
+        order (asc|desc), limit, cursor (next_cursor dari halaman sebelumnya)
+        """
+        def number(name):
+            value = args.get(name)
+            if value is None or value == '':
+                return None
+            parsed = to_float(value)
+            if parsed is None:
+                raise ValueError(f"{name} harus berupa angka")
+            return parsed
+
+        def values(name):
+            return [part for value in args.getlist(name) for part in value.split(',') if part.strip()]
+
+        try:
+            limit = int(args.get('limit', DEFAULT_PAGE_SIZE))
+        except ValueError:
+            raise ValueError("limit harus berupa angka")
+        return cls(
+            statuses=[parse_status(value) for value in values('is_terima')],
+            positions=values('posisi_dilamar'),
+            skor_min=number('skor_min'), skor_max=number('skor_max'),
+            ipk_min=number('ipk_min'), ipk_max=number('ipk_max'),
+            sort=args.get('sort', 'registered_at'), order=args.get('order', 'desc'),
+            limit=limit, cursor=args.get('cursor') or None,
+        )
+
+
+class CandidateView:
+    """
+    Index in-memory di atas satu snapshot kandidat untuk filter/urutan/paginasi di server
+
+    Dibangun sekali per snapshot (snapshot tidak berubah setelah dibuat):
+    - status dan posisi_dilamar -> himpunan posisi kandidat
+    - skor_final dan transkrip_ipk -> list terurut untuk filter rentang (bisect)
+    - urutan per (sort, order) dengan key (kosong?, nilai, session_id) untuk
+      paginasi keyset: cursor menyimpan key item terakhir sehingga halaman
+      berikutnya tetap benar walaupun ada kandidat baru di antara request
+    """
+
+    def __init__(self, candidates: List[Dict]):
+        self.candidates = candidates
+        self._by_status: Dict[str, Set[int]] = {}
+        self._by_position: Dict[str, Set[int]] = {}
+        self._ranges: Dict[str, Tuple[List[float], List[int]]] = {}
+        self._sort_values: Dict[str, List[Optional[float]]] = {
+            'registered_at': [to_timestamp(c.get('registered_at')) for c in candidates],
+            'skor_final': [to_float(c.get('skor_final')) for c in candidates],
+        }
+        self._orders: Dict[Tuple[str, str], Tuple[List[Tuple], List[int]]] = {}
+
+        for i, candidate in enumerate(candidates):
+            self._by_status.setdefault(status_of(candidate.get('is_terima')), set()).add(i)
+            position = (candidate.get('posisi_dilamar') or '').strip().lower()
+            self._by_position.setdefault(position, set()).add(i)
+
+        range_values = {
+            'skor_final': self._sort_values['skor_final'],
+            'transkrip_ipk': [to_float(c.get('transkrip_ipk')) for c in candidates],
+        }
+        for field, numbers in range_values.items():
+            pairs = sorted((value, i) for i, value in enumerate(numbers) if value is not None)
+            self._ranges[field] = ([value for value, _ in pairs], [i for _, i in pairs])
+
+    def _ordering(self, sort: str, order: str) -> Tuple[List[Tuple], List[int]]:
+        """(key terurut, posisi kandidat) untuk satu urutan; kandidat tanpa nilai selalu di akhir"""
+        cached = self._orders.get((sort, order))
+        if cached is None:
+            sign = -1.0 if order == 'desc' else 1.0
+            keyed = []
+            for i, value in enumerate(self._sort_values[sort]):
+                key = (1, 0.0, self.candidates[i]['session_id']) if value is None \
+                    else (0, sign * value, self.candidates[i]['session_id'])
+                keyed.append((key, i))
+            keyed.sort()
+            cached = ([key for key, _ in keyed], [i for _, i in keyed])
+            self._orders[(sort, order)] = cached
+        return cached
+
+    def _in_range(self, field: str, low: Optional[float], high: Optional[float]) -> Set[int]:
+        values, positions = self._ranges[field]
+        start = bisect_left(values, low) if low is not None else 0
+        end = bisect_right(values, high) if high is not None else len(values)
+        return set(positions[start:end])
+
+    def _matching(self, query: CandidateQuery) -> Optional[Set[int]]:
+        """Posisi kandidat yang lolos semua filter, None jika tidak ada filter"""
+        selections = []
+        if query.statuses:
+            selections.append(set().union(*(self._by_status.get(s, set()) for s in query.statuses)))
+        if query.positions:
+            selections.append(set().union(*(self._by_position.get(p, set()) for p in query.positions)))
+        if query.skor_range != (None, None):
+            selections.append(self._in_range('skor_final', *query.skor_range))
+        if query.ipk_range != (None, None):
+            selections.append(self._in_range('transkrip_ipk', *query.ipk_range))
+        if not selections:
+            return None
+        selections.sort(key=len)
+        return selections[0].intersection(*selections[1:])
+
+    def query(self, query: CandidateQuery) -> Dict:
+        """
+        Satu halaman kandidat
+
+        Returns:
+            dict berisi candidates, total (jumlah yang lolos filter) dan
+            next_cursor (None jika sudah halaman terakhir)
+        """
+        matching = self._matching(query)
+        keys, positions = self._ordering(query.sort, query.order)
+        start = bisect_right(keys, query.after) if query.after is not None else 0
+
+        page: List[int] = []
+        last_offset = start
+        next_cursor = None
+        for offset in range(start, len(positions)):
+            i = positions[offset]
+            if matching is not None and i not in matching:
+                continue
+            if len(page) == query.limit:
+                # Masih ada kandidat setelah halaman ini
+                next_cursor = encode_cursor(query.sort, query.order, keys[last_offset])
+                break
+            page.append(i)
+            last_offset = offset
+
+        return {
+            'candidates': [self.candidates[i] for i in page],
+            'total': len(self.candidates) if matching is None else len(matching),
+            'next_cursor': next_cursor,
+        }
@@ -0,0 +1,139 @@
+import json
+import queue
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from candidate_query import to_list_item
+from dashboard_cache import DashboardCache
+
+
+def format_sse(event: str, data: Dict, event_id: Optional[str] = None) -> str:
+    """Format satu pesan server-sent events"""
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class CandidateBroadcaster:
+    """
+    Satu refresher bersama yang mendorong perubahan kandidat ke semua reviewer (SSE)
+
+    Thread refresher hanya berjalan selama ada subscriber. Setiap interval detik
+    data di-refresh lewat dashboard_cache (jadi beban ke n8n tidak bergantung pada
+    jumlah reviewer), lalu perubahan versi dikirim sebagai event:
+    candidate-added, candidate-updated, candidate-removed, diikuti sync.
+    """
+
+    def __init__(self, cache: DashboardCache, interval: float, queue_size: int = 100):
+        self.cache = cache
+        self.interval = interval
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers: List[queue.Queue] = []
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._snapshot = None
+        self._events_sent = 0
+        self._dropped = 0
+
+    def subscribe(self) -> queue.Queue:
+        """Daftarkan reviewer baru; event dikirim lewat queue yang dikembalikan"""
+        subscriber = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.append(subscriber)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="candidate-stream")
+                self._thread.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue):
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def notify(self):
+        """Bangunkan refresher sekarang (mis. setelah webhook interview baru terkirim)"""
+        self._wake.set()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'subscribers': len(self._subscribers),
+                'refresher_running': self._thread is not None and self._thread.is_alive(),
+                'interval_seconds': self.interval,
+                'events_sent': self._events_sent,
+                'dropped_subscribers': self._dropped,
+                'version': self._snapshot.cursor if self._snapshot is not None else None,
+            }
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    return
+            try:
+                snapshot, _, cache_status = self.cache.get()
+                if cache_status == "STALE":
+                    snapshot, _, _ = self.cache.refresh()
+                self._publish(snapshot)
+            except Exception as e:
+                print(f"⚠️ Refresher dashboard gagal: {str(e)}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def _publish(self, snapshot):
+        previous = self._snapshot
+        self._snapshot = snapshot
+        if previous is None or previous.version == snapshot.version:
+            return
+        if previous.epoch != snapshot.epoch:
+            return
+
+        changed, removed = snapshot.changed_since(previous.version)
+        messages: List[Tuple[str, Dict]] = []
+        for candidate in changed:
+            event = 'candidate-updated' if previous.get(candidate['session_id']) else 'candidate-added'
+            messages.append((event, to_list_item(candidate)))
+        for session_id in removed:
+            messages.append(('candidate-removed', {'session_id': session_id}))
+        messages.append(('sync', {'version': snapshot.cursor, 'etag': f'"{snapshot.etag}"'}))
+        self._broadcast([format_sse(event, data, snapshot.cursor) for event, data in messages])
+
+    def _broadcast(self, messages: List[str]):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                for message in messages:
+                    subscriber.put_nowait(message)
+            except queue.Full:
+                # Reviewer terlalu lambat membaca: putuskan, browser akan reconnect dan sync ulang
+                self.unsubscribe(subscriber)
+                with self._lock:
+                    self._dropped += 1
+                self._close(subscriber)
+                continue
+            with self._lock:
+                self._events_sent += len(messages)
+
+    @staticmethod
+    def _close(subscriber: queue.Queue):
+        """
+        Kirim sinyal tutup (None) tanpa pernah memblokir refresher
+
+        Subscriber sudah dilepas dari daftar, jadi refresher satu-satunya penulis:
+        setelah event lama dibuang, put_nowait pasti mendapat tempat.
+        """
+        while True:
+            try:
+                subscriber.get_nowait()
+            except queue.Empty:
+                break
+        try:
+            subscriber.put_nowait(None)
+        except queue.Full:
+            pass
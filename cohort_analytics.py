@@ -0,0 +1,248 @@
+"""
+Analitik transkrip untuk banyak mahasiswa sekaligus (vectorized dengan pandas/NumPy)
+
+Menghasilkan angka yang sama dengan analyze_transcript per mahasiswa
+(distribusi nilai, total SKS, IPK, IPS per semester, IP per tahun) dalam
+satu pass groupby, ditambah persentil dan distribusi tingkat angkatan.
+
+Ada biaya tetap (membangun DataFrame, factorize): di bawah sekitar 150-200
+mahasiswa loop analyze_transcript masih lebih cepat, dan jika hasil perlu
+diubah lagi ke dict (to_analysis_dicts) titik impasnya jauh lebih tinggi.
+Pakai modul ini untuk analitik tingkat angkatan, bukan per mahasiswa.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+GRADE_ORDER = ['A', 'B+', 'B', 'C+', 'C', 'D', 'E']
+GRADE_POINTS = {'A': 4.00, 'B+': 3.50, 'B': 3.00, 'C+': 2.50, 'C': 2.00, 'D': 1.00, 'E': 0.00}
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+IPK_BINS = [0.0, 2.0, 2.5, 2.75, 3.0, 3.25, 3.5, 3.75, 4.0]
+NON_GRADE_COLUMNS = ('courses', 'total_sks', 'weighted_sum', 'calculated_ipk')
+
+
+def build_courses_frame(students: Dict[str, List[Dict]]) -> pd.DataFrame:
+    """
+    Gabungkan list mata kuliah banyak mahasiswa menjadi satu DataFrame
+
+    Args:
+        students: {id_mahasiswa (mis. NRP): list course dict hasil parse_courses}
+    """
+    groups = [(student_id, courses) for student_id, courses in students.items() if courses]
+    return pd.DataFrame({
+        'student': np.repeat(np.array([student_id for student_id, _ in groups], dtype=object),
+                             [len(courses) for _, courses in groups]),
+        'Semester': [course['Semester'] for _, courses in groups for course in courses],
+        'SKS': np.fromiter((course['SKS'] for _, courses in groups for course in courses), dtype=np.int64),
+        'Nilai': [course['Nilai'] for _, courses in groups for course in courses],
+    })
+
+
+def load_courses_frame_from_dataset(dataset_dir: str, filter=None, run_id: Optional[str] = None) -> pd.DataFrame:
+    """
+    Baca tabel mata_kuliah dari dataset Parquet (lihat transkrip_parquet) sebagai courses frame
+
+    Dataset bersifat append-only: transkrip yang diproses ulang punya baris di beberapa
+    Run_ID. Tanpa run_id, hanya run terbaru per NRP (Processed_At di info_mahasiswa)
+    yang dipakai supaya mata kuliah tidak terhitung ganda.
+
+    Args:
+        filter: expression pyarrow.dataset untuk tabel mata_kuliah (mis. per Angkatan)
+        run_id: pakai hanya baris dari satu run tertentu
+    """
+    import pyarrow.dataset as ds
+    from transkrip_parquet import open_table
+
+    if run_id is not None:
+        run_filter = ds.field('Run_ID') == run_id
+        filter = run_filter if filter is None else filter & run_filter
+    table = open_table(dataset_dir, 'mata_kuliah').to_table(columns=['NRP', 'Run_ID', 'Semester', 'SKS', 'Nilai'],
+                                                            filter=filter)
+    df = table.to_pandas()
+
+    if run_id is None and len(df):
+        runs = open_table(dataset_dir, 'info_mahasiswa').to_table(
+            columns=['NRP', 'Run_ID', 'Processed_At']).to_pandas()
+        latest = (runs.sort_values(['Processed_At', 'Run_ID'], kind='stable')
+                  .drop_duplicates('NRP', keep='last'))
+        latest_run = df['NRP'].map(pd.Series(latest['Run_ID'].to_numpy(), index=latest['NRP']))
+        df = df[df['Run_ID'] == latest_run]
+
+    return pd.DataFrame({
+        'student': df['NRP'].to_numpy(),
+        'Semester': df['Semester'].to_numpy(),
+        'SKS': df['SKS'].to_numpy(dtype=np.int64),
+        'Nilai': df['Nilai'].astype(str).to_numpy(),
+    })
+
+
+def analyze_cohort(courses_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Hitung analisis transkrip untuk semua mahasiswa dalam satu pass
+
+    Kunci string (mahasiswa, semester, nilai) di-factorize menjadi kode integer,
+    lalu semua agregasi memakai np.bincount. bincount menjumlahkan berurutan sesuai
+    urutan baris, jadi weighted_sum identik (bit per bit) dengan loop analyze_transcript.
+
+    Returns:
+        Dictionary berisi DataFrame:
+        - students: per mahasiswa (courses, total_sks, weighted_sum, calculated_ipk, jumlah per nilai)
+        - semesters: per (mahasiswa, semester) dengan ips
+        - years: per (mahasiswa, tahun akademik) dengan ip
+    """
+    student_codes, student_ids = pd.factorize(courses_df['student'])
+    semester_codes, semester_names = pd.factorize(courses_df['Semester'])
+    grade_codes, grade_names = pd.factorize(courses_df['Nilai'])
+
+    sks = courses_df['SKS'].to_numpy(dtype=np.int64)
+    grade_points = np.array([GRADE_POINTS.get(grade, 0.0) for grade in grade_names], dtype=float)
+    weighted = sks * grade_points[grade_codes]
+
+    n_students = len(student_ids)
+    students = pd.DataFrame(
+        _aggregate(student_codes, n_students, sks, weighted),
+        index=pd.Index(student_ids, name='student')
+    )
+    students['calculated_ipk'] = _round_ratio(students['weighted_sum'], students['total_sks'])
+
+    n_grades = len(grade_names)
+    grade_counts = np.bincount(student_codes * n_grades + grade_codes,
+                               minlength=n_students * n_grades).reshape(n_students, n_grades)
+    for position in sorted(range(n_grades), key=lambda i: _grade_sort_key(grade_names[i])):
+        students[grade_names[position]] = grade_counts[:, position]
+
+    # Tahun akademik dari semester (e.g., "22/23" dari "1-22/23"), dihitung sekali per semester unik
+    year_codes_by_semester, year_names = pd.factorize(
+        pd.Index([semester.split('-')[1] for semester in semester_names])
+    )
+    year_codes = year_codes_by_semester[semester_codes]
+
+    semesters = _group_summary(student_codes, student_ids, semester_codes, semester_names,
+                               'Semester', sks, weighted)
+    semesters['ips'] = _round_ratio(semesters['weighted_sum'], semesters['total_sks'])
+
+    years = _group_summary(student_codes, student_ids, year_codes, year_names, 'year', sks, weighted)
+    years['ip'] = _round_ratio(years['weighted_sum'], years['total_sks'])
+
+    return {'students': students, 'semesters': semesters, 'years': years}
+
+
+def cohort_percentiles(students_df: pd.DataFrame,
+                       columns: Sequence[str] = ('calculated_ipk', 'total_sks'),
+                       percentiles: Iterable[int] = DEFAULT_PERCENTILES) -> pd.DataFrame:
+    """Persentil angkatan untuk kolom tertentu (baris: persentil, kolom: metrik)"""
+    percentiles = list(percentiles)
+    values = np.nanpercentile(students_df[list(columns)].to_numpy(dtype=float), percentiles, axis=0)
+    return pd.DataFrame(values, index=[f"p{p}" for p in percentiles], columns=list(columns))
+
+
+def percentile_rank(students_df: pd.DataFrame, column: str = 'calculated_ipk') -> pd.Series:
+    """Peringkat persentil (0-100) tiap mahasiswa dalam angkatan"""
+    return students_df[column].rank(pct=True) * 100
+
+
+def cohort_distributions(students_df: pd.DataFrame, bins: Optional[List[float]] = None) -> Dict[str, pd.Series]:
+    """
+    Distribusi tingkat angkatan:
+    - grade_share: proporsi tiap nilai dari seluruh mata kuliah
+    - ipk_histogram: jumlah mahasiswa per rentang IPK
+    """
+    grade_columns = [grade for grade in GRADE_ORDER if grade in students_df.columns]
+    grade_totals = students_df[grade_columns].sum()
+    total = grade_totals.sum()
+    ipk_histogram = pd.cut(students_df['calculated_ipk'], bins=bins or IPK_BINS,
+                           include_lowest=True).value_counts(sort=False)
+    return {
+        'grade_share': grade_totals / total if total else grade_totals.astype(float),
+        'ipk_histogram': ipk_histogram,
+    }
+
+
+def to_analysis_dicts(result: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+    """
+    Ubah hasil analyze_cohort ke format dict analyze_transcript per mahasiswa
+    (tanpa course_list), untuk kompatibilitas dan verifikasi
+    """
+    students = result['students']
+    grade_columns = _grade_columns(students.columns)
+    output = {}
+    for student_id, row in students.to_dict('index').items():
+        analysis = {
+            'total_courses': int(row['courses']),
+            'grade_distribution': {grade: int(row[grade]) for grade in grade_columns if row[grade]},
+            'semester_summary': {},
+            'total_sks': int(row['total_sks']),
+            'weighted_sum': float(row['weighted_sum']),
+            'year_summary': {},
+        }
+        if not np.isnan(row['calculated_ipk']):
+            analysis['calculated_ipk'] = float(row['calculated_ipk'])
+        output[student_id] = analysis
+
+    for row in result['semesters'].itertuples(index=False):
+        summary = {
+            'courses': int(row.courses),
+            'total_sks': int(row.total_sks),
+            'weighted_sum': float(row.weighted_sum),
+        }
+        if not np.isnan(row.ips):
+            summary['ips'] = float(row.ips)
+        output[row.student]['semester_summary'][row.Semester] = summary
+    for row in result['years'].itertuples(index=False):
+        summary = {
+            'courses': int(row.courses),
+            'total_sks': int(row.total_sks),
+            'weighted_sum': float(row.weighted_sum),
+        }
+        if not np.isnan(row.ip):
+            summary['ip'] = float(row.ip)
+        output[row.student]['year_summary'][row.year] = summary
+    return output
+
+
+def strip_course_lists(analysis: Dict) -> Dict:
+    """Hasil analyze_transcript tanpa course_list per semester (format to_analysis_dicts)"""
+    result = dict(analysis)
+    result['semester_summary'] = {
+        semester: {k: v for k, v in data.items() if k != 'course_list'}
+        for semester, data in analysis['semester_summary'].items()
+    }
+    return result
+
+
+def _aggregate(codes: np.ndarray, size: int, sks: np.ndarray, weighted: np.ndarray) -> Dict[str, np.ndarray]:
+    return {
+        'courses': np.bincount(codes, minlength=size),
+        'total_sks': np.bincount(codes, weights=sks, minlength=size).astype(np.int64),
+        'weighted_sum': np.bincount(codes, weights=weighted, minlength=size),
+    }
+
+
+def _group_summary(student_codes: np.ndarray, student_ids, group_codes: np.ndarray, group_names,
+                   group_column: str, sks: np.ndarray, weighted: np.ndarray) -> pd.DataFrame:
+    """Agregasi per (mahasiswa, grup), urutan grup mengikuti kemunculan pertama seperti analyze_transcript"""
+    pair_codes, pairs = pd.factorize(student_codes * len(group_names) + group_codes)
+    summary = pd.DataFrame(_aggregate(pair_codes, len(pairs), sks, weighted))
+    summary.insert(0, group_column, np.asarray(group_names, dtype=object)[pairs % len(group_names)])
+    summary.insert(0, 'student', np.asarray(student_ids, dtype=object)[pairs // len(group_names)])
+    return summary
+
+
+def _round_ratio(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    """
+    numerator / denominator dibulatkan 2 desimal dengan round() Python (NaN jika denominator 0);
+    np.round berbeda hasil untuk nilai tepat di tengah (mis. 76.5 / 20)
+    """
+    ratio = numerator.to_numpy(dtype=float) / np.where(denominator.to_numpy() > 0, denominator.to_numpy(), np.nan)
+    return pd.Series([round(value, 2) for value in ratio.tolist()], index=numerator.index, dtype=float)
+
+
+def _grade_sort_key(grade: str):
+    return (GRADE_ORDER.index(grade) if grade in GRADE_ORDER else len(GRADE_ORDER), grade)
+
+
+def _grade_columns(columns) -> List[str]:
+    """Kolom jumlah per nilai, urut A..E lalu nilai tak dikenal"""
+    grades = [column for column in columns if column not in NON_GRADE_COLUMNS]
+    return sorted(grades, key=_grade_sort_key)
@@ -0,0 +1,72 @@
+import re
+from typing import Dict, List
+
+# Kode mata kuliah: 2 huruf + 4 angka, diikuti huruf kapital atau spasi
+COURSE_CODE_RE = re.compile(r'([A-Z]{2}\d{4})(?=[A-Z\s])')
+# Semester, SKS, dan nilai; \s* membuat pola tidak terpengaruh panjang whitespace
+COURSE_DATA_RE = re.compile(r'(\d-\d{2}/\d{2})\s*(\d+)\s*([A-E]\+?)')
+NOISE_MARKERS = ('Kode', 'Mata Kuliah', 'SMT')
+
+
+def parse_courses(text: str) -> List[Dict[str, str]]:
+    """
+    Ekstrak data mata kuliah dari transkrip
+
+    Text dipotong per kode mata kuliah (fragment), lalu data semester/SKS/nilai
+    dicari dengan regex yang sudah di-compile langsung di text (batas pos/endpos),
+    tanpa re.sub per fragment; hanya nama mata kuliah yang dinormalisasi whitespace-nya.
+    """
+    courses = []
+    seen_courses = set()
+    data_search = COURSE_DATA_RE.search
+    text_len = len(text)
+
+    pending = None
+    for match in COURSE_CODE_RE.finditer(text):
+        if pending is not None:
+            _parse_fragment(text, pending, match.start(), data_search, courses, seen_courses)
+        pending = match
+    if pending is not None:
+        _parse_fragment(text, pending, text_len, data_search, courses, seen_courses)
+
+    return courses
+
+
+def _parse_fragment(text, code_match, end_pos, data_search, courses, seen_courses):
+    start_pos = code_match.end()
+    # Fragment yang sudah dibersihkan minimal 10 karakter; kalau raw-nya saja
+    # kurang dari itu pasti noise
+    if end_pos - start_pos < 10:
+        return
+
+    data_match = data_search(text, start_pos, end_pos)
+    if data_match is None:
+        return
+
+    # Nama mata kuliah adalah text sebelum semester, whitespace dirapikan
+    mata_kuliah = ' '.join(text[start_pos:data_match.start()].split())
+    if mata_kuliah.endswith('/'):
+        mata_kuliah = mata_kuliah[:-1].rstrip()
+
+    # Filter noise (nama >= 5 karakter juga menjamin fragment bersih >= 10 karakter)
+    if len(mata_kuliah) < 5:
+        return
+    for marker in NOISE_MARKERS:
+        if marker in mata_kuliah:
+            return
+
+    kode = code_match.group(1)
+    semester = data_match.group(1)
+    course_id = (kode, semester)
+    if course_id in seen_courses:
+        return
+
+    courses.append({
+        'Kode': kode,
+        'Mata_Kuliah': mata_kuliah,
+        'Semester': semester,
+        'SKS': int(data_match.group(2)),
+        'Nilai': data_match.group(3)
+    })
+    seen_courses.add(course_id)
+
@@ -0,0 +1,148 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class _Flight:
+    """Satu fetch upstream yang sedang berjalan; request lain menunggu hasilnya"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: Optional[Exception] = None
+
+
+class DashboardCache:
+    """
+    Cache in-process untuk data dashboard dari n8n
+
+    - Umur <= ttl: data langsung dipakai (HIT)
+    - ttl < umur <= ttl + max_stale: data lama dipakai dan satu refresh
+      berjalan di latar belakang (STALE, stale-while-revalidate)
+    - Belum ada data / lebih tua dari itu: fetch sinkron (MISS)
+
+    Fetch upstream di-coalesce: berapapun request yang datang bersamaan,
+    hanya ada satu fetch yang berjalan dan semuanya memakai hasil yang sama.
+    Jika fetch gagal dan masih ada data lama, data lama tetap dipakai.
+    """
+
+    def __init__(self, fetch: Callable[[], Any], ttl: float, max_stale: float):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self._value = None
+        self._fetched_at: Optional[float] = None
+        self._flight: Optional[_Flight] = None
+        self._counters = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'upstream_fetches': 0,
+            'upstream_errors': 0,
+            'background_refreshes': 0,
+        }
+        self._last_error: Optional[str] = None
+        self._last_fetch_seconds: Optional[float] = None
+
+    def get(self) -> Tuple[Any, float, str]:
+        """
+        Ambil data dashboard
+
+        Returns:
+            (value, umur data dalam detik, status "HIT" | "STALE" | "MISS")
+
+        Raises:
+            Exception dari fetch jika gagal dan belum ada data sama sekali
+        """
+        with self._lock:
+            age = self._age()
+            if age is not None and age <= self.ttl:
+                self._counters['hits'] += 1
+                return self._value, age, "HIT"
+            if age is not None and age <= self.ttl + self.max_stale:
+                self._counters['stale_hits'] += 1
+                flight, leader = self._join_flight()
+                if leader:
+                    self._counters['background_refreshes'] += 1
+                    threading.Thread(target=self._run_flight, args=(flight,), daemon=True,
+                                     name="dashboard-refresh").start()
+                return self._value, age, "STALE"
+            self._counters['misses'] += 1
+        return self._fetch_now()
+
+    def refresh(self) -> Tuple[Any, float, str]:
+        """Fetch sinkron (ikut fetch yang sedang berjalan jika ada), hasil sama dengan get()"""
+        return self._fetch_now()
+
+    def _fetch_now(self) -> Tuple[Any, float, str]:
+        with self._lock:
+            flight, leader = self._join_flight()
+            if not leader:
+                self._counters['coalesced'] += 1
+
+        if leader:
+            self._run_flight(flight)
+        else:
+            flight.done.wait()
+
+        with self._lock:
+            if flight.error is not None:
+                if self._value is None:
+                    raise flight.error
+                return self._value, self._age(), "STALE"
+            return self._value, self._age(), "MISS"
+
+    def invalidate(self):
+        """Tandai data sebagai kadaluarsa (request berikutnya akan me-refresh)"""
+        with self._lock:
+            if self._fetched_at is not None:
+                self._fetched_at = time.monotonic() - self.ttl - 1e-3
+
+    def stats(self) -> Dict:
+        with self._lock:
+            age = self._age()
+            counters = dict(self._counters)
+            refreshing = self._flight is not None
+        lookups = counters['hits'] + counters['stale_hits'] + counters['misses']
+        return {
+            **counters,
+            'hit_rate': round((counters['hits'] + counters['stale_hits']) / lookups, 4) if lookups else 0.0,
+            'age_seconds': round(age, 1) if age is not None else None,
+            'ttl_seconds': self.ttl,
+            'max_stale_seconds': self.max_stale,
+            'refreshing': refreshing,
+            'last_fetch_seconds': self._last_fetch_seconds,
+            'last_error': self._last_error,
+        }
+
+    def _age(self) -> Optional[float]:
+        return time.monotonic() - self._fetched_at if self._fetched_at is not None else None
+
+    def _join_flight(self) -> Tuple[_Flight, bool]:
+        """Ikut fetch yang sedang berjalan, atau mulai yang baru (leader=True). Dipanggil dengan lock."""
+        if self._flight is not None:
+            return self._flight, False
+        self._flight = _Flight()
+        self._counters['upstream_fetches'] += 1
+        return self._flight, True
+
+    def _run_flight(self, flight: _Flight):
+        start = time.perf_counter()
+        try:
+            value = self._fetch()
+            with self._lock:
+                self._value = value
+                self._fetched_at = time.monotonic()
+                self._last_error = None
+        except Exception as e:
+            print(f"⚠️ Refresh data dashboard gagal: {str(e)}")
+            flight.error = e
+            with self._lock:
+                self._counters['upstream_errors'] += 1
+                self._last_error = str(e)
+        finally:
+            with self._lock:
+                self._flight = None
+                self._last_fetch_seconds = round(time.perf_counter() - start, 3)
+            flight.done.set()
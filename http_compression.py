@@ -0,0 +1,83 @@
+import gzip
+import os
+import threading
+from typing import Dict, Optional
+
+# Kompresi response API: hanya untuk body >= MIN_BYTES dengan tipe di bawah ini
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", "6"))
+COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", "5"))
+COMPRESS_MIMETYPES = {'application/json', 'text/html', 'text/plain', 'text/css', 'application/javascript'}
+
+try:
+    # Ada di requirements.txt, tapi tetap opsional: tanpa brotli hanya gzip yang dipakai
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def compress_body(data: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=COMPRESS_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=COMPRESS_GZIP_LEVEL)
+
+
+def choose_encoding(accept_encoding) -> Optional[str]:
+    """Encoding terbaik yang diterima client: br (jika modul brotli ada), lalu gzip"""
+    if brotli is not None and accept_encoding['br']:
+        return 'br'
+    if accept_encoding['gzip']:
+        return 'gzip'
+    return None
+
+
+class ResponseCompressor:
+    """
+    Kompresi gzip/brotli untuk response Flask (after_request)
+
+    Response streaming (SSE) dan file dari send_from_directory dilewati.
+    ETag diubah menjadi weak karena byte body berbeda per encoding.
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {'compressed': 0, 'skipped': 0, 'bytes_in': 0, 'bytes_out': 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.after_request(self.after_request)
+
+    def after_request(self, response):
+        from flask import request
+
+        if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESS_MIMETYPES):
+            return response
+        response.vary.add('Accept-Encoding')
+        encoding = choose_encoding(request.accept_encodings)
+        data = response.get_data()
+        if encoding is None or len(data) < COMPRESS_MIN_BYTES:
+            with self._lock:
+                self._stats['skipped'] += 1
+            return response
+
+        compressed = compress_body(data, encoding)
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        with self._lock:
+            self._stats['compressed'] += 1
+            self._stats['bytes_in'] += len(data)
+            self._stats['bytes_out'] += len(compressed)
+        return response
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats['ratio'] = round(stats['bytes_out'] / stats['bytes_in'], 4) if stats['bytes_in'] else None
+        stats['encodings'] = ['br', 'gzip'] if brotli is not None else ['gzip']
+        return stats
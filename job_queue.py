@@ -0,0 +1,130 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Optional
+
+
+class JobQueue:
+    """
+    Antrian job latar belakang berbasis thread pool
+
+    Setiap job memiliki beberapa tahap (stage) yang progresnya bisa
+    di-update oleh fungsi job dan dibaca lewat get().
+
+    on_update (opsional) dipanggil dengan snapshot job setiap status/tahap berubah,
+    mis. untuk menyimpan status ke session store agar bisa dibaca worker lain.
+    """
+
+    def __init__(self, max_workers: int, stages: Iterable[str], retention_seconds: int = 3600,
+                 on_update: Optional[Callable[[Dict], None]] = None):
+        self.stages = tuple(stages)
+        self.retention_seconds = retention_seconds
+        self.on_update = on_update
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args, job_id: Optional[str] = None, **kwargs) -> str:
+        """
+        Masukkan job ke antrian. fn dipanggil sebagai fn(job_id, *args, **kwargs)
+        dan nilai kembaliannya disimpan sebagai result job.
+
+        job_id bisa dibuat lebih dulu (new_job_id) jika harus dicatat sebelum job berjalan.
+        """
+        self._prune()
+        job_id = job_id or self.new_job_id()
+        with self._lock:
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "status": "queued",
+                "created_at": datetime.now().isoformat(),
+                "started_at": None,
+                "finished_at": None,
+                "stages": {stage: {"status": "pending", "detail": None} for stage in self.stages},
+                "result": None,
+                "error": None,
+                "_finished_ts": None,
+                "_done": threading.Event(),
+            }
+        self._notify(job_id)
+        self._executor.submit(self._run, job_id, fn, args, kwargs)
+        return job_id
+
+    @staticmethod
+    def new_job_id() -> str:
+        return uuid.uuid4().hex
+
+    def set_stage(self, job_id: str, stage: str, status: str, detail=None):
+        """Update status satu tahap job (pending/running/done/failed)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job["stages"][stage] = {"status": status, "detail": detail}
+        self._notify(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Ambil snapshot status job, None jika tidak ditemukan"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            snapshot = {k: v for k, v in job.items() if not k.startswith("_")}
+            snapshot["stages"] = {k: dict(v) for k, v in job["stages"].items()}
+            return snapshot
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Tunggu job selesai (maksimal timeout detik) lalu kembalikan snapshot-nya.
+        None jika job tidak ditemukan; status tetap queued/running jika timeout.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        job["_done"].wait(timeout)
+        return self.get(job_id)
+
+    def _run(self, job_id: str, fn: Callable, args, kwargs):
+        with self._lock:
+            self._jobs[job_id]["status"] = "running"
+            self._jobs[job_id]["started_at"] = datetime.now().isoformat()
+        self._notify(job_id)
+        try:
+            result = fn(job_id, *args, **kwargs)
+            status, error = "success", None
+        except Exception as e:
+            print(f"❌ Job {job_id} gagal: {str(e)}")
+            result, status, error = None, "failed", str(e)
+        with self._lock:
+            job = self._jobs[job_id]
+            job["status"] = status
+            job["result"] = result
+            job["error"] = error
+            job["finished_at"] = datetime.now().isoformat()
+            job["_finished_ts"] = time.monotonic()
+        # Snapshot disimpan dulu sebelum job ditandai selesai (wait() langsung melihat hasil akhir)
+        self._notify(job_id)
+        job["_done"].set()
+
+    def _notify(self, job_id: str):
+        if self.on_update is None:
+            return
+        snapshot = self.get(job_id)
+        if snapshot is None:
+            return
+        try:
+            self.on_update(snapshot)
+        except Exception as e:
+            print(f"⚠️ Gagal menyimpan status job {job_id}: {str(e)}")
+
+    def _prune(self):
+        """Hapus job yang sudah selesai lebih lama dari retention_seconds"""
+        cutoff = time.monotonic() - self.retention_seconds
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job["_finished_ts"] is not None and job["_finished_ts"] < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
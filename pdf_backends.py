@@ -0,0 +1,111 @@
+import os
+from typing import Callable, Dict, List, Optional
+
+# Backend acuan; backend lain hanya dipakai jika hasil parse-nya sama dengan acuan
+PDF_BACKEND_REFERENCE = "pypdf2"
+# PDF contoh untuk verifikasi backend (transkrip asli dengan format SIA); path relatif
+# dihitung dari folder modul ini, bukan dari working directory proses
+PDF_BACKEND_SAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  os.getenv("PDF_BACKEND_SAMPLE", "[SIA PETRA] Transkrip.pdf"))
+
+
+def _pages_pypdf2(pdf_path: str) -> List[str]:
+    import PyPDF2
+
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return [page.extract_text() for page in pdf_reader.pages]
+
+
+def _pages_pypdfium2(pdf_path: str) -> List[str]:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            # pdfium memakai \r\n dan menandai tanda hubung di akhir baris dengan U+FFFE
+            text = textpage.get_text_range().replace('\r\n', '\n').replace('\ufffe', '-')
+            pages.append(text)
+            textpage.close()
+            page.close()
+        return pages
+    finally:
+        pdf.close()
+
+
+def _pages_pdfminer(pdf_path: str) -> List[str]:
+    from pdfminer.high_level import extract_text
+
+    # pdfminer memisahkan halaman dengan form feed
+    pages = extract_text(pdf_path).split('\f')
+    if pages and not pages[-1].strip():
+        pages.pop()
+    return pages
+
+
+PDF_BACKENDS: Dict[str, Callable[[str], List[str]]] = {
+    'pypdf2': _pages_pypdf2,
+    'pypdfium2': _pages_pypdfium2,
+    'pdfminer': _pages_pdfminer,
+}
+
+
+def extract_pdf_pages(pdf_path: str, backend: Optional[str] = None) -> List[str]:
+    """
+    Ekstrak teks per halaman dengan backend yang dipilih
+
+    Args:
+        pdf_path: Path file PDF
+        backend: Nama backend, default PDF_BACKEND dari environment
+
+    Returns:
+        List teks, satu item per halaman
+    """
+    name = backend or PDF_BACKEND
+    if name not in PDF_BACKENDS:
+        raise ValueError(f"PDF backend tidak dikenal: {name} (pilihan: {', '.join(PDF_BACKENDS)})")
+    return PDF_BACKENDS[name](pdf_path)
+
+
+def verify_backend(name: str, sample_pdf: str = PDF_BACKEND_SAMPLE) -> Optional[str]:
+    """
+    Bandingkan hasil parse_courses backend dengan backend acuan pada PDF contoh
+
+    Hasil harus identik (termasuk spasi di Mata_Kuliah, yang ikut dikirim ke webhook).
+
+    Returns:
+        None jika sama, selain itu alasan backend ditolak
+    """
+    from course_parser import parse_courses
+
+    if name not in PDF_BACKENDS:
+        return f"tidak dikenal (pilihan: {', '.join(PDF_BACKENDS)})"
+    if name == PDF_BACKEND_REFERENCE:
+        return None
+    if not os.path.exists(sample_pdf):
+        return f"PDF contoh {sample_pdf} tidak ada, backend tidak bisa diverifikasi"
+    try:
+        courses = parse_courses("\n".join(extract_pdf_pages(sample_pdf, name)))
+    except ImportError as e:
+        return f"library belum terpasang ({str(e)})"
+    expected = parse_courses("\n".join(extract_pdf_pages(sample_pdf, PDF_BACKEND_REFERENCE)))
+    if courses != expected:
+        differences = sum(1 for a, b in zip(courses, expected) if a != b) + abs(len(courses) - len(expected))
+        return (f"{len(courses)} mata kuliah (acuan {PDF_BACKEND_REFERENCE}: {len(expected)}), "
+                f"{differences} berbeda")
+    return None
+
+
+def resolve_backend(name: str) -> str:
+    """Backend yang benar-benar dipakai: name jika lolos verify_backend, selain itu backend acuan"""
+    reason = verify_backend(name)
+    if reason is not None:
+        print(f"⚠️ PDF backend {name} ditolak: {reason}. Memakai {PDF_BACKEND_REFERENCE}")
+        return PDF_BACKEND_REFERENCE
+    return name
+
+
+# Backend ekstraksi teks PDF: "pypdf2" (default), "pypdfium2", atau "pdfminer"
+PDF_BACKEND = resolve_backend(os.getenv("PDF_BACKEND", PDF_BACKEND_REFERENCE))
@@ -0,0 +1,44 @@
+import json
+import os
+from typing import Callable, Dict, Optional
+
+from result_cache import SQLiteCache, make_cache_key, sha256_file
+
+# Cache teks PDF dan hasil parse transkrip (key: SHA-256 isi PDF), LRU berbasis ukuran
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", "cache")
+PDF_CACHE_MAX_MB = int(os.getenv("PDF_CACHE_MAX_MB", "100"))
+
+pdf_text_cache = SQLiteCache(os.path.join(PDF_CACHE_DIR, "pdf_text.sqlite"),
+                             max_bytes=PDF_CACHE_MAX_MB * 1024 * 1024)
+transcript_cache = SQLiteCache(os.path.join(PDF_CACHE_DIR, "transcript_parse.sqlite"),
+                               max_bytes=PDF_CACHE_MAX_MB * 1024 * 1024)
+
+
+def cached_pdf_text(pdf_path: str, variant: str, extract: Callable[[str], Optional[str]]) -> Optional[str]:
+    """
+    Ambil teks PDF dari cache, atau jalankan extract(pdf_path) jika belum ada
+
+    Args:
+        pdf_path: Path file PDF
+        variant: Nama varian ekstraksi (hasil tiap extractor bisa berbeda format)
+        extract: Fungsi ekstraksi yang dipanggil saat cache miss
+    """
+    key = make_cache_key("pdf-text", variant, sha256_file(pdf_path))
+    text = pdf_text_cache.get(key)
+    if text is None:
+        text = extract(pdf_path)
+        if text is not None:
+            pdf_text_cache.set(key, text)
+    return text
+
+
+def get_cached_transcript(pdf_digest: str, variant: str) -> Optional[Dict]:
+    """Ambil hasil parse transkrip (dict) dari cache, None jika belum ada"""
+    value = transcript_cache.get(make_cache_key("transcript-parse", variant, pdf_digest))
+    return json.loads(value) if value is not None else None
+
+
+def set_cached_transcript(pdf_digest: str, variant: str, parsed: Dict):
+    """Simpan hasil parse transkrip (harus bisa di-serialize ke JSON)"""
+    transcript_cache.set(make_cache_key("transcript-parse", variant, pdf_digest),
+                         json.dumps(parsed, ensure_ascii=False))
@@ -1,24 +1,192 @@
 from dotenv import load_dotenv
 import os
+import random
+import re
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Optional, Tuple
 import google.generativeai as genai
-from google.generativeai import types
 import mimetypes
+from result_cache import SQLiteCache, make_cache_key, sha256_file
 
 load_dotenv()
 
+# Batas panggilan Gemini yang berjalan bersamaan dan per menit (global untuk semua session)
+GEMINI_MAX_INFLIGHT = int(os.getenv("GEMINI_MAX_INFLIGHT", "4"))
+GEMINI_REQUESTS_PER_MINUTE = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "30"))
+# Retry untuk error sementara (429/5xx): exponential backoff dengan jitter
+GEMINI_MAX_RETRIES = int(os.getenv("GEMINI_MAX_RETRIES", "3"))
+GEMINI_BACKOFF_BASE = float(os.getenv("GEMINI_BACKOFF_BASE", "2"))
+GEMINI_BACKOFF_MAX = float(os.getenv("GEMINI_BACKOFF_MAX", "30"))
+# Timeout satu request HTTP ke Gemini (detik); slot yang dipegang lebih lama dari ini dicatat di log
+GEMINI_REQUEST_TIMEOUT = float(os.getenv("GEMINI_REQUEST_TIMEOUT", "120"))
+# Batas waktu antre sebelum panggilan Gemini dimulai (detik)
+GEMINI_QUEUE_TIMEOUT = float(os.getenv("GEMINI_QUEUE_TIMEOUT", "300"))
+# Jumlah thread analisis dan timeout per video (detik, dihitung sejak panggilan dimulai)
+VIDEO_ANALYSIS_WORKERS = int(os.getenv("VIDEO_ANALYSIS_WORKERS", "8"))
+VIDEO_ANALYSIS_TIMEOUT = float(os.getenv("VIDEO_ANALYSIS_TIMEOUT", "180"))
 
-def analyze_video_confidence(video_path: str):
-    """Analisis video untuk mendeteksi apakah seseorang terlihat percaya diri."""
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+TRANSIENT_ERROR_MARKERS = ("429", "RESOURCE_EXHAUSTED", "UNAVAILABLE", "DEADLINE_EXCEEDED", "INTERNAL")
 
-    client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
 
-    with open(video_path, "rb") as f:
-        video_bytes = f.read()
+class GeminiRateLimiter:
+    """
+    Token bucket untuk membatasi request Gemini per menit sekaligus
+    jumlah request yang berjalan bersamaan. Mencatat antrean dan waktu tunggu.
+
+    Slot baru dilepas saat panggilannya selesai, sehingga jumlah panggilan yang
+    benar-benar berjalan tidak pernah melebihi max_concurrent. Slot yang dipegang
+    lebih lama dari request_timeout tidak diambil alih, hanya dicatat
+    (overrun_leases) karena biasanya timeout HTTP tidak bekerja.
+    """
+
+    def __init__(self, requests_per_minute: int, max_concurrent: int,
+                 request_timeout: float = GEMINI_REQUEST_TIMEOUT, queue_timeout: float = GEMINI_QUEUE_TIMEOUT):
+        self.requests_per_minute = requests_per_minute
+        self.max_concurrent = max_concurrent
+        self.request_timeout = request_timeout
+        self.queue_timeout = queue_timeout
+        self._tokens = float(requests_per_minute)
+        self._last_refill = time.monotonic()
+        self._leases: Dict[int, float] = {}
+        self._overrun: set = set()
+        self._next_lease = 0
+        self._waiting = 0
+        self._cond = threading.Condition()
+
+        self.total_requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.retries = 0
+        self.failures = 0
+        self.queue_timeouts = 0
+        self.overrun_leases = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        rate = self.requests_per_minute / 60.0
+        self._tokens = min(float(self.requests_per_minute), self._tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+
+    def _log_overrun_leases(self, now: float):
+        """Catat (sekali per slot) panggilan yang berjalan lebih lama dari request_timeout"""
+        for lease, expires_at in self._leases.items():
+            if expires_at <= now and lease not in self._overrun:
+                self._overrun.add(lease)
+                self.overrun_leases += 1
+                print(f"⚠️ Panggilan Gemini berjalan lebih dari {self.request_timeout:g} detik, "
+                      f"slot tetap dipegang sampai panggilan selesai")
+
+    @contextmanager
+    def slot(self):
+        """
+        Tunggu sampai ada token dan slot concurrency, lalu jalankan request
+
+        Raises:
+            TimeoutError: jika antre lebih dari queue_timeout detik
+        """
+        start = time.monotonic()
+        with self._cond:
+            self._waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill()
+                    self._log_overrun_leases(now)
+                    if self._tokens >= 1 and len(self._leases) < self.max_concurrent:
+                        self._tokens -= 1
+                        lease = self._next_lease
+                        self._next_lease += 1
+                        self._leases[lease] = now + self.request_timeout
+                        break
+                    remaining = start + self.queue_timeout - now
+                    if remaining <= 0:
+                        self.queue_timeouts += 1
+                        raise TimeoutError(f"antre slot Gemini lebih dari {self.queue_timeout:g} detik")
+                    # Bangun lagi saat token terisi, slot dilepas (notify), atau batas antre
+                    timeout = remaining
+                    if self._tokens < 1:
+                        timeout = min(timeout, (1 - self._tokens) * 60.0 / self.requests_per_minute)
+                    self._cond.wait(timeout=max(timeout, 0.01))
+            finally:
+                self._waiting -= 1
+            waited = time.monotonic() - start
+            self.total_requests += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._leases.pop(lease, None)
+                self._overrun.discard(lease)
+                self._cond.notify_all()
+
+    def record_retry(self):
+        with self._cond:
+            self.retries += 1
+
+    def record_failure(self):
+        with self._cond:
+            self.failures += 1
+
+    def stats(self) -> Dict:
+        """Statistik limiter untuk tuning: antrean, in-flight, waktu tunggu, retry"""
+        with self._cond:
+            self._refill()
+            self._log_overrun_leases(time.monotonic())
+            return {
+                'requests_per_minute': self.requests_per_minute,
+                'max_concurrent': self.max_concurrent,
+                'queue_depth': self._waiting,
+                'in_flight': len(self._leases),
+                'tokens_available': round(self._tokens, 2),
+                'total_requests': self.total_requests,
+                'avg_wait_seconds': round(self.total_wait / self.total_requests, 3) if self.total_requests else 0.0,
+                'max_wait_seconds': round(self.max_wait, 3),
+                'retries': self.retries,
+                'failures': self.failures,
+                'queue_timeouts': self.queue_timeouts,
+                'overrun_leases': self.overrun_leases
+            }
+
+
+gemini_limiter = GeminiRateLimiter(GEMINI_REQUESTS_PER_MINUTE, GEMINI_MAX_INFLIGHT)
+
+_gemini_model = None
+_gemini_model_lock = threading.Lock()
 
-    mime_type = mimetypes.guess_type(video_path)[0] or "video/webm"
 
-    # Prompt yang diperbagus dan terstruktur
-    prompt = """
+def get_gemini_model():
+    """Satu genai.GenerativeModel untuk seluruh proses (dibuat saat pertama dipakai)"""
+    global _gemini_model
+    with _gemini_model_lock:
+        if _gemini_model is None:
+            genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+            _gemini_model = genai.GenerativeModel(GEMINI_MODEL)
+        return _gemini_model
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Cek apakah error Gemini layak di-retry (quota / server sementara)"""
+    for attr in ("code", "status_code"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int) and value in TRANSIENT_STATUS_CODES:
+            return True
+    message = str(error)
+    return any(marker in message for marker in TRANSIENT_ERROR_MARKERS)
+
+
+# Model dan prompt ikut menjadi bagian key cache hasil analisis
+GEMINI_MODEL = "models/gemini-2.5-flash"
+
+# Prompt yang diperbagus dan terstruktur
+CONFIDENCE_PROMPT = """
             Kamu adalah analis komunikasi non-verbal yang menilai kepercayaan diri seseorang dalam interview.
             Analisis berdasarkan ekspresi wajah, kontak mata, gesture, posture, dan intonasi suara (jika ada suara).
 
@@ -35,22 +203,217 @@ def analyze_video_confidence(video_path: str):
             - Tidak boleh memberikan jawaban selain "ya" atau "tidak" pada bagian kesimpulan
             """
 
-    response = client.models.generate_content(
-        model="models/gemini-2.5-flash",
-        contents=types.Content(
-            parts=[
-                types.Part(
-                    inline_data=types.Blob(
-                        data=video_bytes,
-                        mime_type=mime_type
-                    )
-                ),
-                types.Part(text=prompt)
-            ]
-        )
-    )
-
-    return response.text
+# Mode payload video: "full" (file asli) atau "compact" (fps rendah, resolusi kecil, audio mono)
+VIDEO_ANALYSIS_MODE = os.getenv("VIDEO_ANALYSIS_MODE", "full")
+COMPACT_FPS = float(os.getenv("COMPACT_FPS", "1"))
+COMPACT_HEIGHT = int(os.getenv("COMPACT_HEIGHT", "360"))
+COMPACT_AUDIO_BITRATE = os.getenv("COMPACT_AUDIO_BITRATE", "32k")
+
+# Cache hasil analisis (key: SHA-256 video + model + prompt), LRU berbasis ukuran
+VIDEO_CACHE_PATH = os.getenv("VIDEO_CACHE_PATH", os.path.join("cache", "video_analysis.sqlite"))
+VIDEO_CACHE_MAX_MB = int(os.getenv("VIDEO_CACHE_MAX_MB", "50"))
+
+video_cache = SQLiteCache(VIDEO_CACHE_PATH, max_bytes=VIDEO_CACHE_MAX_MB * 1024 * 1024)
+
+
+def get_ffmpeg_exe() -> str:
+    """Path ffmpeg: dari imageio-ffmpeg jika ada, fallback ke ffmpeg di PATH"""
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except ImportError:
+        return "ffmpeg"
+
+
+def build_compact_video(video_path: str) -> bytes:
+    """
+    Buat representasi ringkas video untuk Gemini: frame disampling pada COMPACT_FPS,
+    diperkecil ke tinggi COMPACT_HEIGHT, dan audio mono bitrate rendah.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = os.path.join(tmp_dir, "compact.mp4")
+        command = [
+            get_ffmpeg_exe(), "-y", "-loglevel", "error",
+            "-i", video_path,
+            "-vf", f"fps={COMPACT_FPS},scale=-2:{COMPACT_HEIGHT}",
+            "-c:v", "libx264", "-preset", "veryfast", "-crf", "30",
+            "-ac", "1", "-ar", "16000", "-c:a", "aac", "-b:a", COMPACT_AUDIO_BITRATE,
+            output_path
+        ]
+        subprocess.run(command, check=True, capture_output=True, timeout=120)
+        with open(output_path, "rb") as f:
+            return f.read()
+
+
+def video_mode_signature(mode: str) -> str:
+    """Parameter mode yang ikut menentukan hasil analisis (untuk key cache)"""
+    if mode == "compact":
+        return f"compact:fps={COMPACT_FPS}:h={COMPACT_HEIGHT}:a={COMPACT_AUDIO_BITRATE}"
+    return "full"
+
+
+def prepare_video_payload(video_path: str, mode: str = VIDEO_ANALYSIS_MODE) -> Tuple[bytes, str, str]:
+    """
+    Siapkan bytes dan mime type yang dikirim ke Gemini sesuai mode
+
+    Returns:
+        (bytes, mime type, mode yang benar-benar dipakai). Jika ffmpeg tidak ada/gagal,
+        mode compact jatuh ke "full" (file asli).
+    """
+    if mode == "compact":
+        try:
+            return build_compact_video(video_path), "video/mp4", "compact"
+        except Exception as e:
+            print(f"⚠️ Gagal membuat video compact, fallback ke mode full (video asli): {str(e)}")
+
+    with open(video_path, "rb") as f:
+        video_bytes = f.read()
+    return video_bytes, mimetypes.guess_type(video_path)[0] or "video/webm", "full"
+
+
+def request_gemini_analysis(video_bytes: bytes, mime_type: str,
+                            on_start: Optional[Callable[[], None]] = None) -> str:
+    """
+    Kirim video ke Gemini lewat rate limiter dan kembalikan teks analisis.
+    Error sementara di-retry dengan exponential backoff + jitter.
+    """
+    model = get_gemini_model()
+    contents = [
+        {"mime_type": mime_type, "data": video_bytes},
+        CONFIDENCE_PROMPT
+    ]
+
+    for attempt in range(GEMINI_MAX_RETRIES + 1):
+        try:
+            with gemini_limiter.slot():
+                if on_start and attempt == 0:
+                    on_start()
+                # Timeout per request (detik); tanpa ini panggilan yang hang tidak pernah selesai
+                response = model.generate_content(contents, request_options={"timeout": GEMINI_REQUEST_TIMEOUT})
+            return response.text
+        except Exception as e:
+            if attempt >= GEMINI_MAX_RETRIES or not is_transient_error(e):
+                gemini_limiter.record_failure()
+                raise
+            gemini_limiter.record_retry()
+            delay = min(GEMINI_BACKOFF_MAX, GEMINI_BACKOFF_BASE * (2 ** attempt))
+            delay = random.uniform(0, delay)
+            print(f"⚠️ Gemini error sementara, retry {attempt + 1}/{GEMINI_MAX_RETRIES} dalam {delay:.1f} detik: {str(e)}")
+            time.sleep(delay)
+
+
+def analyze_video_confidence(video_path: str, on_start: Optional[Callable[[], None]] = None):
+    """
+    Analisis video untuk mendeteksi apakah seseorang terlihat percaya diri.
+    Hasil di-cache berdasarkan isi video; on_start dipanggil tepat sebelum
+    request ke Gemini dimulai (setelah lolos rate limiter).
+    """
+
+    video_hash = sha256_file(video_path)
+
+    def cache_key_for(mode: str) -> str:
+        return make_cache_key(video_hash, GEMINI_MODEL, CONFIDENCE_PROMPT, video_mode_signature(mode))
+
+    cache_key = cache_key_for(VIDEO_ANALYSIS_MODE)
+    cached = video_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    video_bytes, mime_type, used_mode = prepare_video_payload(video_path, VIDEO_ANALYSIS_MODE)
+    if used_mode != VIDEO_ANALYSIS_MODE:
+        # Fallback: hasil disimpan di bawah mode yang benar-benar dikirim ke Gemini
+        cache_key = cache_key_for(used_mode)
+        cached = video_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    result = request_gemini_analysis(video_bytes, mime_type, on_start=on_start)
+
+    if result:
+        video_cache.set(cache_key, result)
+    return result
+
+
+class AnalysisTask:
+    """Handle untuk satu analisis video yang sedang/akan berjalan"""
+
+    def __init__(self, video_path: str):
+        self.video_path = video_path
+        self.submitted_at = time.monotonic()
+        self.started = threading.Event()
+        self.started_at = None
+        self.future = None
+
+
+class VideoAnalysisExecutor:
+    """
+    Menjalankan analyze_video_confidence secara paralel.
+    Panggilan Gemini dibatasi gemini_limiter (GEMINI_MAX_INFLIGHT dan
+    GEMINI_REQUESTS_PER_MINUTE, lintas semua session), dan setiap panggilan
+    punya timeout sendiri. Waktu antre juga dibatasi queue_timeout, jadi satu
+    video ditunggu paling lama queue_timeout + timeout.
+    """
+
+    def __init__(self, max_workers: int = VIDEO_ANALYSIS_WORKERS, timeout: float = VIDEO_ANALYSIS_TIMEOUT,
+                 queue_timeout: float = GEMINI_QUEUE_TIMEOUT):
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="video-analysis")
+
+    def submit(self, video_path: str) -> AnalysisTask:
+        """Jadwalkan analisis satu video, kembalikan AnalysisTask"""
+        task = AnalysisTask(video_path)
+        task.future = self._executor.submit(self._run, task)
+        return task
+
+    def _run(self, task: AnalysisTask) -> str:
+        def mark_started():
+            task.started_at = time.monotonic()
+            task.started.set()
+
+        return analyze_video_confidence(task.video_path, on_start=mark_started)
+
+    def result(self, task: AnalysisTask) -> str:
+        """
+        Tunggu hasil analisis. Waktu antre (thread pool + rate limiter) dibatasi
+        queue_timeout, panggilan Gemini dibatasi timeout sejak mulai.
+        Error dan timeout dikembalikan sebagai teks agar tetap masuk payload.
+        """
+        deadline = task.submitted_at + self.queue_timeout + self.timeout
+        try:
+            # Tunggu sampai panggilan benar-benar mulai (atau selesai karena error/cache)
+            queue_deadline = task.submitted_at + self.queue_timeout
+            while not task.started.is_set() and not task.future.done():
+                remaining = queue_deadline - time.monotonic()
+                if remaining <= 0:
+                    return f"Error analisis video: antre lebih dari {self.queue_timeout:.0f} detik"
+                task.started.wait(timeout=min(1.0, remaining))
+            if task.started_at is not None:
+                deadline = min(deadline, task.started_at + self.timeout)
+            return task.future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeoutError:
+            return f"Error analisis video: timeout setelah {self.timeout:.0f} detik"
+        except Exception as analysis_error:
+            return f"Error analisis video: {str(analysis_error)}"
+
+    def analyze_all(self, videos: Dict[str, str]) -> Dict[str, str]:
+        """
+        Analisis banyak video sekaligus.
+        videos: {"pertanyaan_N": path} -> {"analisis_pertanyaan_N": teks}, urut nomor pertanyaan
+        """
+        return self.collect({key: self.submit(path) for key, path in videos.items()})
+
+    def collect(self, tasks: Dict[str, AnalysisTask]) -> Dict[str, str]:
+        """Tunggu task yang masih berjalan dan gabungkan hasilnya urut nomor pertanyaan"""
+        return {
+            f"analisis_{key}": self.result(tasks[key])
+            for key in sorted(tasks.keys(), key=question_sort_key)
+        }
+
+
+def question_sort_key(key: str):
+    """Urutkan key "pertanyaan_N" berdasarkan angka N"""
+    match = re.search(r'(\d+)$', key)
+    return (int(match.group(1)) if match else 0, key)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,123 @@
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from urllib.parse import urlparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 import pandas as pd
 from typing import Dict, List, Optional
 
+from result_cache import SQLiteCache, make_cache_key
+from skkk_parsers import parse_skkk_table
+
+SKKK_URL = os.getenv("SKKK_URL", "http://sportfolio.petra.ac.id/bakabootsrap/baka/skkk.php")
+SKKK_ORIGIN = "http://sportfolio.petra.ac.id"
+SKKK_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/119.0 Safari/537.36",
+    "Referer": SKKK_URL,
+    "Origin": SKKK_ORIGIN,
+}
+
+# Session HTTP bersama (keep-alive), ukuran pool = jumlah koneksi paralel ke sportfolio
+SKKK_POOL_SIZE = int(os.getenv("SKKK_POOL_SIZE", "8"))
+SKKK_CONNECT_TIMEOUT = float(os.getenv("SKKK_CONNECT_TIMEOUT", "5"))
+SKKK_READ_TIMEOUT = float(os.getenv("SKKK_READ_TIMEOUT", "10"))
+# GET awal ke halaman form (untuk cookie): auto = hanya jika session belum punya cookie
+# atau POST tidak mengembalikan tabel, always = selalu (perilaku lama), never = tidak pernah
+SKKK_WARMUP = os.getenv("SKKK_WARMUP", "auto")
+# Maksimal request bersamaan ke satu host (berlaku untuk app dan scraping massal)
+SKKK_MAX_PER_HOST = int(os.getenv("SKKK_MAX_PER_HOST", "4"))
+# Jumlah thread default untuk scrape_skkk_bulk
+SKKK_BULK_WORKERS = int(os.getenv("SKKK_BULK_WORKERS", "8"))
+
+_skkk_session = None
+_skkk_session_lock = threading.Lock()
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+# Cache hasil scraping SKKK per NRP (persisten, dengan TTL)
+SKKK_CACHE_PATH = os.getenv("SKKK_CACHE_PATH", os.path.join("cache", "skkk.sqlite"))
+SKKK_CACHE_MAX_MB = int(os.getenv("SKKK_CACHE_MAX_MB", "20"))
+# TTL dalam detik (default 6 jam)
+SKKK_CACHE_TTL = int(os.getenv("SKKK_CACHE_TTL", "21600"))
+# TTL untuk NRP yang tidak ditemukan (default 10 menit), agar NRP salah tidak di-scrape terus
+SKKK_NEGATIVE_CACHE_TTL = int(os.getenv("SKKK_NEGATIVE_CACHE_TTL", "600"))
+# Naikkan versi ini jika format hasil scrape_skkk_data berubah agar cache lama tidak dipakai
+SKKK_CACHE_VERSION = "v2"
+
+skkk_cache = SQLiteCache(SKKK_CACHE_PATH, max_bytes=SKKK_CACHE_MAX_MB * 1024 * 1024)
+
+_skkk_cache_lock = threading.Lock()
+_skkk_cache_counters = {
+    'lookups': 0,
+    'fresh_hits': 0,
+    'negative_hits': 0,
+    'expired': 0,
+    'forced_refreshes': 0,
+    'refresh_failures': 0,
+    'stale_served': 0,
+    'served': 0,
+    'served_age_total': 0.0,
+    'served_age_max': 0.0,
+}
+
+
+def get_skkk_session() -> requests.Session:
+    """Session HTTP bersama untuk sportfolio (dibuat sekali, koneksi dipakai ulang)"""
+    global _skkk_session
+    if _skkk_session is None:
+        with _skkk_session_lock:
+            if _skkk_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=SKKK_POOL_SIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(SKKK_HEADERS)
+                _skkk_session = session
+    return _skkk_session
+
+
+@contextmanager
+def _host_slot(url: str):
+    """Batasi jumlah request bersamaan per host ke SKKK_MAX_PER_HOST"""
+    host = urlparse(url).netloc
+    with _skkk_session_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(SKKK_MAX_PER_HOST)
+    with slot:
+        yield
+
+
+def _fetch_skkk_table(nrp: str):
+    """POST form SKKK dan kembalikan (headers, rows) tabel id='example' (None jika tidak ada)"""
+    session = get_skkk_session()
+    timeout = (SKKK_CONNECT_TIMEOUT, SKKK_READ_TIMEOUT)
+    payload = {"nrp": nrp, "Submit": "Submit"}
+
+    with _host_slot(SKKK_URL):
+        warmed_up = SKKK_WARMUP == "always" or (SKKK_WARMUP == "auto" and not session.cookies)
+        if warmed_up:
+            session.get(SKKK_URL, timeout=timeout)
+
+        table = _post_skkk_form(session, payload, timeout)
+        if table is None and not warmed_up and SKKK_WARMUP == "auto":
+            # Tabel tidak ada: mungkin cookie session kadaluarsa, ulangi sekali dengan GET awal
+            session.get(SKKK_URL, timeout=timeout)
+            table = _post_skkk_form(session, payload, timeout)
+    return table
+
+
+def _post_skkk_form(session: requests.Session, payload: Dict, timeout):
+    r = session.post(SKKK_URL, data=payload, allow_redirects=True, timeout=timeout)
+
+    # Parsing hasil POST, cari tabel SKKK Non Wajib (id='example')
+    return parse_skkk_table(r.text)
+
 
 def scrape_skkk_data(nrp: str) -> Dict:
     """
@@ -14,56 +129,26 @@ def scrape_skkk_data(nrp: str) -> Dict:
     Returns:
         Dictionary berisi:
         - success: bool
-        - data: list of dict (jika berhasil)
+        - data: list of dict (jika berhasil), key = header tabel yang dinormalisasi,
+          kolom No bertipe int dan SKKK/Poin bertipe float
         - total_activities: int
         - error: str (jika gagal)
+        - not_found: True jika sportfolio menjawab tapi tabel SKKK tidak ada
     """
     try:
-        url = "http://sportfolio.petra.ac.id/bakabootsrap/baka/skkk.php"
-        payload = {"nrp": nrp, "Submit": "Submit"}
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                          "(KHTML, like Gecko) Chrome/119.0 Safari/537.36",
-            "Referer": url,
-            "Origin": "http://sportfolio.petra.ac.id",
-        }
-
-        # Request ke website
-        s = requests.Session()
-        s.get(url, headers=headers)
-        r = s.post(url, data=payload, headers=headers, allow_redirects=True, timeout=10)
-
-        # Parsing hasil POST
-        soup = BeautifulSoup(r.text, "html.parser")
+        table = _fetch_skkk_table(nrp)
 
-        # Cari tabel SKKK Non Wajib (id='example')
-        table = soup.find("table", id="example")
-
-        if not table:
+        if table is None:
             return {
                 "success": False,
                 "error": "Tabel SKKK tidak ditemukan. Mungkin NRP tidak valid atau tidak ada data SKKK.",
                 "data": [],
-                "total_activities": 0
+                "total_activities": 0,
+                "not_found": True
             }
 
-        # Extract headers
-        header_elements = table.find("thead").find_all("th")
-        headers = [th.get_text(strip=True) for th in header_elements]
-
-        # Extract rows
-        rows = []
-        for tr in table.find("tbody").find_all("tr"):
-            cols = [td.get_text(strip=True) for td in tr.find_all("td")]
-            if cols:
-                rows.append(cols)
-
-        # Convert ke list of dictionaries
-        skkk_data = []
-        for row in rows:
-            if len(row) == len(headers):
-                skkk_data.append(dict(zip(headers, row)))
+        # Header sudah dinormalisasi, baris sudah bertipe (lihat skkk_parsers)
+        headers, skkk_data = table
 
         return {
             "success": True,
@@ -95,6 +180,105 @@ def scrape_skkk_data(nrp: str) -> Dict:
         }
 
 
+def scrape_skkk_cached(nrp: str, force_refresh: bool = False, ttl: Optional[int] = None) -> Dict:
+    """
+    scrape_skkk_data dengan cache persisten per NRP
+
+    - Entry yang umurnya <= ttl langsung dipakai tanpa request ke sportfolio
+    - Entry kadaluarsa (atau force_refresh=True) di-scrape ulang; jika scraping
+      gagal, data lama tetap dikembalikan (stale) bersama error refresh-nya
+    - Hasil yang berhasil disimpan dengan ttl; NRP yang tidak ditemukan disimpan
+      terpisah dengan SKKK_NEGATIVE_CACHE_TTL sehingga tidak di-scrape (GET+POST)
+      ulang setiap kali. Error jaringan/timeout tidak disimpan.
+
+    Returns:
+        Format sama dengan scrape_skkk_data, ditambah key "cache":
+        {"status": "hit" | "negative_hit" | "miss" | "refreshed" | "stale", "age_seconds": float, ...}
+    """
+    ttl = SKKK_CACHE_TTL if ttl is None else ttl
+    key = make_cache_key("skkk", SKKK_CACHE_VERSION, nrp)
+    negative_key = make_cache_key("skkk-not-found", SKKK_CACHE_VERSION, nrp)
+    events = ['forced_refreshes'] if force_refresh else []
+
+    cached = None
+    negative = None
+    if not force_refresh:
+        cached = skkk_cache.get_with_age(key)
+        if cached is not None:
+            if cached[1] <= ttl:
+                _record_skkk_lookup(events + ['fresh_hits'], cached[1])
+                return {**json.loads(cached[0]), "cache": {"status": "hit", "age_seconds": round(cached[1], 1)}}
+            events.append('expired')
+        negative = skkk_cache.get_with_age(negative_key)
+        if negative is not None and negative[1] > SKKK_NEGATIVE_CACHE_TTL:
+            negative = None
+
+    if negative is not None:
+        # NRP ini baru saja dicek dan tidak ditemukan, pakai jawaban itu tanpa request ke sportfolio
+        result = json.loads(negative[0])
+        events.append('negative_hits')
+    else:
+        result = scrape_skkk_data(nrp)
+        if result.get("success"):
+            skkk_cache.set(key, json.dumps(result, ensure_ascii=False))
+            skkk_cache.delete(negative_key)
+            _record_skkk_lookup(events, 0.0)
+            status = "refreshed" if cached is not None or force_refresh else "miss"
+            return {**result, "cache": {"status": status, "age_seconds": 0.0}}
+        if result.get("not_found"):
+            skkk_cache.set(negative_key, json.dumps(result, ensure_ascii=False))
+        events.append('refresh_failures')
+
+    if cached is None and force_refresh:
+        cached = skkk_cache.get_with_age(key)
+    if cached is not None:
+        # Refresh gagal, pakai data lama daripada tidak ada data sama sekali
+        _record_skkk_lookup(events + ['stale_served'], cached[1])
+        return {
+            **json.loads(cached[0]),
+            "cache": {"status": "stale", "age_seconds": round(cached[1], 1), "refresh_error": result.get("error")}
+        }
+
+    _record_skkk_lookup(events, None)
+    if negative is not None:
+        return {**result, "cache": {"status": "negative_hit", "age_seconds": round(negative[1], 1)}}
+    return {**result, "cache": {"status": "miss", "age_seconds": None}}
+
+
+def _record_skkk_lookup(events: List[str], served_age: Optional[float]):
+    with _skkk_cache_lock:
+        _skkk_cache_counters['lookups'] += 1
+        for event in events:
+            _skkk_cache_counters[event] += 1
+        if served_age is not None:
+            _skkk_cache_counters['served'] += 1
+            _skkk_cache_counters['served_age_total'] += served_age
+            _skkk_cache_counters['served_age_max'] = max(_skkk_cache_counters['served_age_max'], served_age)
+
+
+def skkk_cache_stats() -> Dict:
+    """Statistik cache SKKK: hit rate data segar, stale, kegagalan refresh, dan umur data yang disajikan"""
+    with _skkk_cache_lock:
+        counters = dict(_skkk_cache_counters)
+    lookups = counters['lookups']
+    served = counters['served']
+    return {
+        **skkk_cache.stats(),
+        'ttl_seconds': SKKK_CACHE_TTL,
+        'lookups': lookups,
+        'fresh_hits': counters['fresh_hits'],
+        'fresh_hit_rate': round(counters['fresh_hits'] / lookups, 4) if lookups else 0.0,
+        'negative_ttl_seconds': SKKK_NEGATIVE_CACHE_TTL,
+        'negative_hits': counters['negative_hits'],
+        'expired': counters['expired'],
+        'forced_refreshes': counters['forced_refreshes'],
+        'refresh_failures': counters['refresh_failures'],
+        'stale_served': counters['stale_served'],
+        'avg_served_age_seconds': round(counters['served_age_total'] / served, 1) if served else 0.0,
+        'max_served_age_seconds': round(counters['served_age_max'], 1),
+    }
+
+
 def save_skkk_to_csv(skkk_data: List[Dict], output_path: str = "skkk_non_wajib.csv") -> bool:
     """
     Simpan data SKKK ke file CSV
@@ -120,11 +304,221 @@ def save_skkk_to_csv(skkk_data: List[Dict], output_path: str = "skkk_non_wajib.c
         return False
 
 
+def read_nrp_list(source: str) -> List[str]:
+    """
+    Daftar NRP dari file (satu NRP per baris, atau CSV dengan kolom NRP)
+    atau dari string dipisah koma. Duplikat dan baris kosong/komentar (#) dibuang.
+    """
+    if os.path.isfile(source):
+        with open(source, encoding='utf-8-sig') as f:
+            lines = [line.strip() for line in f]
+        if lines and 'NRP' in [column.strip() for column in lines[0].split(',')]:
+            with open(source, encoding='utf-8-sig', newline='') as f:
+                values = [row.get('NRP', '') for row in csv.DictReader(f)]
+        else:
+            values = lines
+    else:
+        values = source.split(',')
+
+    nrps = []
+    seen = set()
+    for value in values:
+        nrp = value.strip().upper()
+        if nrp and not nrp.startswith('#') and nrp not in seen:
+            seen.add(nrp)
+            nrps.append(nrp)
+    return nrps
+
+
+def load_skkk_checkpoint(checkpoint_path: str) -> Dict[str, Dict]:
+    """Baca checkpoint scraping massal: {NRP: entry terakhir}"""
+    done = {}
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Baris terakhir bisa terpotong jika proses dihentikan paksa
+                    continue
+                done[entry['nrp']] = entry
+    return done
+
+
+class _SKKKCsvOutput:
+    """Tulis baris SKKK ke CSV secara streaming (format sama dengan save_skkk_to_csv + kolom NRP)"""
+
+    def __init__(self, output_path: str, resume: bool):
+        self.output_path = output_path
+        self._file = None
+        self._writer = None
+        self._append = resume and os.path.exists(output_path) and os.path.getsize(output_path) > 0
+
+    def write(self, nrp: str, result: Dict):
+        if not result.get('data'):
+            return
+        if self._writer is None:
+            fields = ['NRP'] + result.get('headers', list(result['data'][0].keys()))
+            if self._append:
+                with open(self.output_path, encoding='utf-8-sig', newline='') as f:
+                    fields = next(csv.reader(f))
+            self._file = open(self.output_path, 'a' if self._append else 'w', newline='', encoding='utf-8-sig')
+            self._writer = csv.DictWriter(self._file, fieldnames=fields, extrasaction='ignore')
+            if not self._append:
+                self._writer.writeheader()
+        self._writer.writerows({'NRP': nrp, **row} for row in result['data'])
+        self._file.flush()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+
+
+class _SKKKParquetOutput:
+    """
+    Tulis baris SKKK ke direktori Parquet; tiap run membuat file part baru
+    sehingga run lanjutan (resume) tidak menimpa hasil sebelumnya
+    """
+
+    def __init__(self, output_dir: str, resume: bool, flush_every: int = 200):
+        import glob
+
+        import pyarrow.parquet as pq
+
+        self._pq = pq
+        os.makedirs(output_dir, exist_ok=True)
+        if not resume:
+            for old_part in glob.glob(os.path.join(output_dir, "part-*.parquet")):
+                os.remove(old_part)
+        self.path = os.path.join(output_dir, f"part-{time.strftime('%Y%m%d_%H%M%S')}-{os.getpid()}.parquet")
+        self.flush_every = flush_every
+        self._rows: List[Dict] = []
+        self._writer = None
+
+    def write(self, nrp: str, result: Dict):
+        self._rows.extend({'NRP': nrp, **row} for row in result.get('data', []))
+        if len(self._rows) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        import pyarrow as pa
+
+        if not self._rows:
+            return
+        if self._writer is None:
+            table = pa.Table.from_pylist(self._rows)
+            self._writer = self._pq.ParquetWriter(self.path, table.schema)
+        else:
+            schema = self._writer.schema
+            table = pa.Table.from_pylist([{name: row.get(name) for name in schema.names} for row in self._rows],
+                                         schema=schema)
+        self._writer.write_table(table)
+        self._rows.clear()
+
+    def close(self):
+        self.flush()
+        if self._writer:
+            self._writer.close()
+
+
+def scrape_skkk_bulk(nrps: List[str], output_path: str, output_format: str = 'csv',
+                     workers: Optional[int] = None, checkpoint_path: Optional[str] = None,
+                     resume: bool = True, use_cache: bool = True) -> Dict:
+    """
+    Scrape SKKK banyak NRP secara paralel (thread pool, dibatasi SKKK_MAX_PER_HOST per host)
+
+    Hasil ditulis langsung ke output_path (CSV, atau direktori Parquet jika
+    output_format='parquet') begitu tiap NRP selesai. NRP yang selesai dicatat
+    di checkpoint (JSON lines); saat dijalankan ulang dengan resume=True, NRP yang
+    sudah berhasil dilewati dan yang gagal dicoba lagi.
+
+    Returns:
+        Ringkasan: total, skipped, success, failed, activities, failed_nrps
+    """
+    checkpoint_path = checkpoint_path or f"{output_path.rstrip(os.sep)}.checkpoint.jsonl"
+    if not resume and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    done = load_skkk_checkpoint(checkpoint_path) if resume else {}
+    pending = [nrp for nrp in nrps if not done.get(nrp, {}).get('success')]
+    scrape = scrape_skkk_cached if use_cache else scrape_skkk_data
+
+    output = _SKKKParquetOutput(output_path, resume) if output_format == 'parquet' else _SKKKCsvOutput(output_path, resume)
+    summary = {'total': len(nrps), 'skipped': len(nrps) - len(pending), 'success': 0, 'failed': 0,
+               'activities': 0, 'failed_nrps': []}
+    print(f"=== Scraping SKKK massal: {len(pending)} NRP ({summary['skipped']} sudah selesai di checkpoint), "
+          f"{workers or SKKK_BULK_WORKERS} thread, maks {SKKK_MAX_PER_HOST} request/host ===")
+
+    start = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=workers or SKKK_BULK_WORKERS, thread_name_prefix="skkk")
+    try:
+        with open(checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+            futures = {executor.submit(scrape, nrp): nrp for nrp in pending}
+            for count, future in enumerate(as_completed(futures), 1):
+                nrp = futures[future]
+                result = future.result()
+                if result.get('success'):
+                    output.write(nrp, result)
+                    summary['success'] += 1
+                    summary['activities'] += result.get('total_activities', 0)
+                    status = f"[OK] {nrp}: {result.get('total_activities', 0)} kegiatan"
+                else:
+                    summary['failed'] += 1
+                    summary['failed_nrps'].append(nrp)
+                    status = f"[X] {nrp}: {result.get('error')}"
+
+                # Checkpoint ditulis setelah output agar NRP yang tercatat pasti sudah tersimpan
+                checkpoint.write(json.dumps({
+                    'nrp': nrp,
+                    'success': bool(result.get('success')),
+                    'total_activities': result.get('total_activities', 0),
+                    'error': result.get('error'),
+                }) + "\n")
+                checkpoint.flush()
+
+                elapsed = time.perf_counter() - start
+                print(f"[{count}/{len(pending)}] {count / elapsed:5.1f} NRP/s | {status}")
+    except KeyboardInterrupt:
+        print(f"\n⚠️ Dihentikan. Jalankan ulang dengan perintah yang sama untuk melanjutkan dari {checkpoint_path}")
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown(wait=False)
+        output.close()
+
+    print(f"✅ Selesai: {summary['success']} berhasil, {summary['failed']} gagal, "
+          f"{summary['activities']} kegiatan dalam {time.perf_counter() - start:.1f} detik")
+    return summary
+
+
 # Untuk testing langsung dari command line
 if __name__ == "__main__":
-    # Hardcoded NRP untuk testing
-    test_nrp = "C14220062"
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scraper SKKK Non Wajib sportfolio")
+    parser.add_argument("nrp", nargs="?", default="C14220062", help="NRP untuk scraping tunggal")
+    parser.add_argument("--bulk", metavar="FILE_ATAU_DAFTAR",
+                        help="File daftar NRP (per baris / CSV kolom NRP) atau NRP dipisah koma")
+    parser.add_argument("--output", default="skkk_non_wajib.csv",
+                        help="File CSV output (atau direktori jika --format parquet)")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv", help="Format output mode massal")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"Jumlah thread mode massal (default: {SKKK_BULK_WORKERS})")
+    parser.add_argument("--checkpoint", default=None, help="File checkpoint (default: <output>.checkpoint.jsonl)")
+    parser.add_argument("--restart", action="store_true", help="Abaikan checkpoint dan mulai dari awal")
+    parser.add_argument("--no-cache", action="store_true", help="Selalu scrape ulang tanpa cache SKKK")
+    args = parser.parse_args()
+
+    if args.bulk:
+        nrps = read_nrp_list(args.bulk)
+        try:
+            scrape_skkk_bulk(nrps, args.output, output_format=args.format, workers=args.workers,
+                             checkpoint_path=args.checkpoint, resume=not args.restart,
+                             use_cache=not args.no_cache)
+        except KeyboardInterrupt:
+            raise SystemExit(130)
+        raise SystemExit(0)
 
+    test_nrp = args.nrp
     print(f"=== Scraping SKKK untuk NRP: {test_nrp} ===\n")
     result = scrape_skkk_data(test_nrp)
 
@@ -136,6 +530,6 @@ if __name__ == "__main__":
         print(df)
 
         # Simpan ke CSV
-        save_skkk_to_csv(result["data"])
+        save_skkk_to_csv(result["data"], args.output)
     else:
         print(f"❌ Gagal: {result['error']}")
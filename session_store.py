@@ -0,0 +1,449 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Backend penyimpanan session interview: "sqlite" (default, bisa dipakai beberapa worker
+# gunicorn sekaligus), "redis" (server Redis/kompatibel), atau "memory" (dev, satu proses)
+SESSION_STORE = os.getenv("SESSION_STORE", "sqlite")
+SESSION_STORE_PATH = os.getenv("SESSION_STORE_PATH", os.path.join("sessions", "sessions.sqlite"))
+SESSION_STORE_REDIS_URL = os.getenv("SESSION_STORE_REDIS_URL", "redis://localhost:6379/0")
+SESSION_STORE_REDIS_PREFIX = os.getenv("SESSION_STORE_REDIS_PREFIX", "hr-interview")
+
+# Session (dan status job) yang tidak aktif lebih lama dari TTL dihapus; jika jumlah session
+# melebihi MAX_SESSIONS, session yang paling lama tidak aktif dihapus lebih dulu
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "86400"))
+SESSION_MAX_SESSIONS = int(os.getenv("SESSION_MAX_SESSIONS", "500"))
+
+# Namespace data per session (pengganti dict modul di app.py)
+NS_CANDIDATE = "candidate"      # data kandidat: CV, transkrip akademik, SKKK
+NS_TRANSCRIPTS = "transcripts"  # transkrip jawaban per pertanyaan
+NS_VIDEOS = "videos"            # path video jawaban per pertanyaan
+NS_ANALYSIS = "analysis"        # status/hasil analisis video per pertanyaan (bersama antar worker)
+NS_JOBS = "jobs"                # status job latar belakang (key: job_id)
+NS_INDEX = "index"              # state versi index kandidat dashboard (lihat candidate_index)
+SESSION_NAMESPACES = (NS_CANDIDATE, NS_TRANSCRIPTS, NS_VIDEOS, NS_ANALYSIS)
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+class SessionStore(ABC):
+    """
+    Penyimpanan data session interview per (namespace, session_id)
+
+    Setiap entry adalah dict. update() menggabungkan field secara atomik
+    (field lain yang ditulis worker lain tidak tertimpa). Nilai yang dibaca
+    adalah salinan: ubah lewat update(), bukan dengan memodifikasi hasil get().
+
+    Setiap update() mencatat waktu aktivitas terakhir. evict() menghapus session
+    yang tidak aktif lebih dari ttl detik dan session tertua jika jumlahnya
+    melebihi max_sessions.
+    """
+
+    backend = ""
+
+    def __init__(self, ttl: float = SESSION_TTL_SECONDS, max_sessions: int = SESSION_MAX_SESSIONS):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._evict_lock = threading.Lock()
+        self._evicted = {'expired': 0, 'over_limit': 0, 'jobs': 0, 'last_run': None}
+
+    @abstractmethod
+    def get(self, namespace: str, session_id: str) -> Optional[Dict]:
+        """Ambil entry, None jika tidak ada"""
+
+    @abstractmethod
+    def get_many(self, namespace: str, session_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Ambil beberapa entry sekaligus: {session_id: entry} untuk yang ada saja"""
+
+    @abstractmethod
+    def update(self, namespace: str, session_id: str, fields: Dict):
+        """Gabungkan fields ke entry (dibuat jika belum ada)"""
+
+    @abstractmethod
+    def update_if(self, namespace: str, session_id: str, fields: Dict, expected: Dict) -> bool:
+        """
+        Gabungkan fields hanya jika entry ada dan field-field expected bernilai sama
+
+        Returns:
+            True jika entry di-update
+        """
+
+    @abstractmethod
+    def delete(self, session_id: str, namespaces: Iterable[str] = SESSION_NAMESPACES):
+        """Hapus data session di namespace yang diberikan"""
+
+    @abstractmethod
+    def last_activity(self, namespaces: Iterable[str] = SESSION_NAMESPACES) -> Dict[str, float]:
+        """Waktu update terakhir (epoch) per session_id di namespace yang diberikan"""
+
+    @abstractmethod
+    def usage(self) -> Dict[str, Tuple[int, int]]:
+        """Jumlah entry dan perkiraan ukuran (byte JSON) per namespace"""
+
+    def evict(self, now: Optional[float] = None) -> List[str]:
+        """
+        Hapus session kadaluarsa (TTL) dan kelebihan session (max_sessions), serta
+        status job yang lebih tua dari TTL
+
+        Returns:
+            session_id yang dihapus
+        """
+        now = now if now is not None else time.time()
+        with self._evict_lock:
+            activity = self.last_activity(SESSION_NAMESPACES)
+            expired = [sid for sid, last in activity.items() if now - last > self.ttl]
+            active = sorted((last, sid) for sid, last in activity.items() if now - last <= self.ttl)
+            over_limit = [sid for _, sid in active[:max(0, len(active) - self.max_sessions)]]
+            for session_id in expired + over_limit:
+                self.delete(session_id)
+
+            expired_jobs = [job_id for job_id, last in self.last_activity((NS_JOBS,)).items()
+                            if now - last > self.ttl]
+            for job_id in expired_jobs:
+                self.delete(job_id, namespaces=(NS_JOBS,))
+
+            self._evicted['expired'] += len(expired)
+            self._evicted['over_limit'] += len(over_limit)
+            self._evicted['jobs'] += len(expired_jobs)
+            self._evicted['last_run'] = now
+        if expired or over_limit:
+            print(f"🧹 Session dihapus: {len(expired)} kadaluarsa, {len(over_limit)} melebihi batas")
+        return expired + over_limit
+
+    def report(self) -> Dict:
+        """Jumlah session, ukuran per namespace, dan statistik eviksi (untuk /api/admin/sessions)"""
+        now = time.time()
+        activity = self.last_activity(SESSION_NAMESPACES)
+        usage = self.usage()
+        with self._evict_lock:
+            evicted = dict(self._evicted)
+        return {
+            'backend': self.backend,
+            'sessions': len(activity),
+            'approx_bytes': sum(size for _, size in usage.values()),
+            'namespaces': {namespace: {'entries': entries, 'approx_bytes': size}
+                           for namespace, (entries, size) in usage.items()},
+            'oldest_activity_age_seconds': round(now - min(activity.values()), 1) if activity else None,
+            'ttl_seconds': self.ttl,
+            'max_sessions': self.max_sessions,
+            'evicted': evicted,
+        }
+
+    @abstractmethod
+    def stats(self) -> Dict:
+        """Nama backend dan jumlah entry per namespace (untuk /api/admin/stats)"""
+
+
+class MemorySessionStore(SessionStore):
+    """Dict in-process (hanya untuk development / satu worker; hilang saat restart)"""
+
+    backend = "memory"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Dict]] = {}
+        self._updated_at: Dict[str, Dict[str, float]] = {}
+
+    def get(self, namespace: str, session_id: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(namespace, {}).get(session_id)
+            return dict(entry) if entry is not None else None
+
+    def get_many(self, namespace: str, session_ids: Iterable[str]) -> Dict[str, Dict]:
+        with self._lock:
+            entries = self._entries.get(namespace, {})
+            return {sid: dict(entries[sid]) for sid in session_ids if sid in entries}
+
+    def update(self, namespace: str, session_id: str, fields: Dict):
+        with self._lock:
+            self._entries.setdefault(namespace, {}).setdefault(session_id, {}).update(fields)
+            self._updated_at.setdefault(namespace, {})[session_id] = time.time()
+
+    def update_if(self, namespace: str, session_id: str, fields: Dict, expected: Dict) -> bool:
+        with self._lock:
+            entry = self._entries.get(namespace, {}).get(session_id)
+            if entry is None or any(entry.get(k) != v for k, v in expected.items()):
+                return False
+            entry.update(fields)
+            self._updated_at[namespace][session_id] = time.time()
+            return True
+
+    def delete(self, session_id: str, namespaces: Iterable[str] = SESSION_NAMESPACES):
+        with self._lock:
+            for namespace in namespaces:
+                self._entries.get(namespace, {}).pop(session_id, None)
+                self._updated_at.get(namespace, {}).pop(session_id, None)
+
+    def last_activity(self, namespaces: Iterable[str] = SESSION_NAMESPACES) -> Dict[str, float]:
+        activity: Dict[str, float] = {}
+        with self._lock:
+            for namespace in namespaces:
+                for session_id, updated_at in self._updated_at.get(namespace, {}).items():
+                    activity[session_id] = max(activity.get(session_id, 0.0), updated_at)
+        return activity
+
+    def usage(self) -> Dict[str, Tuple[int, int]]:
+        with self._lock:
+            entries = {namespace: list(values.values()) for namespace, values in self._entries.items()}
+        # Perkiraan: ukuran JSON (UTF-8) dari tiap entry
+        return {namespace: (len(values), sum(len(_dumps(value).encode('utf-8')) for value in values))
+                for namespace, values in entries.items()}
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counts = {namespace: len(entries) for namespace, entries in self._entries.items()}
+        return {'backend': self.backend, 'entries': counts}
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Entry disimpan sebagai JSON di SQLite (WAL) sehingga bisa dibaca/ditulis beberapa
+    proses sekaligus dan tetap ada setelah restart. Read-modify-write dijalankan dalam
+    transaksi BEGIN IMMEDIATE agar update dari worker lain tidak hilang.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_pid = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connect()
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        # Koneksi SQLite tidak boleh dipakai bersama setelah fork (gunicorn --preload)
+        if self._db_pid != os.getpid():
+            self._connect()
+        return self._db
+
+    def _connect(self):
+        self._db = sqlite3.connect(self.path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._db_pid = os.getpid()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            " namespace TEXT NOT NULL,"
+            " session_id TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, session_id))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at)")
+
+    def get(self, namespace: str, session_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM sessions WHERE namespace = ? AND session_id = ?",
+                                     (namespace, session_id)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def get_many(self, namespace: str, session_ids: Iterable[str]) -> Dict[str, Dict]:
+        session_ids = list(dict.fromkeys(session_ids))
+        result = {}
+        # Batas jumlah parameter SQLite, query per potongan
+        for start in range(0, len(session_ids), 500):
+            chunk = session_ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT session_id, value FROM sessions WHERE namespace = ? AND session_id IN ({placeholders})",
+                    (namespace, *chunk)).fetchall()
+            result.update((session_id, json.loads(value)) for session_id, value in rows)
+        return result
+
+    def _merge(self, namespace: str, session_id: str, fields: Dict, expected: Optional[Dict]) -> bool:
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT value FROM sessions WHERE namespace = ? AND session_id = ?",
+                                   (namespace, session_id)).fetchone()
+                entry = json.loads(row[0]) if row is not None else {}
+                if expected is not None and (row is None or any(entry.get(k) != v for k, v in expected.items())):
+                    conn.execute("COMMIT")
+                    return False
+                entry.update(fields)
+                conn.execute(
+                    "INSERT OR REPLACE INTO sessions (namespace, session_id, value, updated_at) VALUES (?, ?, ?, ?)",
+                    (namespace, session_id, _dumps(entry), time.time()))
+                conn.execute("COMMIT")
+                return True
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def update(self, namespace: str, session_id: str, fields: Dict):
+        self._merge(namespace, session_id, fields, None)
+
+    def update_if(self, namespace: str, session_id: str, fields: Dict, expected: Dict) -> bool:
+        return self._merge(namespace, session_id, fields, expected)
+
+    def delete(self, session_id: str, namespaces: Iterable[str] = SESSION_NAMESPACES):
+        namespaces = list(namespaces)
+        placeholders = ",".join("?" * len(namespaces))
+        with self._lock:
+            self._conn.execute(f"DELETE FROM sessions WHERE session_id = ? AND namespace IN ({placeholders})",
+                               (session_id, *namespaces))
+
+    def last_activity(self, namespaces: Iterable[str] = SESSION_NAMESPACES) -> Dict[str, float]:
+        namespaces = list(namespaces)
+        placeholders = ",".join("?" * len(namespaces))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT session_id, MAX(updated_at) FROM sessions WHERE namespace IN ({placeholders})"
+                " GROUP BY session_id", namespaces).fetchall()
+        return dict(rows)
+
+    def usage(self) -> Dict[str, Tuple[int, int]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT namespace, COUNT(*), SUM(LENGTH(CAST(value AS BLOB))) FROM sessions GROUP BY namespace"
+            ).fetchall()
+        return {namespace: (count, size or 0) for namespace, count, size in rows}
+
+    def stats(self) -> Dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT namespace, COUNT(*) FROM sessions GROUP BY namespace").fetchall()
+        return {'backend': self.backend, 'path': self.path, 'entries': dict(rows)}
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Entry disimpan sebagai hash Redis ({prefix}:{namespace}:{session_id}), satu field
+    hash per field entry (nilai JSON). update() = HSET sehingga penggabungan field
+    atomik tanpa read-modify-write. Butuh paket redis (ada di requirements.txt).
+
+    TTL memakai EXPIRE Redis; aktivitas session dicatat di sorted set
+    {prefix}:activity untuk batas jumlah session.
+    """
+
+    backend = "redis"
+
+    def __init__(self, url: str, prefix: str, **kwargs):
+        import redis
+
+        super().__init__(**kwargs)
+        self.url = url
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(url)
+        self._watch_error = redis.WatchError
+
+    def _key(self, namespace: str, session_id: str) -> str:
+        return f"{self.prefix}:{namespace}:{session_id}"
+
+    def _activity_key(self, namespace: str) -> str:
+        return f"{self.prefix}:activity:{namespace}"
+
+    def _touch(self, pipe, namespace: str, session_id: str):
+        pipe.expire(self._key(namespace, session_id), int(self.ttl))
+        pipe.zadd(self._activity_key(namespace), {session_id: time.time()})
+
+    @staticmethod
+    def _decode(raw: Dict) -> Optional[Dict]:
+        if not raw:
+            return None
+        return {field.decode('utf-8'): json.loads(value) for field, value in raw.items()}
+
+    def get(self, namespace: str, session_id: str) -> Optional[Dict]:
+        return self._decode(self._redis.hgetall(self._key(namespace, session_id)))
+
+    def get_many(self, namespace: str, session_ids: Iterable[str]) -> Dict[str, Dict]:
+        session_ids = list(dict.fromkeys(session_ids))
+        pipe = self._redis.pipeline(transaction=False)
+        for session_id in session_ids:
+            pipe.hgetall(self._key(namespace, session_id))
+        result = {}
+        for session_id, raw in zip(session_ids, pipe.execute()):
+            entry = self._decode(raw)
+            if entry is not None:
+                result[session_id] = entry
+        return result
+
+    def update(self, namespace: str, session_id: str, fields: Dict):
+        if fields:
+            pipe = self._redis.pipeline()
+            pipe.hset(self._key(namespace, session_id),
+                      mapping={field: _dumps(value) for field, value in fields.items()})
+            self._touch(pipe, namespace, session_id)
+            pipe.execute()
+
+    def update_if(self, namespace: str, session_id: str, fields: Dict, expected: Dict) -> bool:
+        key = self._key(namespace, session_id)
+        with self._redis.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key)
+                    entry = self._decode(pipe.hgetall(key))
+                    if entry is None or any(entry.get(k) != v for k, v in expected.items()):
+                        pipe.unwatch()
+                        return False
+                    pipe.multi()
+                    pipe.hset(key, mapping={field: _dumps(value) for field, value in fields.items()})
+                    self._touch(pipe, namespace, session_id)
+                    pipe.execute()
+                    return True
+                except self._watch_error:
+                    continue
+
+    def delete(self, session_id: str, namespaces: Iterable[str] = SESSION_NAMESPACES):
+        namespaces = list(namespaces)
+        if not namespaces:
+            return
+        pipe = self._redis.pipeline()
+        pipe.delete(*[self._key(namespace, session_id) for namespace in namespaces])
+        for namespace in namespaces:
+            pipe.zrem(self._activity_key(namespace), session_id)
+        pipe.execute()
+
+    def last_activity(self, namespaces: Iterable[str] = SESSION_NAMESPACES) -> Dict[str, float]:
+        activity: Dict[str, float] = {}
+        for namespace in namespaces:
+            for session_id, updated_at in self._redis.zrange(self._activity_key(namespace), 0, -1,
+                                                             withscores=True):
+                session_id = session_id.decode('utf-8')
+                activity[session_id] = max(activity.get(session_id, 0.0), updated_at)
+        return activity
+
+    def _data_keys(self):
+        for key in self._redis.scan_iter(match=f"{self.prefix}:*", count=500):
+            namespace = key.decode('utf-8')[len(self.prefix) + 1:].split(':', 1)[0]
+            if namespace != "activity":
+                yield namespace, key
+
+    def usage(self) -> Dict[str, Tuple[int, int]]:
+        usage: Dict[str, Tuple[int, int]] = {}
+        for namespace, key in self._data_keys():
+            entries, size = usage.get(namespace, (0, 0))
+            usage[namespace] = (entries + 1, size + (self._redis.memory_usage(key) or 0))
+        return usage
+
+    def stats(self) -> Dict:
+        counts: Dict[str, int] = {}
+        for namespace, _ in self._data_keys():
+            counts[namespace] = counts.get(namespace, 0) + 1
+        return {'backend': self.backend, 'url': self.url, 'entries': counts}
+
+
+def create_session_store(backend: Optional[str] = None) -> SessionStore:
+    """Buat session store sesuai SESSION_STORE (sqlite | redis | memory)"""
+    name = backend or SESSION_STORE
+    if name == "sqlite":
+        return SQLiteSessionStore(SESSION_STORE_PATH)
+    if name == "redis":
+        return RedisSessionStore(SESSION_STORE_REDIS_URL, SESSION_STORE_REDIS_PREFIX)
+    if name == "memory":
+        return MemorySessionStore()
+    raise ValueError(f"SESSION_STORE tidak dikenal: {name} (pilihan: sqlite, redis, memory)")
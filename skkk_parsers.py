@@ -0,0 +1,141 @@
+import os
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Backend parser tabel SKKK: "lxml" (default), "selectolax", atau "bs4" (html.parser, paling lambat)
+SKKK_PARSER = os.getenv("SKKK_PARSER", "lxml")
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_TABLE_ID_RE = re.compile(r'''<table\b[^>]*\bid\s*=\s*["']?example["'\s>]''', re.IGNORECASE)
+_TABLE_END_RE = re.compile(r'</table\s*>', re.IGNORECASE)
+
+# Kolom bertipe (dicocokkan dengan header yang sudah dinormalisasi, huruf besar)
+INT_COLUMNS = {'NO', 'NO.'}
+FLOAT_COLUMNS = {'SKKK', 'POIN', 'POINT', 'NILAI SKKK', 'JUMLAH SKKK'}
+
+SKKKTable = Tuple[List[str], List[Dict]]
+
+
+def normalize_text(text: str) -> str:
+    """Rapikan whitespace (termasuk \\r\\n di tengah teks) menjadi satu spasi"""
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def _to_number(value: str, kind: type):
+    value = value.replace(' ', '')
+    if not value:
+        return None
+    if kind is float and ',' in value and '.' not in value:
+        value = value.replace(',', '.')
+    try:
+        return kind(float(value)) if kind is int else float(value)
+    except ValueError:
+        return None
+
+
+def build_rows(headers: List[str], rows: List[List[str]]) -> List[Dict]:
+    """Ubah baris sel (teks) menjadi dict bertipe; baris yang jumlah selnya tidak cocok dibuang"""
+    converters = []
+    for header in headers:
+        key = header.upper()
+        converters.append(int if key in INT_COLUMNS else float if key in FLOAT_COLUMNS else None)
+
+    typed_rows = []
+    for cells in rows:
+        if len(cells) != len(headers):
+            continue
+        typed_rows.append({
+            header: _to_number(cell, kind) if kind else cell
+            for header, cell, kind in zip(headers, cells, converters)
+        })
+    return typed_rows
+
+
+def _slice_table(html: str) -> Optional[str]:
+    """Potong HTML hanya pada <table id="example">...</table> agar parser tidak membaca seluruh halaman"""
+    match = _TABLE_ID_RE.search(html)
+    if not match:
+        return None
+    end = _TABLE_END_RE.search(html, match.end())
+    return html[match.start():end.end() if end else len(html)]
+
+
+def _parse_bs4(html: str) -> Optional[SKKKTable]:
+    from bs4 import BeautifulSoup
+
+    table = BeautifulSoup(html, "html.parser").find("table", id="example")
+    if table is None:
+        return None
+    thead = table.find("thead")
+    tbody = table.find("tbody")
+    headers = [normalize_text(th.get_text(strip=True)) for th in thead.find_all("th")] if thead else []
+    rows = []
+    for tr in (tbody.find_all("tr") if tbody else []):
+        cols = [normalize_text(td.get_text(strip=True)) for td in tr.find_all("td")]
+        if cols:
+            rows.append(cols)
+    return headers, build_rows(headers, rows)
+
+
+def _lxml_text(element) -> str:
+    # Sama dengan get_text(strip=True) BeautifulSoup: tiap potongan teks di-strip lalu digabung
+    return normalize_text("".join(part.strip() for part in element.itertext()))
+
+
+def _parse_lxml(html: str) -> Optional[SKKKTable]:
+    import lxml.html
+
+    snippet = _slice_table(html)
+    if snippet is None:
+        return None
+    table = lxml.html.fragment_fromstring(snippet, create_parent="div").find(".//table")
+    headers = [_lxml_text(th) for th in table.iterfind("thead//th")]
+    rows = []
+    for tr in table.iterfind("tbody//tr"):
+        cols = [_lxml_text(td) for td in tr.iter("td")]
+        if cols:
+            rows.append(cols)
+    return headers, build_rows(headers, rows)
+
+
+def _parse_selectolax(html: str) -> Optional[SKKKTable]:
+    from selectolax.lexbor import LexborHTMLParser
+
+    snippet = _slice_table(html)
+    if snippet is None:
+        return None
+    table = LexborHTMLParser(snippet).css_first("table#example")
+    if table is None:
+        return None
+    headers = [normalize_text(th.text(deep=True, separator='', strip=True)) for th in table.css("thead th")]
+    rows = []
+    for tr in table.css("tbody tr"):
+        cols = [normalize_text(td.text(deep=True, separator='', strip=True)) for td in tr.css("td")]
+        if cols:
+            rows.append(cols)
+    return headers, build_rows(headers, rows)
+
+
+SKKK_PARSERS: Dict[str, Callable[[str], Optional[SKKKTable]]] = {
+    'bs4': _parse_bs4,
+    'lxml': _parse_lxml,
+    'selectolax': _parse_selectolax,
+}
+
+
+def parse_skkk_table(html: str, backend: Optional[str] = None) -> Optional[SKKKTable]:
+    """
+    Ambil tabel SKKK Non Wajib (id='example') dari halaman sportfolio
+
+    Args:
+        html: Isi halaman hasil POST form SKKK
+        backend: Nama backend, default SKKK_PARSER dari environment
+
+    Returns:
+        (headers, rows) dengan header yang sudah dinormalisasi dan baris bertipe
+        (No -> int, SKKK/Poin -> float), atau None jika tabel tidak ditemukan
+    """
+    name = backend or SKKK_PARSER
+    if name not in SKKK_PARSERS:
+        raise ValueError(f"SKKK parser tidak dikenal: {name} (pilihan: {', '.join(SKKK_PARSERS)})")
+    return SKKK_PARSERS[name](html)
@@ -0,0 +1,50 @@
+import os
+
+from candidate_index import CandidateIndex
+from session_store import SQLiteSessionStore
+
+
+def transform(user_data, registered_at):
+    return {'session_id': f"user_{user_data['user_id']}", 'nama': user_data['name'],
+            'registered_at': registered_at}
+
+
+def make_workers(tmp_path, count=2):
+    """Beberapa index (seperti worker gunicorn) yang berbagi satu session store"""
+    path = os.path.join(tmp_path, "sessions.sqlite")
+    return [CandidateIndex(transform, store=SQLiteSessionStore(path)) for _ in range(count)]
+
+
+def test_workers_agree_on_version_and_etag(tmp_path):
+    a, b = make_workers(tmp_path)
+    users = [{'user_id': 1, 'name': 'A'}, {'user_id': 2, 'name': 'B'}]
+    first_a, first_b = a.rebuild(users), b.rebuild(users)
+    assert (first_a.cursor, first_a.etag) == (first_b.cursor, first_b.etag)
+    assert first_a.candidates == first_b.candidates
+
+    users = [{'user_id': 1, 'name': 'A2'}, {'user_id': 3, 'name': 'C'}]
+    second_a = a.rebuild(users)
+    second_b = b.rebuild(users)
+    assert second_a.etag == second_b.etag != first_a.etag
+
+    # Cursor dari worker a dipakai di worker b -> delta, bukan sync penuh
+    since = second_b.parse_cursor(first_a.cursor)
+    assert since == first_a.version
+    changed, removed = second_b.changed_since(since)
+    assert sorted(c['session_id'] for c in changed) == ['user_1', 'user_3']
+    assert removed == ['user_2']
+
+
+def test_unchanged_data_keeps_version(tmp_path):
+    a, b = make_workers(tmp_path)
+    users = [{'user_id': 1, 'name': 'A'}]
+    first = a.rebuild(users)
+    assert b.rebuild(users).version == first.version == a.rebuild(users).version
+    assert a.stats()['reused'] == 1
+
+
+def test_cursor_from_other_store_needs_full_sync(tmp_path):
+    a = make_workers(tmp_path, 1)[0]
+    other = CandidateIndex(transform)
+    users = [{'user_id': 1, 'name': 'A'}]
+    assert a.rebuild(users).parse_cursor(other.rebuild(users).cursor) is None
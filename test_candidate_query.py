@@ -0,0 +1,92 @@
+import pytest
+
+from candidate_query import CandidateQuery, CandidateView
+
+
+def _candidates(n=30):
+    candidates = []
+    for i in range(n):
+        candidates.append({
+            'session_id': f'session_{i}',
+            'posisi_dilamar': ['Backend', 'Frontend', None][i % 3],
+            'is_terima': [True, False, None][i % 3 if i % 2 else 2],
+            'skor_final': None if i % 7 == 0 else (i * 37) % 100,
+            'transkrip_ipk': f"{2 + (i % 20) / 10:.2f}".replace('.', ','),
+            'registered_at': f"2025-01-{1 + i % 28:02d}T10:{i:02d}:00",
+        })
+    return candidates
+
+
+def _all_pages(view, **kwargs):
+    pages = []
+    cursor = None
+    while True:
+        result = view.query(CandidateQuery(cursor=cursor, **kwargs))
+        pages.append([c['session_id'] for c in result['candidates']])
+        cursor = result['next_cursor']
+        if cursor is None:
+            return pages, result['total']
+
+
+def _reference(candidates, statuses=(), skor_min=None, skor_max=None, ipk_min=None, sort='skor_final', order='desc'):
+    status = {True: 'diterima', False: 'ditolak', None: 'pending'}
+    selected = []
+    for c in candidates:
+        ipk = float(c['transkrip_ipk'].replace(',', '.'))
+        if statuses and status[c['is_terima']] not in statuses:
+            continue
+        if (skor_min is not None or skor_max is not None) and c['skor_final'] is None:
+            continue
+        if skor_min is not None and c['skor_final'] < skor_min:
+            continue
+        if skor_max is not None and c['skor_final'] > skor_max:
+            continue
+        if ipk_min is not None and ipk < ipk_min:
+            continue
+        selected.append(c)
+    with_value = [c for c in selected if c[sort] is not None]
+    without = sorted((c for c in selected if c[sort] is None), key=lambda c: c['session_id'])
+    sign = -1 if order == 'desc' else 1
+    with_value.sort(key=lambda c: (sign * c[sort], c['session_id']))
+    return [c['session_id'] for c in with_value + without]
+
+
+def test_pages_cover_filtered_sorted_result_exactly_once():
+    candidates = _candidates()
+    view = CandidateView(candidates)
+    for kwargs in ({}, {'statuses': ['pending']}, {'skor_min': 20, 'skor_max': 80, 'ipk_min': 2.5},
+                   {'order': 'asc'}):
+        pages, total = _all_pages(view, sort='skor_final', limit=4, **kwargs)
+        flat = [sid for page in pages for sid in page]
+        assert flat == _reference(candidates, **kwargs)
+        assert total == len(flat)
+        assert all(len(page) == 4 for page in pages[:-1])
+
+
+def test_cursor_survives_new_candidates_between_pages():
+    candidates = _candidates()
+    first = CandidateView(candidates).query(CandidateQuery(sort='registered_at', limit=10))
+    newer = candidates + [dict(candidates[0], session_id='session_new', registered_at='2026-01-01T00:00:00')]
+    second = CandidateView(newer).query(CandidateQuery(sort='registered_at', limit=10, cursor=first['next_cursor']))
+    seen = {c['session_id'] for c in first['candidates']}
+    assert 'session_new' not in {c['session_id'] for c in second['candidates']}
+    assert not seen & {c['session_id'] for c in second['candidates']}
+
+
+def test_position_filter_is_case_insensitive():
+    view = CandidateView(_candidates())
+    result = view.query(CandidateQuery(positions=['backend'], limit=50))
+    assert result['total'] == 10
+    assert {c['posisi_dilamar'] for c in result['candidates']} == {'Backend'}
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        CandidateQuery(sort='nama')
+    with pytest.raises(ValueError):
+        CandidateQuery(limit=0)
+    cursor = CandidateView(_candidates()).query(CandidateQuery(limit=5))['next_cursor']
+    with pytest.raises(ValueError):
+        CandidateQuery(sort='skor_final', cursor=cursor)
+    with pytest.raises(ValueError):
+        CandidateQuery(cursor='bukan-cursor')
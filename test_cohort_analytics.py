@@ -0,0 +1,36 @@
+from benchmark_cohort_analytics import build_synthetic_cohort
+from cohort_analytics import (analyze_cohort, load_courses_frame_from_dataset, strip_course_lists,
+                              to_analysis_dicts)
+from transkrip_extract import analyze_transcript
+from transkrip_parquet import TranscriptParquetWriter
+
+
+def write_run(dataset_dir, run_id, students):
+    writer = TranscriptParquetWriter(str(dataset_dir), run_id=run_id)
+    for nrp, courses in students.items():
+        writer.add({'NRP': nrp, 'Tahun_Masuk': '1-2022/2023'}, courses, [], [])
+    writer.close()
+
+
+def test_dataset_matches_analyze_transcript_with_repeated_runs(tmp_path):
+    first = build_synthetic_cohort(20, seed=1)
+    # Run kedua memproses ulang sebagian mahasiswa dengan transkrip yang sudah berubah
+    second = {nrp: courses for nrp, courses in build_synthetic_cohort(20, seed=2).items()
+              if int(nrp[-2:]) % 2 == 0}
+    write_run(tmp_path, '20250101_080000_aaaaaa', first)
+    write_run(tmp_path, '20250102_080000_bbbbbb', second)
+
+    latest = {**first, **second}
+    actual = to_analysis_dicts(analyze_cohort(load_courses_frame_from_dataset(str(tmp_path))))
+    assert actual.keys() == latest.keys()
+    for nrp, courses in latest.items():
+        assert actual[nrp] == strip_course_lists(analyze_transcript(courses)), nrp
+
+
+def test_dataset_single_run(tmp_path):
+    first = build_synthetic_cohort(5, seed=1)
+    write_run(tmp_path, 'run-a', first)
+    write_run(tmp_path, 'run-b', build_synthetic_cohort(5, seed=2))
+
+    actual = to_analysis_dicts(analyze_cohort(load_courses_frame_from_dataset(str(tmp_path), run_id='run-a')))
+    assert actual == {nrp: strip_course_lists(analyze_transcript(courses)) for nrp, courses in first.items()}
@@ -0,0 +1,64 @@
+import os
+
+from benchmark_parse_courses import build_synthetic_transcript_text, parse_courses_reference
+from course_parser import parse_courses
+
+SAMPLE_PDF = '[SIA PETRA] Transkrip.pdf'
+
+
+def test_golden_synthetic_transcripts():
+    """Output parser baru harus identik dengan implementasi lama"""
+    for seed in range(200):
+        text = build_synthetic_transcript_text(n_courses=seed % 60 + 1, seed=seed)
+        assert parse_courses(text) == parse_courses_reference(text), f"seed {seed}"
+
+
+def test_golden_edge_cases():
+    cases = [
+        "",
+        "IF1234",
+        "IF1234 SHORT",
+        "IF1234 NAMA MATA KULIAH 1-22/23 3 A",
+        "IF1234 NAMA MATA KULIAH /\n 1-22/23\n3\nB+",
+        "IF1234 NAMA MATA KULIAH //1-22/23 3 A",
+        "IF1234 ABCD 1-22/23 3 A",
+        "IF1234 Kode Mata Kuliah SMT 1-22/23 3 A",
+        "IF1234 NAMA MATA KULIAH 1-22/23 3 AIF1234 NAMA LAIN SEKALI 1-22/23 3 B",
+        "IF1234 NAMA MATA KULIAH 1-22/23 3 A",
+        "IF1234 NAMA MATA KULIAH 1-22/ 23 3 A 2-22/23 4 C",
+        "IF1234\nNAMA MATA KULIAH 1-22/23 3 F 1-23/24 2 C+",
+        "AB1234CD5678 MATA KULIAH PANJANG 1-22/23 12 D",
+    ]
+    for text in cases:
+        assert parse_courses(text) == parse_courses_reference(text), repr(text)
+
+
+def test_golden_sample_transcript():
+    if not os.path.exists(SAMPLE_PDF):
+        return
+    from pdf_backends import extract_pdf_pages
+
+    text = "\n".join(extract_pdf_pages(SAMPLE_PDF, 'pypdf2'))
+    courses = parse_courses(text)
+    assert courses == parse_courses_reference(text)
+    assert len(courses) > 0
+
+
+def test_pdf_backend_verification():
+    from pdf_backends import resolve_backend, verify_backend
+
+    assert verify_backend('pypdf2', SAMPLE_PDF) is None
+    assert resolve_backend('tidak-ada') == 'pypdf2'
+    assert verify_backend('pypdfium2', 'tidak-ada.pdf') is not None
+    if os.path.exists(SAMPLE_PDF):
+        # Nama mata kuliah pypdfium2 berbeda spasi dari pypdf2, pdfminer tidak menemukan mata kuliah
+        assert verify_backend('pypdfium2', SAMPLE_PDF) is not None
+        assert verify_backend('pdfminer', SAMPLE_PDF) is not None
+
+
+if __name__ == "__main__":
+    test_golden_synthetic_transcripts()
+    test_golden_edge_cases()
+    test_golden_sample_transcript()
+    test_pdf_backend_verification()
+    print("✅ parse_courses identik dengan implementasi lama")
@@ -0,0 +1,80 @@
+import os
+import time
+
+import pytest
+
+from session_store import (NS_CANDIDATE, NS_JOBS, NS_TRANSCRIPTS, NS_VIDEOS, MemorySessionStore,
+                           SessionStore, SQLiteSessionStore)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemorySessionStore(ttl=100, max_sessions=3)
+    return SQLiteSessionStore(os.path.join(tmp_path, "sessions.sqlite"), ttl=100, max_sessions=3)
+
+
+def test_update_merges_fields(store):
+    store.update(NS_TRANSCRIPTS, "s1", {"pertanyaan_1": {"transkrip": "satu"}})
+    store.update(NS_TRANSCRIPTS, "s1", {"pertanyaan_2": {"transkrip": "dua"}})
+    assert store.get(NS_TRANSCRIPTS, "s1") == {
+        "pertanyaan_1": {"transkrip": "satu"},
+        "pertanyaan_2": {"transkrip": "dua"},
+    }
+    assert store.get(NS_TRANSCRIPTS, "s2") is None
+    assert store.get_many(NS_TRANSCRIPTS, ["s1", "s2"]).keys() == {"s1"}
+
+
+def test_update_if_requires_matching_entry(store):
+    assert not store.update_if(NS_CANDIDATE, "s1", {"skkk_status": "success"}, expected={"skkk_job_id": "a"})
+    assert store.get(NS_CANDIDATE, "s1") is None
+
+    store.update(NS_CANDIDATE, "s1", {"skkk_job_id": "b"})
+    assert not store.update_if(NS_CANDIDATE, "s1", {"skkk_status": "success"}, expected={"skkk_job_id": "a"})
+    assert store.update_if(NS_CANDIDATE, "s1", {"skkk_status": "success"}, expected={"skkk_job_id": "b"})
+    assert store.get(NS_CANDIDATE, "s1") == {"skkk_job_id": "b", "skkk_status": "success"}
+
+
+def test_delete_selected_namespaces(store):
+    for namespace in (NS_CANDIDATE, NS_TRANSCRIPTS, NS_VIDEOS):
+        store.update(namespace, "s1", {"x": 1})
+    store.delete("s1", namespaces=(NS_TRANSCRIPTS,))
+    assert store.get(NS_TRANSCRIPTS, "s1") is None
+    assert store.get(NS_CANDIDATE, "s1") == {"x": 1}
+    store.delete("s1")
+    assert store.get(NS_CANDIDATE, "s1") is None and store.get(NS_VIDEOS, "s1") is None
+
+
+def test_evict_over_limit_then_ttl(store):
+    for i in range(5):
+        store.update(NS_CANDIDATE, f"s{i}", {"CV": "x" * 100})
+        store.update(NS_VIDEOS, f"s{i}", {"pertanyaan_1": "v.webm"})
+        time.sleep(0.01)
+    store.update(NS_JOBS, "job-1", {"status": "success"})
+
+    # Session paling lama tidak aktif dihapus lebih dulu; status job tidak dihitung sebagai session
+    assert sorted(store.evict()) == ["s0", "s1"]
+    assert sorted(store.last_activity()) == ["s2", "s3", "s4"]
+    assert store.get(NS_VIDEOS, "s0") is None and store.get(NS_JOBS, "job-1") is not None
+
+    assert sorted(store.evict(now=time.time() + 101)) == ["s2", "s3", "s4"]
+    assert store.get(NS_JOBS, "job-1") is None
+
+
+def test_report_counts_sessions_and_bytes(store):
+    store.update(NS_CANDIDATE, "s1", {"CV": "x" * 1000})
+    store.update(NS_TRANSCRIPTS, "s1", {"pertanyaan_1": {"transkrip": "halo"}})
+    report = store.report()
+    assert report["sessions"] == 1
+    assert report["namespaces"][NS_CANDIDATE]["entries"] == 1
+    assert report["namespaces"][NS_CANDIDATE]["approx_bytes"] > 1000
+    assert report["approx_bytes"] == sum(ns["approx_bytes"] for ns in report["namespaces"].values())
+
+
+def test_incomplete_backend_cannot_be_created():
+    class PartialStore(SessionStore):
+        def get(self, namespace, session_id):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialStore()
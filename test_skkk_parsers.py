@@ -0,0 +1,63 @@
+import glob
+import os
+
+from skkk_parsers import SKKK_PARSERS, parse_skkk_table
+
+FIXTURES = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "skkk", "*.html")))
+
+
+def _read(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def _backends():
+    available = []
+    for backend in SKKK_PARSERS:
+        try:
+            parse_skkk_table("", backend)
+        except ImportError:
+            continue
+        available.append(backend)
+    return available
+
+
+def test_backends_identical_on_fixtures():
+    """Semua backend harus menghasilkan header dan baris yang sama dengan bs4"""
+    assert FIXTURES
+    for path in FIXTURES:
+        html = _read(path)
+        reference = parse_skkk_table(html, "bs4")
+        for backend in _backends():
+            assert parse_skkk_table(html, backend) == reference, (path, backend)
+
+
+def test_normalized_headers_and_typed_rows():
+    headers, rows = parse_skkk_table(_read(os.path.join(os.path.dirname(FIXTURES[0]), "skkk_medium.html")))
+    assert headers == ['No', 'Nama Kegiatan', 'Jabatan', 'Tingkat', 'Tanggal Kegiatan', 'SKKK']
+    assert len(rows) == 40
+    assert [row['No'] for row in rows] == list(range(1, 41))
+    assert all(isinstance(row['SKKK'], float) for row in rows)
+    assert all('\r' not in value and '\n' not in value for row in rows for value in row.values()
+               if isinstance(value, str))
+
+
+def test_edge_cases():
+    html = ("<table id='example'><thead><tr><th>No</th><th>Nama\r\n Kegiatan</th><th>SKKK</th></tr></thead>"
+            "<tbody><tr><td>1</td><td><b>Seminar</b> 2023</td><td>1,5</td></tr>"
+            "<tr><td>2</td><td>Baris tidak lengkap</td></tr>"
+            "<tr><td>x</td><td>Lomba</td><td></td></tr></tbody></table>")
+    expected = (['No', 'Nama Kegiatan', 'SKKK'], [
+        {'No': 1, 'Nama Kegiatan': 'Seminar2023', 'SKKK': 1.5},
+        {'No': None, 'Nama Kegiatan': 'Lomba', 'SKKK': None},
+    ])
+    for backend in _backends():
+        assert parse_skkk_table(html, backend) == expected, backend
+        assert parse_skkk_table("<table id='examples'></table>", backend) is None, backend
+
+
+if __name__ == "__main__":
+    test_backends_identical_on_fixtures()
+    test_normalized_headers_and_typed_rows()
+    test_edge_cases()
+    print("✅ Semua backend parser SKKK identik")
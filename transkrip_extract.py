@@ -1,18 +1,18 @@
-import PyPDF2
 import re
 import pandas as pd
 from typing import List, Dict
+from course_parser import parse_courses
+from pdf_backends import PDF_BACKEND, extract_pdf_pages
+from pdf_cache import cached_pdf_text
 
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
-    Ekstrak teks dari file PDF
+    Ekstrak teks dari file PDF (di-cache berdasarkan hash isi file)
     """
-    with open(pdf_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-    return text
+    return cached_pdf_text(pdf_path, f"transkrip_extract:{PDF_BACKEND}", _read_pdf_text)
+
+def _read_pdf_text(pdf_path: str) -> str:
+    return "".join(extract_pdf_pages(pdf_path))
 
 def parse_student_info(text: str) -> Dict[str, str]:
     """
@@ -72,85 +72,6 @@ def parse_student_info(text: str) -> Dict[str, str]:
     
     return info
 
-def parse_courses(text: str) -> List[Dict[str, str]]:
-    """
-    Ekstrak data mata kuliah dari transkrip
-    Menggunakan approach split per entry berdasarkan kode MK
-    """
-    courses = []
-    seen_courses = set()
-
-    # Cari semua kemunculan kode mata kuliah dan posisinya
-    # Pattern: kode (2 huruf + 4 angka) diikuti oleh huruf kapital atau spasi
-    pattern_kode = r'([A-Z]{2}\d{4})(?=[A-Z\s])'
-
-    # Split text berdasarkan posisi kode mata kuliah
-    matches = list(re.finditer(pattern_kode, text))
-
-    for i, match in enumerate(matches):
-        kode = match.group(1)
-
-        # Ambil text mulai dari kode ini sampai kode berikutnya (atau akhir text)
-        start_pos = match.end()
-        if i < len(matches) - 1:
-            end_pos = matches[i + 1].start()
-        else:
-            end_pos = len(text)
-
-        fragment = text[start_pos:end_pos]
-
-        # Bersihkan fragment: hilangkan newline jadi spasi
-        fragment_clean = re.sub(r'\s+', ' ', fragment).strip()
-
-        # Skip jika fragment terlalu pendek (kemungkinan noise)
-        if len(fragment_clean) < 10:
-            continue
-
-        # Cari semester, SKS, dan nilai di dalam fragment
-        # Pattern: SEMESTER SKS NILAI (dengan atau tanpa spasi)
-        pattern_data = r'(\d-\d{2}/\d{2})\s*(\d+)\s*([A-E]\+?)'
-        data_match = re.search(pattern_data, fragment_clean)
-
-        if not data_match:
-            continue
-
-        semester = data_match.group(1)
-        sks = int(data_match.group(2))
-        nilai = data_match.group(3)
-
-        # Nama mata kuliah adalah text sebelum semester
-        nama_end_pos = data_match.start()
-        mata_kuliah = fragment_clean[:nama_end_pos].strip()
-
-        # Bersihkan nama mata kuliah
-        # Hilangkan multiple spaces
-        mata_kuliah = re.sub(r'\s+', ' ', mata_kuliah)
-        # Hilangkan trailing slash
-        mata_kuliah = re.sub(r'\s*/\s*$', '', mata_kuliah).strip()
-
-        # Filter noise
-        if (len(mata_kuliah) < 5 or
-            'Kode' in mata_kuliah or
-            'Mata Kuliah' in mata_kuliah or
-            'SMT' in mata_kuliah):
-            continue
-
-        # Cek duplikat
-        course_id = f"{kode}-{semester}"
-        if course_id in seen_courses:
-            continue
-
-        courses.append({
-            'Kode': kode,
-            'Mata_Kuliah': mata_kuliah,
-            'Semester': semester,
-            'SKS': sks,
-            'Nilai': nilai
-        })
-        seen_courses.add(course_id)
-
-    return courses
-
 def calculate_grade_point(grade: str) -> float:
     """
     Konversi nilai huruf ke bobot nilai
@@ -290,9 +211,187 @@ def display_year_summary(analysis: Dict):
         year_label = f"20{year.split('/')[0]}/20{year.split('/')[1]}"
         print(f"{year_label:<15} {year_data['courses']:<15} {year_data['total_sks']:<15} {year_data['ip']:<15.2f}")
 
-def main():
+def build_semester_summary(analysis: Dict) -> List[Dict]:
+    """
+    Baris ringkasan per semester, urut tahun lalu semester
+    """
+    summary_data = []
+    for semester in sorted(analysis['semester_summary'].keys(), 
+                          key=lambda x: (x.split('-')[1], int(x.split('-')[0]))):
+        sem_data = analysis['semester_summary'][semester]
+        summary_data.append({
+            'Semester': semester,
+            'Jumlah_MK': sem_data['courses'],
+            'Total_SKS': sem_data['total_sks'],
+            'IPS': sem_data['ips']
+        })
+    return summary_data
+
+def build_year_summary(analysis: Dict) -> List[Dict]:
+    """
+    Baris ringkasan per tahun akademik
+    """
+    year_data = []
+    for year in sorted(analysis['year_summary'].keys()):
+        year_info = analysis['year_summary'][year]
+        year_label = f"20{year.split('/')[0]}/20{year.split('/')[1]}"
+        year_data.append({
+            'Tahun_Akademik': year_label,
+            'Jumlah_MK': year_info['courses'],
+            'Total_SKS': year_info['total_sks'],
+            'IP': year_info['ip']
+        })
+    return year_data
+
+# Kolom file gabungan untuk mode batch
+BATCH_STUDENT_FIELDS = ['File', 'NRP', 'Nama', 'Tempat_Tgl_Lahir', 'Fakultas', 'Program_Studi', 'Program',
+                        'Program_Pendidikan', 'Tahun_Masuk', 'IPK', 'Total_SKS', 'Total_MK', 'IPK_Hitung']
+BATCH_COURSE_FIELDS = ['NRP', 'Kode', 'Mata_Kuliah', 'Semester', 'SKS', 'Nilai']
+BATCH_SEMESTER_FIELDS = ['NRP', 'Semester', 'Jumlah_MK', 'Total_SKS', 'IPS']
+BATCH_YEAR_FIELDS = ['NRP', 'Tahun_Akademik', 'Jumlah_MK', 'Total_SKS', 'IP']
+BATCH_ERROR_FIELDS = ['File', 'Error']
+
+def process_transcript_file(pdf_path: str) -> Dict:
+    """
+    Pipeline extract -> parse -> analyze untuk satu file (dipanggil di worker process)
+    Error dikembalikan di key 'error' agar batch tetap berjalan
+    """
+    try:
+        text = extract_text_from_pdf(pdf_path)
+        student_info = parse_student_info(text)
+        courses = parse_courses(text)
+        if not courses:
+            return {'file': pdf_path, 'error': 'Tidak ada mata kuliah yang berhasil diekstrak'}
+        analysis = analyze_transcript(courses)
+        return {
+            'file': pdf_path,
+            'student_info': student_info,
+            'courses': courses,
+            'semester_summary': build_semester_summary(analysis),
+            'year_summary': build_year_summary(analysis),
+            'total_courses': analysis['total_courses'],
+            'calculated_ipk': analysis.get('calculated_ipk')
+        }
+    except Exception as e:
+        return {'file': pdf_path, 'error': f"{type(e).__name__}: {str(e)}"}
+
+def resolve_batch_inputs(source: str) -> List[str]:
+    """
+    Daftar file PDF dari direktori atau pola glob
+    """
+    import glob
+    import os
+
+    if os.path.isdir(source):
+        pattern = os.path.join(source, '*.pdf')
+    else:
+        pattern = source
+    return sorted(path for path in glob.glob(pattern) if path.lower().endswith('.pdf'))
+
+def open_parquet_writer(parquet_dir: str):
+    """
+    Writer dataset Parquet, None jika pyarrow tidak tersedia
+    """
+    try:
+        from transkrip_parquet import TranscriptParquetWriter
+    except ImportError:
+        print("   [!] pyarrow tidak tersedia, skip export Parquet")
+        return None
+    return TranscriptParquetWriter(parquet_dir)
+
+def run_batch(source: str, output_dir: str, workers: int = None, parquet_dir: str = None) -> Dict:
+    """
+    Proses banyak transkrip sekaligus dengan process pool
+    Hasil langsung ditulis (streaming) ke file CSV gabungan di output_dir,
+    dan juga ke dataset Parquet jika parquet_dir diisi
+    """
+    import csv
+    import os
+    import time
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    pdf_files = resolve_batch_inputs(source)
+    if not pdf_files:
+        print(f"[!] Tidak ada file PDF yang cocok dengan: {source}")
+        return {'total': 0, 'success': 0, 'failed': 0}
+
+    os.makedirs(output_dir, exist_ok=True)
+    outputs = {
+        'student': ('batch_info_mahasiswa.csv', BATCH_STUDENT_FIELDS),
+        'course': ('batch_transkrip_data.csv', BATCH_COURSE_FIELDS),
+        'semester': ('batch_ringkasan_semester.csv', BATCH_SEMESTER_FIELDS),
+        'year': ('batch_ringkasan_tahun.csv', BATCH_YEAR_FIELDS),
+        'error': ('batch_errors.csv', BATCH_ERROR_FIELDS),
+    }
+    files = {}
+    writers = {}
+    for name, (filename, fields) in outputs.items():
+        files[name] = open(os.path.join(output_dir, filename), 'w', newline='', encoding='utf-8-sig')
+        writers[name] = csv.DictWriter(files[name], fieldnames=fields, extrasaction='ignore')
+        writers[name].writeheader()
+    parquet_writer = open_parquet_writer(parquet_dir) if parquet_dir else None
+
+    print("="*110)
+    print(f"MODE BATCH: {len(pdf_files)} file transkrip, {workers or os.cpu_count()} worker")
+    print("="*110)
+
+    success = failed = total_courses = 0
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(process_transcript_file, path) for path in pdf_files]
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                filename = os.path.basename(result['file'])
+
+                if 'error' in result:
+                    failed += 1
+                    writers['error'].writerow({'File': result['file'], 'Error': result['error']})
+                    files['error'].flush()
+                    status = f"[X] {filename}: {result['error']}"
+                else:
+                    success += 1
+                    total_courses += len(result['courses'])
+                    nrp = result['student_info'].get('NRP', '')
+                    writers['student'].writerow({
+                        **result['student_info'],
+                        'File': result['file'],
+                        'Total_MK': result['total_courses'],
+                        'IPK_Hitung': result['calculated_ipk']
+                    })
+                    writers['course'].writerows({**course, 'NRP': nrp} for course in result['courses'])
+                    writers['semester'].writerows({**row, 'NRP': nrp} for row in result['semester_summary'])
+                    writers['year'].writerows({**row, 'NRP': nrp} for row in result['year_summary'])
+                    if parquet_writer:
+                        parquet_writer.add(result['student_info'], result['courses'], result['semester_summary'],
+                                           result['year_summary'], source_file=result['file'],
+                                           calculated_ipk=result['calculated_ipk'])
+                    status = f"[OK] {filename} ({len(result['courses'])} MK)"
+
+                elapsed = time.perf_counter() - start
+                print(f"[{done}/{len(pdf_files)}] {done / elapsed:6.1f} file/s | {status}")
+    finally:
+        for f in files.values():
+            f.close()
+        if parquet_writer:
+            parquet_writer.close()
+
+    elapsed = time.perf_counter() - start
+    print("\n" + "="*110)
+    print(f"BATCH SELESAI: {success} berhasil, {failed} gagal, {total_courses} mata kuliah "
+          f"dalam {elapsed:.1f} detik ({len(pdf_files) / elapsed:.1f} file/s)")
+    for name, (filename, _) in outputs.items():
+        print(f"   > {os.path.join(output_dir, filename)}")
+    if parquet_writer:
+        print(f"   > Dataset Parquet: {parquet_dir} (run {parquet_writer.run_id})")
+    print("="*110)
+
+    return {'total': len(pdf_files), 'success': success, 'failed': failed, 'elapsed': elapsed}
+
+def main(export_excel: bool = True, parquet_dir: str = None):
     """
     Fungsi utama untuk membaca dan menganalisis transkrip
+    Excel bisa dimatikan (paling lambat); parquet_dir mengaktifkan export Parquet
     """
     import os
 
@@ -386,16 +485,7 @@ def main():
     print(f"   > Data mata kuliah: {output_csv}")
     
     # Simpan ringkasan per semester
-    summary_data = []
-    for semester in sorted(analysis['semester_summary'].keys(), 
-                          key=lambda x: (x.split('-')[1], int(x.split('-')[0]))):
-        sem_data = analysis['semester_summary'][semester]
-        summary_data.append({
-            'Semester': semester,
-            'Jumlah_MK': sem_data['courses'],
-            'Total_SKS': sem_data['total_sks'],
-            'IPS': sem_data['ips']
-        })
+    summary_data = build_semester_summary(analysis)
     
     summary_df = pd.DataFrame(summary_data)
     output_summary = os.path.join(output_dir, 'transkrip_ringkasan_semester.csv')
@@ -403,16 +493,7 @@ def main():
     print(f"   > Ringkasan per semester: {output_summary}")
 
     # Simpan ringkasan per tahun
-    year_data = []
-    for year in sorted(analysis['year_summary'].keys()):
-        year_info = analysis['year_summary'][year]
-        year_label = f"20{year.split('/')[0]}/20{year.split('/')[1]}"
-        year_data.append({
-            'Tahun_Akademik': year_label,
-            'Jumlah_MK': year_info['courses'],
-            'Total_SKS': year_info['total_sks'],
-            'IP': year_info['ip']
-        })
+    year_data = build_year_summary(analysis)
 
     year_df = pd.DataFrame(year_data)
     output_year = os.path.join(output_dir, 'transkrip_ringkasan_tahun.csv')
@@ -425,17 +506,27 @@ def main():
     student_df.to_csv(output_student, index=False, encoding='utf-8-sig')
     print(f"   > Informasi mahasiswa: {output_student}")
 
+    # Simpan dataset Parquet (append ke dataset yang sudah ada)
+    if parquet_dir:
+        parquet_writer = open_parquet_writer(parquet_dir)
+        if parquet_writer:
+            parquet_writer.add(student_info, courses, summary_data, year_data, source_file=pdf_path,
+                               calculated_ipk=analysis.get('calculated_ipk'))
+            parquet_writer.close()
+            print(f"   > Dataset Parquet: {parquet_dir}")
+
     # Simpan Excel dengan multiple sheets
-    try:
-        output_excel = os.path.join(output_dir, 'transkrip_lengkap.xlsx')
-        with pd.ExcelWriter(output_excel, engine='openpyxl') as writer:
-            student_df.to_excel(writer, sheet_name='Info Mahasiswa', index=False)
-            df.to_excel(writer, sheet_name='Mata Kuliah', index=False)
-            summary_df.to_excel(writer, sheet_name='Ringkasan Semester', index=False)
-            year_df.to_excel(writer, sheet_name='Ringkasan Tahun', index=False)
-        print(f"   > File Excel lengkap: {output_excel}")
-    except ImportError:
-        print("   [!] openpyxl tidak tersedia, skip pembuatan file Excel")
+    if export_excel:
+        try:
+            output_excel = os.path.join(output_dir, 'transkrip_lengkap.xlsx')
+            with pd.ExcelWriter(output_excel, engine='openpyxl') as writer:
+                student_df.to_excel(writer, sheet_name='Info Mahasiswa', index=False)
+                df.to_excel(writer, sheet_name='Mata Kuliah', index=False)
+                summary_df.to_excel(writer, sheet_name='Ringkasan Semester', index=False)
+                year_df.to_excel(writer, sheet_name='Ringkasan Tahun', index=False)
+            print(f"   > File Excel lengkap: {output_excel}")
+        except ImportError:
+            print("   [!] openpyxl tidak tersedia, skip pembuatan file Excel")
 
     print("\n" + "="*110)
     print("PROSES SELESAI!")
@@ -445,9 +536,34 @@ def main():
     print(f"  - CSV ringkasan per semester")
     print(f"  - CSV ringkasan per tahun")
     print(f"  - CSV informasi mahasiswa")
-    print(f"  - Excel lengkap (jika tersedia)")
+    if parquet_dir:
+        print(f"  - Dataset Parquet")
+    if export_excel:
+        print(f"  - Excel lengkap (jika tersedia)")
     
     return student_info, df, analysis
 
 if __name__ == "__main__":
-    student_info, courses_df, analysis = main()
\ No newline at end of file
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Pembaca transkrip akademik UK Petra")
+    parser.add_argument("--batch", metavar="DIR_ATAU_GLOB",
+                        help="Proses semua PDF di direktori / pola glob ke file CSV gabungan")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Jumlah worker process untuk mode batch (default: jumlah CPU)")
+    parser.add_argument("--output-dir", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'outputs'),
+                        help="Folder output mode batch")
+    parser.add_argument("--parquet", nargs="?", metavar="DATASET_DIR", const="",
+                        help="Export juga ke dataset Parquet (default: <output-dir>/dataset)")
+    parser.add_argument("--no-excel", action="store_true", help="Lewati export Excel (mode file tunggal)")
+    args = parser.parse_args()
+
+    parquet_dir = None
+    if args.parquet is not None:
+        parquet_dir = args.parquet or os.path.join(args.output_dir, 'dataset')
+
+    if args.batch:
+        run_batch(args.batch, args.output_dir, args.workers, parquet_dir=parquet_dir)
+    else:
+        student_info, courses_df, analysis = main(export_excel=not args.no_excel, parquet_dir=parquet_dir)
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+Export hasil parse transkrip ke dataset Parquet (partisi per angkatan)
+
+Struktur dataset:
+    <dataset_dir>/info_mahasiswa/Angkatan=2022/<run_id>-0.parquet
+    <dataset_dir>/mata_kuliah/Angkatan=2022/...
+    <dataset_dir>/ringkasan_semester/...
+    <dataset_dir>/ringkasan_tahun/...
+
+Setiap run menulis file baru (nama file memakai run_id), jadi beberapa run
+otomatis ter-append ke dataset yang sama dan bisa di-query dengan filter
+tanpa memuat semuanya (lihat open_table).
+"""
+import os
+import re
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+GRADE_TYPE = pa.dictionary(pa.int8(), pa.string())
+
+STUDENT_SCHEMA = pa.schema([
+    ('NRP', pa.string()),
+    ('Nama', pa.string()),
+    ('Tempat_Tgl_Lahir', pa.string()),
+    ('Fakultas', pa.string()),
+    ('Program_Studi', pa.string()),
+    ('Program', pa.string()),
+    ('Program_Pendidikan', pa.string()),
+    ('Tahun_Masuk', pa.string()),
+    ('IPK', pa.float64()),
+    ('Total_SKS', pa.int16()),
+    ('Total_MK', pa.int16()),
+    ('IPK_Hitung', pa.float64()),
+    ('File', pa.string()),
+    ('Run_ID', pa.string()),
+    ('Processed_At', pa.timestamp('s')),
+    ('Angkatan', pa.string()),
+])
+
+COURSE_SCHEMA = pa.schema([
+    ('NRP', pa.string()),
+    ('Kode', pa.string()),
+    ('Mata_Kuliah', pa.string()),
+    ('Semester', pa.string()),
+    ('SKS', pa.int8()),
+    ('Nilai', GRADE_TYPE),
+    ('Run_ID', pa.string()),
+    ('Angkatan', pa.string()),
+])
+
+SEMESTER_SCHEMA = pa.schema([
+    ('NRP', pa.string()),
+    ('Semester', pa.string()),
+    ('Jumlah_MK', pa.int16()),
+    ('Total_SKS', pa.int16()),
+    ('IPS', pa.float64()),
+    ('Run_ID', pa.string()),
+    ('Angkatan', pa.string()),
+])
+
+YEAR_SCHEMA = pa.schema([
+    ('NRP', pa.string()),
+    ('Tahun_Akademik', pa.string()),
+    ('Jumlah_MK', pa.int16()),
+    ('Total_SKS', pa.int16()),
+    ('IP', pa.float64()),
+    ('Run_ID', pa.string()),
+    ('Angkatan', pa.string()),
+])
+
+TABLE_SCHEMAS = {
+    'info_mahasiswa': STUDENT_SCHEMA,
+    'mata_kuliah': COURSE_SCHEMA,
+    'ringkasan_semester': SEMESTER_SCHEMA,
+    'ringkasan_tahun': YEAR_SCHEMA,
+}
+
+PARTITIONING = ds.partitioning(pa.schema([('Angkatan', pa.string())]), flavor='hive')
+
+
+def get_angkatan(student_info: Dict) -> str:
+    """Tahun angkatan dari Tahun_Masuk (mis. "1-2022/2023" -> "2022")"""
+    match = re.search(r'(\d{4})/', student_info.get('Tahun_Masuk', '') or '')
+    return match.group(1) if match else 'unknown'
+
+
+class TranscriptParquetWriter:
+    """
+    Penulis dataset Parquet yang mem-buffer baris dan menulis per flush_every mahasiswa
+    """
+
+    def __init__(self, dataset_dir: str, flush_every: int = 500, run_id: Optional[str] = None):
+        self.dataset_dir = dataset_dir
+        self.flush_every = flush_every
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S_') + uuid.uuid4().hex[:6]
+        self._buffers: Dict[str, List[Dict]] = {name: [] for name in TABLE_SCHEMAS}
+        self._students = 0
+        self._flushes = 0
+
+    def add(self, student_info: Dict, courses: List[Dict], semester_summary: List[Dict],
+            year_summary: List[Dict], source_file: str = '', calculated_ipk: Optional[float] = None):
+        """Tambah hasil satu transkrip ke buffer"""
+        nrp = student_info.get('NRP', '')
+        common = {'NRP': nrp, 'Run_ID': self.run_id, 'Angkatan': get_angkatan(student_info)}
+
+        self._buffers['info_mahasiswa'].append({
+            **student_info,
+            **common,
+            'Total_MK': len(courses),
+            'IPK_Hitung': calculated_ipk,
+            'File': source_file,
+            'Processed_At': datetime.now(),
+        })
+        self._buffers['mata_kuliah'].extend({**course, **common} for course in courses)
+        self._buffers['ringkasan_semester'].extend({**row, **common} for row in semester_summary)
+        self._buffers['ringkasan_tahun'].extend({**row, **common} for row in year_summary)
+
+        self._students += 1
+        if self._students % self.flush_every == 0:
+            self.flush()
+
+    def flush(self):
+        """Tulis isi buffer sebagai file Parquet baru di tiap tabel"""
+        for name, rows in self._buffers.items():
+            if not rows:
+                continue
+            schema = TABLE_SCHEMAS[name]
+            table = pa.Table.from_pylist(
+                [{field: row.get(field) for field in schema.names} for row in rows],
+                schema=schema
+            )
+            pq.write_to_dataset(
+                table,
+                root_path=os.path.join(self.dataset_dir, name),
+                partitioning=PARTITIONING,
+                basename_template=f"{self.run_id}-{self._flushes}-{{i}}.parquet",
+                existing_data_behavior='overwrite_or_ignore'
+            )
+            rows.clear()
+        self._flushes += 1
+
+    def close(self):
+        self.flush()
+
+
+def open_table(dataset_dir: str, name: str) -> ds.Dataset:
+    """
+    Buka satu tabel dataset secara lazy untuk query, contoh:
+        open_table('outputs/dataset', 'mata_kuliah').to_table(
+            columns=['NRP', 'Nilai'], filter=ds.field('Angkatan') == '2022')
+    """
+    return ds.dataset(os.path.join(dataset_dir, name), format='parquet',
+                      schema=TABLE_SCHEMAS[name], partitioning=PARTITIONING)